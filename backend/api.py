@@ -1,13 +1,31 @@
 from __future__ import annotations
 
-from typing import List, Union, Optional
+import asyncio
+import json
+import re
+import time
+from typing import Any, Dict, List, Union, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Request
 from fastapi.responses import StreamingResponse
 import logging
 from pydantic import BaseModel
 
-from .cli import run_automate_math_research, _parse_seed_content2
+from .cli import request_proof, run_automate_math_research, run_open_problem_solver, _parse_seed_content2
+from .cli_research import ResearchCancelled
+from .artifacts import digest
+from .budget import run_budget_scope
+from .jobs import (
+    DEFAULT_USER,
+    FINISHED,
+    LANE_INTERACTIVE,
+    SUCCEEDED,
+    JobContext,
+    JobManager,
+    JobRecord,
+    QueueFull,
+    get_job_manager,
+)
 
 
 class ReportRequest(BaseModel):
@@ -20,142 +38,466 @@ class ReportResponse(BaseModel):
     report_markdown: str
 
 
+class ProofRequest(BaseModel):
+    problem: str
+    model: str = "gpt-5"
+
+
+class OpenProblemRequest(BaseModel):
+    problem: str
+    model: str = "gpt-5"
+    search_model: Optional[str] = None
+    max_iterations: int = 15
+    target_results: int = 25
+    portfolio: Optional[List[Dict[str, Any]]] = None
+
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    status: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created: float
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    user: str = DEFAULT_USER
+    lane: str = "research"
+    coalesced: bool = False
+
+
+class QueuePosition(BaseModel):
+    id: str
+    status: str
+    position: int
+    running: int
+    queued: Dict[str, int]
+
+
+def _job_response(record: JobRecord) -> JobResponse:
+    return JobResponse(**{k: v for k, v in record.to_dict().items() if k != "request"})
+
+
 logger = logging.getLogger("backend.api")
 
 router = APIRouter()
 
 
 @router.post("/report", response_model=ReportResponse)
-def generate_report(req: ReportRequest) -> ReportResponse:
+def generate_report(req: ReportRequest, request: Request) -> ReportResponse:
+    """Run a report job and wait for it.
+
+    Identical concurrent requests (and retries within the result cache window) share one
+    job, so a client that timed out and retried gets the same run instead of a new one.
+    """
+    logger.info("/report: received request (model=%s) with seeds length=%s, guideline=%s", req.model, (len(req.seeds) if isinstance(req.seeds, list) else len(req.seeds or "")), bool(req.research_guideline))
+    record = _submit_job("report", req, request)
+    logger.info("/report: %s job %s", "joined" if record.coalesced else "started", record.id)
+    record = job_manager().wait(record.id)
+    if record is None or record.status != SUCCEEDED or not isinstance(record.result, dict):
+        error = (record.error if record is not None else None) or "job did not complete"
+        logger.error("/report: failed: %s", error)
+        raise HTTPException(status_code=500, detail=f"Failed to generate report: {error}")
+    report_markdown = str(record.result.get("report_markdown") or "")
+    logger.info("/report: completed report generation (length=%d)", len(report_markdown))
+    return ReportResponse(report_markdown=report_markdown)
+
+
+def _run_report_stream_job(request: Dict[str, Any], ctx: JobContext) -> Dict[str, Any]:
+    """The /report/stream pipeline; progress goes to the job's event log via ctx.emit.
+
+    Runs under the run budget configured in the environment, like the CLI pipeline.
+    """
+    with run_budget_scope():
+        return _stream_report(request, ctx)
+
+
+def _stream_report(request: Dict[str, Any], ctx: JobContext) -> Dict[str, Any]:
+    req = ReportRequest.model_validate(request)
+    emit = ctx.emit
+
+    def _check_cancelled() -> None:
+        if ctx.cancel_event.is_set():
+            raise ResearchCancelled("Report job cancelled")
+
     try:
-        logger.info("/report: received request (model=%s) with seeds length=%s, guideline=%s", req.model, (len(req.seeds) if isinstance(req.seeds, list) else len(req.seeds or "")), bool(req.research_guideline))
-        # Normalize seeds to match CLI behavior (accept raw string or bracketed multi-seed text)
-        normalized_seeds: Union[str, List[str]]
-        if isinstance(req.seeds, str):
-            normalized_seeds = _parse_seed_content2(req.seeds)
-        else:
-            normalized_seeds = req.seeds
-
-        logger.info("/report: normalized seeds -> %s item(s)", (1 if isinstance(normalized_seeds, str) else len(normalized_seeds)))
-        _results, report_markdown = run_automate_math_research(
-            seed_result=normalized_seeds,
-            model=req.model,
+        logger.info("/report/stream: start (job %s)", ctx.job_id)
+        seeds = _normalize_seeds(req.seeds)
+        emit({"phase": "start", "model": req.model})
+        from .research import ResearchPipeline, ResearchConfig
+        def _map_model(name: str, *, has_tools: bool = False, is_prover: bool = False) -> str:
+            if name == "gpt-oss-120b":
+                if is_prover:
+                    return "openai/gpt-oss-120b"
+                return "o4-mini" if has_tools else "openai/gpt-oss-120b"
+            return name
+
+        cfg = ResearchConfig(
+            lit_model=_map_model(req.model, has_tools=True),
+            predict_model=_map_model(req.model, has_tools=True),
+            prove_model=_map_model(req.model, has_tools=True),
+            reporter_model=("o4-mini" if req.model == "gpt-oss-120b" else _map_model(req.model, has_tools=False)),
+            novelty_model=_map_model(req.model, has_tools=True),
             research_guideline=req.research_guideline,
         )
-        logger.info("/report: completed report generation (length=%d)", len(report_markdown or ""))
-        return ReportResponse(report_markdown=report_markdown)
-    except Exception as e:  # pragma: no cover
-        logger.exception("/report: failed: %s", e)
-        raise HTTPException(status_code=500, detail=f"Failed to generate report: {type(e).__name__}: {e}")
+        pipe = ResearchPipeline(cfg)
+        emit({"phase": "literature_review", "status": "begin"})
+        lit = pipe.literature_review(seeds)
+        emit({"phase": "literature_review", "status": "done", "count": len(lit.results)})
+        _check_cancelled()
+
+        emit({"phase": "prediction", "status": "begin"})
+        preds = pipe.predict(lit)
+        pred_list = list(getattr(preds, "predicted_results", []) or [])
+        pred_count = len(pred_list)
+        emit({"phase": "prediction", "status": "done", "count": pred_count, "predictions": pred_list})
+        _check_cancelled()
+
+        emit({"phase": "novelty", "status": "begin"})
+        kept = pipe.novelty_filter(lit, preds)
+        emit({"phase": "novelty", "status": "done", "kept": len(kept), "total": pred_count, "statements": kept})
+        _check_cancelled()
+
+        # Proving and post-proof work (refine, tighten, judges) are separate pipelined
+        # stages: a slow tighten never delays another proof's events or its refinement
+        from .judge import Judge
+        from .result_refiner import ResultRefiner
+        from .solver import Solver
+        from .task_graph import Stage, TaskGraph
+        emit({"phase": "proving", "status": "begin", "candidates": len(kept)})
+        results: list[tuple[str, str]] = []
+
+        def _prove_one(stmt: str) -> tuple[bool, str]:
+            sol = Solver(model=req.model, prover_effort=cfg.prover_effort, judge_effort=cfg.judge_effort)
+            ok, payload = sol.solve(stmt, 8, lit, ctx.cancel_event)
+            if not ctx.cancel_event.is_set():
+                emit({"phase": "proving", "status": "proved" if ok else "failed", "statement": stmt})
+            return ok, payload
+
+        def _after_prove(stmt: str, res: tuple[bool, str]):
+            ok, payload = res
+            return [("post", (stmt, payload))] if ok and not ctx.cancel_event.is_set() else []
+
+        def _prove_failed(stmt: str, exc: BaseException):
+            logger.warning("/report/stream: prover raised: %s", exc)
+            emit({"phase": "proving", "status": "failed", "statement": stmt})
+            return []
+
+        def _confirm(stmt: str, proof: str) -> None:
+            # Second independent judge confirmation
+            try:
+                if Judge(model=_map_model(req.model, has_tools=True)).assess(stmt, proof).correctness:
+                    emit({"phase": "proving", "status": "accepted_both", "statement": stmt})
+            except Exception:
+                pass
+
+        def _post_one(item: tuple[str, str]) -> tuple[str, str]:
+            stmt, payload = item
+            ref = ResultRefiner(model=_map_model(req.model, has_tools=False), effort_policy=cfg.refiner_effort)
+            try:
+                r = ref.refine(stmt, payload)
+            except Exception:
+                r = None
+            base_stmt, base_proof = r if r is not None else (stmt, payload)
+            try:
+                t = ref.tighten(base_stmt, base_proof)
+                if t is not None:
+                    t_stmt, t_proof = t
+                    if Judge(model=_map_model(req.model, has_tools=True)).assess(t_stmt, t_proof).correctness:
+                        emit({"phase": "proving", "status": "accepted", "tightened": True, "statement": t_stmt})
+                        _confirm(t_stmt, t_proof)
+                        return t_stmt, t_proof
+            except Exception:
+                pass
+            emit({"phase": "proving", "status": "accepted", "tightened": False, "statement": base_stmt})
+            _confirm(base_stmt, base_proof)
+            return base_stmt, base_proof
+
+        def _after_post(_item: tuple[str, str], res: tuple[str, str]):
+            results.append(res)
+            return []
+
+        graph = TaskGraph(
+            [
+                Stage("prove", _prove_one, workers=cfg.prove_workers, then=_after_prove, on_error=_prove_failed),
+                Stage("post", _post_one, workers=cfg.refine_workers, then=_after_post),
+            ],
+            cancel_event=ctx.cancel_event,
+        )
+        graph.run([("prove", s) for s in kept])
+        _check_cancelled()
+
+        emit({"phase": "report", "status": "begin", "count": len(results)})
+        report = pipe.compile_final_report(lit, results)
+        emit({"phase": "report", "status": "done"})
+        emit({"phase": "complete", "report_markdown": report.report_markdown})
+        return {
+            "report_markdown": report.report_markdown,
+            "results": [{"statement": s, "proof_markdown": p} for s, p in results],
+        }
+    except ResearchCancelled:
+        # Not an error: the job manager records the cancellation in the log
+        raise
+    except Exception as e:
+        emit({"phase": "error", "error": f"{type(e).__name__}: {e}"})
+        raise
+
+
+async def _tail_events(job_id: str, after: int, *, poll_seconds: float = 0.25, keepalive_seconds: float = 15.0):
+    """Yield (seq, event) from the job's log after `after`, then follow it until the job ends.
+
+    Yields None as a keep-alive when nothing arrived for keepalive_seconds. The job store
+    is SQLite, so every read runs on a worker thread and never blocks the event loop;
+    between reads observers only hold an asyncio sleep, not a thread.
+    """
+    manager = job_manager()
+    idle_since = time.monotonic()
+    while True:
+        if await asyncio.to_thread(manager.latest_event_id, job_id) > after:
+            for seq, event in await asyncio.to_thread(manager.events, job_id, after=after):
+                after = seq
+                yield seq, event
+                if event.get("phase") == "job" and event.get("status") in FINISHED:
+                    return
+            idle_since = time.monotonic()
+            continue
+        if time.monotonic() - idle_since >= keepalive_seconds:
+            record = await asyncio.to_thread(manager.get, job_id)
+            if record is None or (
+                record.status in FINISHED and await asyncio.to_thread(manager.latest_event_id, job_id) <= after
+            ):
+                return
+            idle_since = time.monotonic()
+            yield None
+        await asyncio.sleep(poll_seconds)
 
 
 @router.post("/report/stream")
-def generate_report_stream(req: ReportRequest) -> StreamingResponse:
-    import json, time
-
-    def _iter():
-        try:
-            logger.info("/report/stream: start")
-            seeds = _parse_seed_content2(req.seeds) if isinstance(req.seeds, str) else req.seeds
-            yield json.dumps({"phase": "start", "model": req.model}) + "\n"
-            from .research import ResearchPipeline, ResearchConfig
-            from .cli import _append_correct_result_json  # reuse util if desired
-            def _map_model(name: str, *, has_tools: bool = False, is_prover: bool = False) -> str:
-                if name == "gpt-oss-120b":
-                    if is_prover:
-                        return "openai/gpt-oss-120b"
-                    return "o4-mini" if has_tools else "openai/gpt-oss-120b"
-                return name
-
-            cfg = ResearchConfig(
-                lit_model=_map_model(req.model, has_tools=True),
-                predict_model=_map_model(req.model, has_tools=True),
-                prove_model=_map_model(req.model, has_tools=True),
-                reporter_model=("o4-mini" if req.model == "gpt-oss-120b" else _map_model(req.model, has_tools=False)),
-                novelty_model=_map_model(req.model, has_tools=True),
-                research_guideline=req.research_guideline,
-            )
-            pipe = ResearchPipeline(cfg)
-            yield json.dumps({"phase": "literature_review", "status": "begin"}) + "\n"
-            lit = pipe.literature_review(seeds)
-            yield json.dumps({"phase": "literature_review", "status": "done", "count": len(lit.results)}) + "\n"
-
-            yield json.dumps({"phase": "prediction", "status": "begin"}) + "\n"
-            preds = pipe.predict(lit)
-            pred_list = list(getattr(preds, "predicted_results", []) or [])
-            pred_count = len(pred_list)
-            yield json.dumps({"phase": "prediction", "status": "done", "count": pred_count, "predictions": pred_list}) + "\n"
-
-            yield json.dumps({"phase": "novelty", "status": "begin"}) + "\n"
-            kept = pipe.novelty_filter(lit, preds)
-            yield json.dumps({"phase": "novelty", "status": "done", "kept": len(kept), "total": pred_count, "statements": kept}) + "\n"
-
-            # Prove and refine/tighten inline with progress updates
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            yield json.dumps({"phase": "proving", "status": "begin", "candidates": len(kept)}) + "\n"
-            results: list[tuple[str, str]] = []
-            def _prove_one(s: str):
-                from .solver import Solver
-                sol = Solver(model=req.model)
-                return s, sol.solve(s, 8, lit)
-            with ThreadPoolExecutor(max_workers=12) as ex:
-                futs = {ex.submit(_prove_one, s): s for s in kept}
-                for fut in as_completed(futs):
-                    stmt, (ok, payload) = fut.result()
-                    if not ok:
-                        yield json.dumps({"phase": "proving", "status": "failed", "statement": stmt}) + "\n"
-                        continue
-                    yield json.dumps({"phase": "proving", "status": "proved", "statement": stmt}) + "\n"
-                    # Refine/tighten/judge sequentially here but per-item (already parallel per future)
-                    from .result_refiner import ResultRefiner
-                    from .judge import Judge
-                    ref = ResultRefiner(model=_map_model(req.model, has_tools=False), reasoning_effort="medium")
-                    try:
-                        r = ref.refine(stmt, payload)
-                    except Exception:
-                        r = None
-                    if r is not None:
-                        base_stmt, base_proof = r
-                    else:
-                        base_stmt, base_proof = stmt, payload
-                    try:
-                        t = ref.tighten(base_stmt, base_proof)
-                        if t is not None:
-                            t_stmt, t_proof = t
-                            j = Judge(model=_map_model(req.model, has_tools=True))
-                            jres = j.assess(t_stmt, t_proof)
-                            if jres.correctness:
-                                results.append((t_stmt, t_proof))
-                                yield json.dumps({"phase": "proving", "status": "accepted", "tightened": True, "statement": t_stmt}) + "\n"
-                                # Second independent judge confirmation
-                                try:
-                                    j2 = Judge(model=_map_model(req.model, has_tools=True))
-                                    j2res = j2.assess(t_stmt, t_proof)
-                                    if j2res.correctness:
-                                        yield json.dumps({"phase": "proving", "status": "accepted_both", "statement": t_stmt}) + "\n"
-                                except Exception:
-                                    pass
-                                continue
-                    except Exception:
-                        pass
-                    results.append((base_stmt, base_proof))
-                    yield json.dumps({"phase": "proving", "status": "accepted", "tightened": False, "statement": base_stmt}) + "\n"
-                    # Second independent judge confirmation
-                    try:
-                        j2 = Judge(model=_map_model(req.model, has_tools=True))
-                        j2res = j2.assess(base_stmt, base_proof)
-                        if j2res.correctness:
-                            yield json.dumps({"phase": "proving", "status": "accepted_both", "statement": base_stmt}) + "\n"
-                    except Exception:
-                        pass
-
-            yield json.dumps({"phase": "report", "status": "begin", "count": len(results)}) + "\n"
-            report = pipe.compile_final_report(lit, results)
-            yield json.dumps({"phase": "report", "status": "done"}) + "\n"
-            yield json.dumps({"phase": "complete", "report_markdown": report.report_markdown}) + "\n"
-        except Exception as e:
-            yield json.dumps({"phase": "error", "error": f"{type(e).__name__}: {e}"}) + "\n"
-
-    return StreamingResponse(_iter(), media_type="application/x-ndjson")
+def generate_report_stream(req: ReportRequest, request: Request) -> StreamingResponse:
+    """Run a report job and stream its progress as NDJSON.
+
+    The pipeline runs as a background job (id in the X-Job-Id header), so a dropped
+    connection loses nothing: reattach with GET /jobs/{id}/events.
+    """
+    record = _submit_job("report_stream", req, request)
+
+    async def _iter():
+        async for item in _tail_events(record.id, 0):
+            if item is not None:
+                yield json.dumps(item[1]) + "\n"
+
+    return StreamingResponse(
+        _iter(),
+        media_type="application/x-ndjson",
+        headers={"X-Job-Id": record.id, "X-Job-Coalesced": "1" if record.coalesced else "0"},
+    )
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    after: int = 0,
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+) -> StreamingResponse:
+    """Server-sent events for a job: replay everything after Last-Event-ID (or ?after=), then follow live."""
+    if await asyncio.to_thread(job_manager().get, job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    try:
+        start = int(last_event_id) if last_event_id else int(after)
+    except ValueError:
+        start = int(after)
+
+    async def _iter():
+        yield "retry: 3000\n\n"
+        async for item in _tail_events(job_id, start):
+            if item is None:
+                yield ": keep-alive\n\n"
+                continue
+            seq, event = item
+            yield f"id: {seq}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        _iter(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _normalize_seeds(seeds: Union[str, List[str]]) -> Union[str, List[str]]:
+    # Accept raw string or bracketed multi-seed text, as the CLI does
+    return _parse_seed_content2(seeds) if isinstance(seeds, str) else seeds
+
+
+def _run_report_job(request: Dict[str, Any], ctx: JobContext) -> Dict[str, Any]:
+    req = ReportRequest.model_validate(request)
+    # Stage outputs live in the job's run directory, so a job resumed after a restart
+    # skips whatever it had already finished
+    with run_budget_scope():
+        results, report_markdown = run_automate_math_research(
+            seed_result=_normalize_seeds(req.seeds),
+            model=req.model,
+            research_guideline=req.research_guideline,
+            run_dir=str(ctx.run_dir),
+            cancel_event=ctx.cancel_event,
+        )
+    return {
+        "report_markdown": report_markdown,
+        "results": [{"statement": s, "proof_markdown": p} for s, p in results],
+    }
+
+
+def job_manager() -> JobManager:
+    manager = get_job_manager()
+    manager.register("report", _run_report_job)
+    manager.register("report_stream", _run_report_stream_job)
+    manager.register("proof", _run_proof_job, lane=LANE_INTERACTIVE)
+    manager.register("open_problem", _run_open_problem_job, lane=LANE_INTERACTIVE)
+    return manager
+
+
+def _request_user(request: Request) -> str:
+    """Fair-share identity: the X-User-Id header, else the client address."""
+    user = (request.headers.get("X-User-Id") or "").strip()
+    if not user and request.client is not None:
+        user = request.client.host
+    return user or DEFAULT_USER
+
+
+def _normalize_text(text: Optional[str]) -> str:
+    return re.sub(r"\s+", " ", text or "").strip()
+
+
+def request_fingerprint(kind: str, req: BaseModel) -> str:
+    """Key under which identical requests of one job kind share one job.
+
+    Whitespace differences and seed order do not change a report request's key. The
+    job kind is part of the key: a /report/stream job emits progress events that a
+    /jobs report job does not, so the two never join each other.
+    """
+    if isinstance(req, ReportRequest):
+        seeds = _normalize_seeds(req.seeds)
+        seed_list = [seeds] if isinstance(seeds, str) else list(seeds)
+        return digest(
+            [
+                kind,
+                sorted(_normalize_text(s) for s in seed_list if _normalize_text(s)),
+                req.model,
+                _normalize_text(req.research_guideline),
+            ]
+        )
+    if isinstance(req, ProofRequest):
+        return digest([kind, _normalize_text(req.problem), req.model])
+    if isinstance(req, OpenProblemRequest):
+        return digest([kind, _normalize_text(req.problem), req.model_dump(exclude={"problem"})])
+    return digest([kind, type(req).__name__, req.model_dump()])
+
+
+def _submit_job(kind: str, req: BaseModel, request: Request) -> JobRecord:
+    try:
+        return job_manager().submit(
+            kind, req.model_dump(), user=_request_user(request), fingerprint=request_fingerprint(kind, req)
+        )
+    except QueueFull as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(int(e.retry_after))},
+        )
+
+
+def _run_proof_job(request: Dict[str, Any], ctx: JobContext) -> Dict[str, Any]:
+    req = ProofRequest.model_validate(request)
+    ok, text = request_proof(req.problem, model=req.model, cancel_event=ctx.cancel_event)
+    return {"ok": ok, "proof_markdown": text}
+
+
+def _run_open_problem_job(request: Dict[str, Any], ctx: JobContext) -> Dict[str, Any]:
+    """Literature collection plus racing solver pairs; every pair's iterations land in the event log."""
+    req = OpenProblemRequest.model_validate(request)
+    result = run_open_problem_solver(req.model_dump(exclude_none=True), on_event=ctx.emit, cancel_event=ctx.cancel_event)
+    if result.get("status") == "error":
+        ctx.emit({"phase": "error", "error": result.get("message")})
+        raise RuntimeError(str(result.get("message") or "Open problem solver failed"))
+    ctx.emit({"phase": "complete", "status": result.get("status")})
+    return result
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+def submit_report_job(req: ReportRequest, request: Request) -> JobResponse:
+    """Start a research report in the background and return its job id right away."""
+    record = _submit_job("report", req, request)
+    logger.info("/jobs: queued report job %s (model=%s)", record.id, req.model)
+    return _job_response(record)
+
+
+@router.post("/proof", response_model=JobResponse, status_code=202)
+def submit_proof_job(req: ProofRequest, request: Request) -> JobResponse:
+    """Prove a single problem as an interactive job; it starts ahead of queued research jobs."""
+    record = _submit_job("proof", req, request)
+    logger.info("/proof: queued proof job %s (model=%s)", record.id, req.model)
+    return _job_response(record)
+
+
+@router.post("/open-problem", response_model=JobResponse, status_code=202)
+def submit_open_problem_job(req: OpenProblemRequest, request: Request) -> JobResponse:
+    """Attack an open problem as a background job.
+
+    Follow it with GET /jobs/{id}/events (literature, per-pair proof and judge events)
+    and abort it with DELETE /jobs/{id}.
+    """
+    record = _submit_job("open_problem", req, request)
+    logger.info("/open-problem: queued job %s (model=%s)", record.id, req.model)
+    return _job_response(record)
+
+
+@router.post("/open-problem/stream")
+def stream_open_problem(req: OpenProblemRequest, request: Request) -> StreamingResponse:
+    """Run an open-problem job and stream its events as NDJSON (job id in X-Job-Id)."""
+    record = _submit_job("open_problem", req, request)
+
+    async def _iter():
+        async for item in _tail_events(record.id, 0):
+            if item is not None:
+                yield json.dumps(item[1]) + "\n"
+
+    return StreamingResponse(
+        _iter(),
+        media_type="application/x-ndjson",
+        headers={"X-Job-Id": record.id, "X-Job-Coalesced": "1" if record.coalesced else "0"},
+    )
+
+
+@router.get("/jobs/{job_id}/position", response_model=QueuePosition)
+def get_job_position(job_id: str) -> QueuePosition:
+    """Where a queued job stands: 1 means it starts next; 0 means it is no longer waiting."""
+    manager = job_manager()
+    record = manager.get(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    stats = manager.stats()
+    return QueuePosition(
+        id=job_id,
+        status=record.status,
+        position=manager.position(job_id) or 0,
+        running=stats["running"],
+        queued=stats["queued"],
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str) -> JobResponse:
+    record = job_manager().get(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return _job_response(record)
 
 
+@router.delete("/jobs/{job_id}", response_model=JobResponse)
+def cancel_job(job_id: str) -> JobResponse:
+    """Request cancellation; running jobs stop at their next checkpoint."""
+    record = job_manager().cancel(job_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    logger.info("/jobs: cancel requested for %s (status=%s)", job_id, record.status)
+    return _job_response(record)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+
+logger = logging.getLogger("backend.artifacts")
+
+T = TypeVar("T")
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    return value
+
+
+def digest(value: Any, *, exclude: Iterable[str] = ()) -> str:
+    """Stable sha256 of a JSON-able value (pydantic models and dataclasses included)."""
+    plain = _plain(value)
+    skip = set(exclude)
+    if skip and isinstance(plain, dict):
+        plain = {k: v for k, v in plain.items() if k not in skip}
+    return hashlib.sha256(json.dumps(plain, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+
+class ArtifactStore:
+    """Per-run directory of stage outputs keyed by a hash of each stage's inputs.
+
+    Layout: <run_dir>/<stage>/<key>.json, each holding {stage, key, created, value}. Writes
+    are atomic, so a run killed mid-stage leaves either a complete artifact or none, and a
+    resumed run recomputes exactly the work that never finished.
+    """
+
+    def __init__(self, run_dir: str | os.PathLike[str]) -> None:
+        self.run_dir = Path(run_dir).expanduser().resolve()
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def _path(self, stage: str, inputs: Any) -> Path:
+        return self.run_dir / stage / f"{digest([stage, inputs])[:32]}.json"
+
+    def load(self, stage: str, inputs: Any) -> Optional[Any]:
+        path = self._path(stage, inputs)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("[Artifacts] Ignoring unreadable artifact %s: %s", path, e)
+            return None
+        return payload.get("value")
+
+    def save(self, stage: str, inputs: Any, value: Any) -> None:
+        path = self._path(stage, inputs)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"stage": stage, "key": path.stem, "created": time.time(), "value": _plain(value)}
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{id(payload)}.tmp")
+        tmp.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def cached(
+        self,
+        stage: str,
+        inputs: Any,
+        compute: Callable[[], T],
+        *,
+        model: Optional[Type[BaseModel]] = None,
+        decode: Optional[Callable[[Any], T]] = None,
+        store_if: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        """Return the stored output for (stage, inputs), computing and storing it on a miss.
+
+        A computed value for which `store_if` returns False is returned without being stored.
+        """
+        stored = self.load(stage, inputs)
+        if stored is not None:
+            try:
+                value = model.model_validate(stored) if model is not None else (decode(stored) if decode else stored)
+            except Exception as e:
+                logger.warning("[Artifacts] Recomputing %s: stored artifact is invalid (%s)", stage, e)
+            else:
+                with self._lock:
+                    self.hits[stage] = self.hits.get(stage, 0) + 1
+                return value  # type: ignore[return-value]
+        value = compute()
+        if store_if is None or store_if(value):
+            try:
+                self.save(stage, inputs, value)
+            except Exception as e:
+                logger.warning("[Artifacts] Failed to save %s artifact: %s", stage, e)
+        with self._lock:
+            self.misses[stage] = self.misses.get(stage, 0) + 1
+        return value
+
+    def summary(self) -> str:
+        stages = sorted(set(self.hits) | set(self.misses))
+        return ", ".join(f"{s}: reused={self.hits.get(s, 0)} computed={self.misses.get(s, 0)}" for s in stages)
+
+
+__all__ = ["ArtifactStore", "digest"]
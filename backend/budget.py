@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import Lock
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger("backend.budget")
+
+T = TypeVar("T")
+
+# Degradation stages, in the order a run enters them as its budget runs low
+STAGE_NORMAL = "normal"
+STAGE_SKIP_TIGHTEN = "skip_tighten"
+STAGE_LOWER_EFFORT = "lower_effort"
+STAGE_NO_NEW_PROOFS = "no_new_proofs"
+STAGE_EXHAUSTED = "exhausted"
+_STAGES = (STAGE_NORMAL, STAGE_SKIP_TIGHTEN, STAGE_LOWER_EFFORT, STAGE_NO_NEW_PROOFS, STAGE_EXHAUSTED)
+
+# USD per 1M (input, output) tokens; unknown models are charged at the default entry
+DEFAULT_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-5": (1.25, 10.0),
+    "gpt-5-mini": (0.25, 2.0),
+    "o4-mini": (1.1, 4.4),
+    "openai/gpt-oss-120b": (0.15, 0.75),
+    "gemini-2.5-pro": (1.25, 10.0),
+    "default": (1.25, 10.0),
+}
+
+
+@dataclass
+class RunBudget:
+    """Overall wall-clock, token and cost ceiling for one research run.
+
+    The run's spend is the largest used fraction across the configured limits. As it
+    crosses each threshold the run degrades one stage further: skip tightening, then
+    cap reasoning effort at "low", then stop starting new proof attempts, and finally
+    stop all optional work. The final report is always produced, and skipped work is
+    recorded so the report can say what was left out.
+    """
+
+    deadline_seconds: Optional[float] = None
+    max_tokens: Optional[int] = None
+    max_cost: Optional[float] = None
+    skip_tighten_at: float = 0.6
+    lower_effort_at: float = 0.75
+    stop_new_proofs_at: float = 0.9
+    prices: Dict[str, Tuple[float, float]] = field(default_factory=lambda: dict(DEFAULT_PRICES))
+    started_at: float = field(default_factory=time.monotonic)
+    tokens: int = 0
+    cost: float = 0.0
+    skipped: Dict[str, int] = field(default_factory=dict)
+    _stage: str = field(default=STAGE_NORMAL, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    @classmethod
+    def from_env(cls) -> Optional["RunBudget"]:
+        """Budget from DEEPRESEARCH_DEADLINE_SECONDS / _MAX_TOKENS / _MAX_COST; None when unset."""
+
+        def _num(name: str) -> Optional[float]:
+            raw = (os.getenv(name) or "").strip()
+            try:
+                return float(raw) if raw else None
+            except ValueError:
+                logger.warning("Ignoring invalid %s=%r", name, raw)
+                return None
+
+        deadline = _num("DEEPRESEARCH_DEADLINE_SECONDS")
+        tokens = _num("DEEPRESEARCH_MAX_TOKENS")
+        cost = _num("DEEPRESEARCH_MAX_COST")
+        if deadline is None and tokens is None and cost is None:
+            return None
+        return cls(deadline_seconds=deadline, max_tokens=int(tokens) if tokens is not None else None, max_cost=cost)
+
+    def record(self, model: str, input_tokens: int, output_tokens: int) -> None:
+        price_in, price_out = self.prices.get(model) or self.prices.get("default", (0.0, 0.0))
+        with self._lock:
+            self.tokens += int(input_tokens) + int(output_tokens)
+            self.cost += (input_tokens * price_in + output_tokens * price_out) / 1_000_000.0
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining_seconds(self) -> Optional[float]:
+        if self.deadline_seconds is None:
+            return None
+        return max(0.0, self.deadline_seconds - self.elapsed())
+
+    def used_fraction(self) -> float:
+        fractions = [0.0]
+        if self.deadline_seconds:
+            fractions.append(self.elapsed() / self.deadline_seconds)
+        if self.max_tokens:
+            fractions.append(self.tokens / self.max_tokens)
+        if self.max_cost:
+            fractions.append(self.cost / self.max_cost)
+        return max(fractions)
+
+    def stage(self) -> str:
+        """Current degradation stage; stages only ever move forward."""
+        used = self.used_fraction()
+        if used >= 1.0:
+            stage = STAGE_EXHAUSTED
+        elif used >= self.stop_new_proofs_at:
+            stage = STAGE_NO_NEW_PROOFS
+        elif used >= self.lower_effort_at:
+            stage = STAGE_LOWER_EFFORT
+        elif used >= self.skip_tighten_at:
+            stage = STAGE_SKIP_TIGHTEN
+        else:
+            stage = STAGE_NORMAL
+        with self._lock:
+            if _STAGES.index(stage) > _STAGES.index(self._stage):
+                logger.warning(
+                    "[RunBudget] %s -> %s (used %.0f%%: %.0fs, %d tokens, $%.2f)",
+                    self._stage,
+                    stage,
+                    100 * used,
+                    self.elapsed(),
+                    self.tokens,
+                    self.cost,
+                )
+                self._stage = stage
+            return self._stage
+
+    def at_least(self, stage: str) -> bool:
+        return _STAGES.index(self.stage()) >= _STAGES.index(stage)
+
+    def allows(self, action: str) -> bool:
+        """Whether optional work may start: "tighten", "proof" (a new proof attempt) or "iteration"."""
+        threshold = {
+            "tighten": STAGE_SKIP_TIGHTEN,
+            "proof": STAGE_NO_NEW_PROOFS,
+            "iteration": STAGE_EXHAUSTED,
+        }.get(action, STAGE_EXHAUSTED)
+        return not self.at_least(threshold)
+
+    def cap_effort(self, effort: Optional[str]) -> Optional[str]:
+        if effort and effort not in {"minimal", "low"} and self.at_least(STAGE_LOWER_EFFORT):
+            return "low"
+        return effort
+
+    def note_skip(self, what: str, count: int = 1) -> None:
+        with self._lock:
+            self.skipped[what] = self.skipped.get(what, 0) + count
+
+    def summary_markdown(self) -> str:
+        """Report section describing the budget and what was skipped to stay within it."""
+        limits: List[str] = []
+        if self.deadline_seconds:
+            limits.append(f"deadline {self.deadline_seconds / 60:.0f} min")
+        if self.max_tokens:
+            limits.append(f"{self.max_tokens:,} tokens")
+        if self.max_cost:
+            limits.append(f"${self.max_cost:.2f}")
+        lines = [
+            "## Run budget",
+            "",
+            f"- Limits: {', '.join(limits) or 'none'}",
+            f"- Used: {self.elapsed() / 60:.1f} min, {self.tokens:,} tokens, about ${self.cost:.2f}",
+            f"- Final degradation stage: {self.stage().replace('_', ' ')}",
+        ]
+        if self.skipped:
+            lines.append("- Skipped to stay within budget:")
+            lines.extend(f"  - {what}: {n}" for what, n in sorted(self.skipped.items()))
+        else:
+            lines.append("- Nothing was skipped.")
+        return "\n".join(lines) + "\n"
+
+
+# Per run, not per process: concurrent API jobs each see their own budget. Context variables
+# do not follow work onto pool threads, so fan-out code wraps its tasks in with_run_budget.
+_ACTIVE_BUDGET: ContextVar[Optional[RunBudget]] = ContextVar("run_budget", default=None)
+
+
+def activate_run_budget(budget: Optional[RunBudget]) -> Optional[RunBudget]:
+    """Make `budget` the run budget of the current context; returns the previous one."""
+    previous = _ACTIVE_BUDGET.get()
+    _ACTIVE_BUDGET.set(budget)
+    return previous
+
+
+def current_run_budget() -> Optional[RunBudget]:
+    return _ACTIVE_BUDGET.get()
+
+
+def with_run_budget(fn: Callable[..., T]) -> Callable[..., T]:
+    """Bind the caller's run budget to `fn`, for calls made on pool or helper threads."""
+    budget = _ACTIVE_BUDGET.get()
+    if budget is None:
+        return fn
+
+    @wraps(fn)
+    def _bound(*args, **kwargs) -> T:
+        token = _ACTIVE_BUDGET.set(budget)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _ACTIVE_BUDGET.reset(token)
+
+    return _bound
+
+
+@contextmanager
+def run_budget_scope() -> Iterator[Optional[RunBudget]]:
+    """Activate the budget configured in the environment (if any) for the duration of a run.
+
+    Inside an active budget the scope reuses it, so a run started by a job that already
+    opened one is limited and reported as a whole.
+    """
+    active = _ACTIVE_BUDGET.get()
+    if active is not None:
+        yield active
+        return
+    budget = RunBudget.from_env()
+    if budget is None:
+        yield None
+        return
+    token = _ACTIVE_BUDGET.set(budget)
+    try:
+        yield budget
+    finally:
+        _ACTIVE_BUDGET.reset(token)
+
+
+def record_llm_usage(model: str, input_tokens: int, output_tokens: int) -> None:
+    budget = _ACTIVE_BUDGET.get()
+    if budget is not None and (input_tokens or output_tokens):
+        budget.record(model, input_tokens, output_tokens)
+
+
+def budget_effort(effort: Optional[str]) -> Optional[str]:
+    """Reasoning effort to actually request under the active run budget."""
+    budget = _ACTIVE_BUDGET.get()
+    return budget.cap_effort(effort) if budget is not None else effort
+
+
+__all__ = [
+    "RunBudget",
+    "activate_run_budget",
+    "current_run_budget",
+    "run_budget_scope",
+    "with_run_budget",
+    "record_llm_usage",
+    "budget_effort",
+]
@@ -24,6 +24,73 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         default="gpt-5",
         help="Model name (default: gpt-5)",
     )
+    parser.add_argument(
+        "--race",
+        action="store_true",
+        help=(
+            "Return as soon as one prover/judge pair succeeds and cancel the others "
+            "(instead of waiting for every pair so that all logs are complete)."
+        ),
+    )
+    parser.add_argument(
+        "--stagger-seconds",
+        dest="stagger_seconds",
+        type=float,
+        default=None,
+        help=(
+            "With --race, start one pair first and launch each extra pair only if no pair has "
+            "succeeded within this many seconds."
+        ),
+    )
+    parser.add_argument(
+        "--lit-index",
+        dest="lit_index",
+        default=None,
+        help=(
+            "Path to a persistent SQLite literature index shared across runs. Seeds with enough "
+            "indexed sources skip the web literature review (env: DEEPRESEARCH_LIT_INDEX)."
+        ),
+    )
+    parser.add_argument(
+        "--work-queue",
+        dest="work_queue",
+        default=None,
+        help=(
+            "Path to a shared SQLite work queue. Research proofs are published there and run by "
+            "`python -m backend.worker --queue PATH` processes (env: DEEPRESEARCH_WORK_QUEUE)."
+        ),
+    )
+    parser.add_argument(
+        "--deadline-minutes",
+        dest="deadline_minutes",
+        type=float,
+        default=None,
+        help="Wall-clock budget for a research or paper run; work degrades as it runs low.",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        dest="max_tokens",
+        type=int,
+        default=None,
+        help="Token budget for a research or paper run.",
+    )
+    parser.add_argument(
+        "--max-cost",
+        dest="max_cost",
+        type=float,
+        default=None,
+        help="Approximate cost budget in USD for a research or paper run.",
+    )
+    parser.add_argument(
+        "--resume",
+        dest="resume_dir",
+        default=None,
+        metavar="RUN_DIR",
+        help=(
+            "With --research, store stage artifacts in RUN_DIR and reuse any that a previous "
+            "run on the same directory already completed (created if missing)."
+        ),
+    )
     parser.add_argument(
         "--research",
         action="store_true",
@@ -6,6 +6,9 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from .result_store import load_results, open_result_store
+from .budget import run_budget_scope, with_run_budget
+
 
 def setup_provider_flags(args) -> Optional[int]:
     """Apply provider-specific environment and defaults.
@@ -31,6 +34,29 @@ def setup_provider_flags(args) -> Optional[int]:
     return None
 
 
+def setup_solver_flags(args) -> Optional[int]:
+    """Expose solver scheduling and literature index flags to the pipelines via the environment."""
+    if args.stagger_seconds is not None and not args.race:
+        print("Error: --stagger-seconds requires --race.", file=sys.stderr)
+        return 2
+    if args.race:
+        os.environ["DEEPRESEARCH_SOLVER_RACE"] = "1"
+    if args.stagger_seconds is not None:
+        os.environ["DEEPRESEARCH_SOLVER_STAGGER_SECONDS"] = str(args.stagger_seconds)
+    if getattr(args, "lit_index", None):
+        os.environ["DEEPRESEARCH_LIT_INDEX"] = str(args.lit_index)
+    if getattr(args, "work_queue", None):
+        os.environ["DEEPRESEARCH_WORK_QUEUE"] = str(args.work_queue)
+    # Run budget (see budget.RunBudget)
+    if getattr(args, "deadline_minutes", None) is not None:
+        os.environ["DEEPRESEARCH_DEADLINE_SECONDS"] = str(float(args.deadline_minutes) * 60.0)
+    if getattr(args, "max_tokens", None) is not None:
+        os.environ["DEEPRESEARCH_MAX_TOKENS"] = str(int(args.max_tokens))
+    if getattr(args, "max_cost", None) is not None:
+        os.environ["DEEPRESEARCH_MAX_COST"] = str(float(args.max_cost))
+    return None
+
+
 def handle_latex_paper(args) -> Optional[int]:
     if not args.latex_paper_json:
         return None
@@ -52,7 +78,8 @@ def handle_latex_paper(args) -> Optional[int]:
                 main_reasoning="medium",
             )
         )
-        output_dir = converter.convert(args.latex_paper_json)
+        with run_budget_scope():
+            output_dir = converter.convert(args.latex_paper_json)
     except Exception as e:
         payload = {"error": f"LaTeX paper conversion failed: {type(e).__name__}: {e}"}
         if args.json:
@@ -73,10 +100,8 @@ def handle_refine_json(args) -> Optional[int]:
         return None
     try:
         p = Path(args.refine_json_path).expanduser().resolve()
-        raw = p.read_text(encoding="utf-8")
-        data = json.loads(raw) if raw.strip() else []
-        if not isinstance(data, list):
-            raise ValueError("JSON root must be a list")
+        # Reads the append-only result log when present, else the legacy JSON array
+        data = load_results(p)
     except Exception as e:
         print(
             json.dumps(
@@ -113,24 +138,30 @@ def handle_refine_json(args) -> Optional[int]:
         except Exception:
             return {"statement": stmt, "proof_markdown": proof}
 
-    updated: list[dict] = []
+    updated_by_idx: dict[int, dict] = {}
     with ThreadPoolExecutor(max_workers=12) as ex:
-        fut_map = {ex.submit(_refine_item, item): idx for idx, item in enumerate(data)}
+        refine_item = with_run_budget(_refine_item)
+        fut_map = {ex.submit(refine_item, item): idx for idx, item in enumerate(data)}
         for fut in as_completed(fut_map):
+            idx = fut_map[fut]
             try:
-                updated.append(fut.result())
+                updated_by_idx[idx] = fut.result()
             except Exception:
-                idx = fut_map[fut]
                 itm = data[idx]
-                updated.append(
-                    {
-                        "statement": str(itm.get("statement", "")),
-                        "proof_markdown": str(itm.get("proof_markdown", "")),
-                    }
-                )
+                updated_by_idx[idx] = {
+                    "statement": str(itm.get("statement", "")),
+                    "proof_markdown": str(itm.get("proof_markdown", "")),
+                }
+    # Keep the input order
+    updated = [updated_by_idx[i] for i in sorted(updated_by_idx)]
 
     try:
-        p.write_text(json.dumps(updated, indent=2, ensure_ascii=False), encoding="utf-8")
+        store = open_result_store(p)
+        if store.log_path.exists():
+            store.rewrite(updated)
+            p = store.array_path
+        else:
+            p.write_text(json.dumps(updated, indent=2, ensure_ascii=False), encoding="utf-8")
     except Exception as e:
         print(
             json.dumps(
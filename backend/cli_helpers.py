@@ -1,7 +1,10 @@
 import json
+import logging
 import re
 from pathlib import Path
 
+from .result_store import open_result_store
+
 
 def _parse_seed_content(text: str) -> str | list[str]:
     '''Parse seed content as JSON list[str] if possible; otherwise return the raw string.
@@ -66,41 +69,15 @@ def _parse_seed_content2(text: str) -> str | list[str]:
 
 
 def _append_correct_result_json(path: str, statement: str, proof_markdown: str) -> None:
-    '''Append a correct result to a JSON array file in a durable way.
+    '''Append a correct result durably.
 
-    If the file does not exist or is invalid, create it with a single-element array.
+    Results go to an append-only JSONL log next to `path`; the JSON array at `path` is
+    refreshed periodically by compaction (see ResultStore).
     '''
-    obj = {"statement": statement, "proof_markdown": proof_markdown}
     try:
-        p = Path(path).expanduser().resolve()
-        # Ensure parent directory exists when a nested path is provided
-        try:
-            p.parent.mkdir(parents=True, exist_ok=True)
-        except Exception:
-            pass
-        if p.exists():
-            try:
-                raw = p.read_text(encoding="utf-8")
-                data = json.loads(raw) if raw.strip() else []
-                if not isinstance(data, list):
-                    data = []
-            except Exception:
-                data = []
-        else:
-            data = []
-        data.append(obj)
-        p.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        open_result_store(path).append(statement, proof_markdown)
     except Exception:
-        # Best-effort fallback: write a minimal JSON array
-        try:
-            p = Path(path)
-            try:
-                p.parent.mkdir(parents=True, exist_ok=True)
-            except Exception:
-                pass
-            p.write_text(json.dumps([obj], indent=2, ensure_ascii=False), encoding="utf-8")
-        except Exception:
-            pass
+        logging.getLogger(__name__).exception("Failed to append result to %s", path)
 
 
 def _write_seed_file(path: Path, seeds: list[str]) -> None:
@@ -11,6 +11,7 @@ from .cli_args import parse_args
 from .cli_helpers import _parse_seed_content2
 from .cli_handlers import (
     setup_provider_flags,
+    setup_solver_flags,
     handle_latex_paper,
     handle_refine_json,
     handle_open_problem,
@@ -33,9 +34,15 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     # Provider selection and environment wiring
     rc = setup_provider_flags(args)
+    if rc is not None:
+        return rc
+    rc = setup_solver_flags(args)
     if rc is not None:
         return rc
 
+    if args.resume_dir and not args.research:
+        print("Error: --resume requires --research.", file=sys.stderr)
+        return 2
     if args.open_problem and (args.research or args.continuous):
         print(
             "Error: --open-problem cannot be combined with --research or --continuous.",
@@ -154,6 +161,7 @@ def main(argv: Optional[list[str]] = None) -> int:
                 seed_result=seed_parsed,
                 model=args.model,
                 research_guideline=args.research_guideline,
+                **({"run_dir": args.resume_dir} if args.resume_dir else {}),
             )
         except Exception as e:
             print(
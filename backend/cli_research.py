@@ -2,23 +2,49 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Tuple
 
-from .solver import Solver
+from .solver import Solver, race_solvers, select_best_failure
 from .judge import Judge
 from .research import ResearchPipeline, ResearchConfig
 from .result_refiner import ResultRefiner
 from .cli_helpers import _append_correct_result_json, _write_seed_file
+from .result_store import open_result_store
+from .artifacts import ArtifactStore, digest
+from .difficulty import ProofScheduler
+from .budget import current_run_budget, run_budget_scope
+from .output_schemas import LiteratureReviewResult, PredictedResults
+from .task_graph import Stage, TaskGraph
+from .work_queue import WorkQueue, open_work_queue
+from .worker import remote_solve
 
 
-def request_proof(question: str, model: str = "gpt-5") -> tuple[bool, str]:
+def _env_flag(name: str) -> bool:
+    return (os.getenv(name) or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def request_proof(
+    question: str,
+    model: str = "gpt-5",
+    *,
+    cancel_event: threading.Event | None = None,
+) -> tuple[bool, str]:
     """Run one or more prover/judge pairs in parallel and return the result.
 
     If the environment variable DEEPRESEARCH_SOLVER_PAIRS is set to an integer > 1,
     we launch that many Solver instances in parallel (each with its own Prover and Judges),
-    and return the first success if any, else the most informative failure (longest feedback).
+    and return the first success if any, else the best failed attempt (chosen by a pairwise
+    FinalJudge tournament) together with its first flaw.
+
+    By default every pair runs to completion so that all pair logs are written. With
+    DEEPRESEARCH_SOLVER_RACE set, the first success is returned immediately and the other
+    pairs are cancelled; DEEPRESEARCH_SOLVER_STAGGER_SECONDS additionally delays launching
+    extra pairs until the running ones have not succeeded within that many seconds.
+
+    Setting `cancel_event` stops every pair at its next step; no tournament is run then.
     """
     try:
         pairs = int(os.getenv("DEEPRESEARCH_SOLVER_PAIRS", "1") or "1")
@@ -27,28 +53,43 @@ def request_proof(question: str, model: str = "gpt-5") -> tuple[bool, str]:
 
     if pairs <= 1:
         solver = Solver(model=model)
-        return solver.solve(problem=question)
-
-    def _run_one() -> tuple[bool, str]:
-        s = Solver(model=model)
-        return s.solve(problem=question)
+        return solver.solve(problem=question, cancel_event=cancel_event)
 
     results: list[tuple[bool, str]] = []
     first_success: tuple[bool, str] | None = None
-    with ThreadPoolExecutor(max_workers=pairs) as ex:
-        futs = [ex.submit(_run_one) for _ in range(pairs)]
-        for fut in as_completed(futs):
-            ok, payload = fut.result()
-            results.append((ok, payload))
-            if ok and first_success is None:
-                first_success = (ok, payload)
-                # Note: we don't cancel other runs to ensure logs are created; they will finish soon enough.
+    solvers: list[Solver] = []
+    if _env_flag("DEEPRESEARCH_SOLVER_RACE"):
+        try:
+            stagger = float(os.getenv("DEEPRESEARCH_SOLVER_STAGGER_SECONDS", "") or "0")
+        except Exception:
+            stagger = 0.0
+        first_success, results, solvers = race_solvers(
+            lambda _idx: Solver(model=model),
+            question,
+            pairs,
+            stagger_seconds=stagger if stagger > 0 else None,
+            cancel_event=cancel_event,
+        )
+    else:
+        def _run_one() -> tuple[bool, str]:
+            s = Solver(model=model)
+            solvers.append(s)
+            return s.solve(problem=question, cancel_event=cancel_event)
+
+        with ThreadPoolExecutor(max_workers=pairs) as ex:
+            futs = [ex.submit(_run_one) for _ in range(pairs)]
+            for fut in as_completed(futs):
+                ok, payload = fut.result()
+                results.append((ok, payload))
+                if ok and first_success is None:
+                    first_success = (ok, payload)
+                    # Note: we don't cancel other runs to ensure logs are created; they will finish soon enough.
     if first_success is not None:
         return first_success
-    # Choose the failure with the longest feedback to be more informative
-    if results:
-        return max(results, key=lambda x: len(x[1] or ""))
-    return False, "No result produced."
+    if cancel_event is not None and cancel_event.is_set():
+        return False, "Cancelled"
+    # Let a FinalJudge tournament pick the least incorrect attempt across pairs
+    return select_best_failure(question, solvers, results)
 
 
 def _map_model(name: str, *, has_tools: bool = False, is_prover: bool = False) -> str:
@@ -59,12 +100,83 @@ def _map_model(name: str, *, has_tools: bool = False, is_prover: bool = False) -
     return name
 
 
+class ResearchCancelled(RuntimeError):
+    """Raised by a research run whose cancel_event was set."""
+
+
+def _proof_scheduler(cfg: ResearchConfig, candidates: int) -> ProofScheduler | None:
+    if not cfg.adaptive_budget:
+        return None
+    return ProofScheduler(
+        candidates,
+        mean_iterations=cfg.mean_iterations,
+        min_iterations=cfg.min_iterations,
+        max_iterations=cfg.max_iterations,
+    )
+
+
+def _queued_solve(
+    queue: WorkQueue,
+    stmt: str,
+    lit: LiteratureReviewResult,
+    model: str,
+    cfg: ResearchConfig,
+    scheduler: ProofScheduler | None,
+    cancel_event: threading.Event | None = None,
+) -> tuple[bool, str, dict]:
+    """Prove `stmt` on a `python -m backend.worker` process instead of in this one.
+
+    The shared iteration pool lives in this process, so remote jobs get the fixed
+    per-candidate budget the scheduler plans from the statement's difficulty.
+    """
+    max_tries = scheduler.plan(stmt, lit).iterations if scheduler is not None else cfg.mean_iterations
+    return remote_solve(
+        queue,
+        stmt,
+        lit,
+        model=model,
+        max_tries_per_prover=max_tries,
+        prover_effort=cfg.prover_effort,
+        judge_effort=cfg.judge_effort,
+        cancel_event=cancel_event,
+    )
+
+
 def run_automate_math_research(
     seed_result: str | list[str],
     model: str = "gpt-5",
     research_guideline: str | None = None,
+    run_dir: str | None = None,
+    cancel_event: threading.Event | None = None,
+) -> tuple[list[tuple[str, str]], str]:
+    """Run literature review -> prediction -> novelty -> proving -> report.
+
+    With run_dir, every stage output (and each per-statement novelty/proof/refinement
+    outcome) is stored there keyed by its inputs, and a rerun on the same directory
+    reuses whatever already finished. With a run budget (DEEPRESEARCH_DEADLINE_SECONDS,
+    _MAX_TOKENS, _MAX_COST) the run degrades as the budget runs low and the report
+    states what was skipped.
+
+    Setting cancel_event stops the run between stages and running solvers at their next
+    iteration, then raises ResearchCancelled; unfinished work is not stored in run_dir,
+    so the same run can be resumed later.
+    """
+    with run_budget_scope():
+        return _run_automate_math_research(seed_result, model, research_guideline, run_dir, cancel_event)
+
+
+def _run_automate_math_research(
+    seed_result: str | list[str],
+    model: str,
+    research_guideline: str | None,
+    run_dir: str | None,
+    cancel_event: threading.Event | None = None,
 ) -> tuple[list[tuple[str, str]], str]:
     logger = logging.getLogger("backend.research_flow")
+
+    def _check_cancelled() -> None:
+        if cancel_event is not None and cancel_event.is_set():
+            raise ResearchCancelled("Research run cancelled")
     try:
         seed_len = len(seed_result) if isinstance(seed_result, list) else len(str(seed_result or ""))
     except Exception:
@@ -90,15 +202,36 @@ def run_automate_math_research(
             research_guideline=research_guideline,
         )
     )
-    lit = pipeline.literature_review(seed_result)
+    store = ArtifactStore(run_dir) if run_dir else None
+    # Worker counts and the index location do not change stage outputs
+    config_key = digest(
+        pipeline.config,
+        exclude=("novelty_workers", "prove_workers", "refine_workers", "lit_review_workers", "literature_index_path"),
+    )
+    if store is not None:
+        logger.info("[Phase] Artifacts: %s", store.run_dir)
+
+    def _cached(stage: str, inputs, compute, **kwargs):
+        if store is None:
+            return compute()
+        return store.cached(stage, [inputs, config_key], compute, **kwargs)
+
+    lit = _cached(
+        "literature",
+        seed_result,
+        lambda: pipeline.literature_review(seed_result),
+        model=LiteratureReviewResult,
+    )
     try:
         logger.info("[Phase] Literature review: done (results=%d)", len(lit.results))
     except Exception:
         logger.info("[Phase] Literature review: done")
+    _check_cancelled()
 
     # Predict results and filter by novelty
     logger.info("[Phase] Prediction: begin")
-    preds = pipeline.predict(lit)
+    lit_key = digest(lit)
+    preds = _cached("prediction", lit_key, lambda: pipeline.predict(lit), model=PredictedResults)
     try:
         logger.info(
             "[Phase] Prediction: done (predicted=%d)",
@@ -106,75 +239,169 @@ def run_automate_math_research(
         )
     except Exception:
         logger.info("[Phase] Prediction: done")
-    logger.info("[Phase] Novelty check: begin")
-    novel_statements = pipeline.novelty_filter(lit, preds)
-    logger.info(
-        "[Phase] Novelty check: kept %d/%d",
-        len(novel_statements),
-        len(getattr(preds, "predicted_results", []) or []),
-    )
+    # One representative per cluster of paraphrased predictions goes on to novelty and proving
+    predicted = pipeline.dedupe_predictions(list(getattr(preds, "predicted_results", []) or []))
+    _check_cancelled()
+
+    # Streaming task graph: novelty -> prove -> refine. Each statement moves on as soon as
+    # its own task finishes instead of waiting for the slowest item of the previous stage.
+    # Items carry their prediction index so the final ordering is deterministic.
+    refined_by_idx: dict[int, tuple[str, str]] = {}
+    cfg = pipeline.config
+    accepted_efforts: dict[str, int] = {}
+    counts = {"novel": 0, "known": 0}
+    kept_by_idx: dict[int, str] = {}
+    # Proofs are prompted with (and cached against) the literature as reviewed; known results
+    # the novelty checker finds mid-run only go into the report's copy
+    report_lit = lit.model_copy(update={"results": list(lit.results)})
+
+    def _short(stmt: str) -> str:
+        return (stmt[:80] + "…") if len(stmt) > 80 else stmt
+
+    # Per-statement artifacts are keyed by the statement and the literature it was judged against
+    def _budget_allows_proof() -> bool:
+        budget = current_run_budget()
+        return budget is None or budget.allows("proof")
+
+    def _check(item: tuple[int, str]):
+        # A "not novel" reached once the budget stops proofs may be a skipped check; a resumed
+        # run with a fresh budget should check this statement again
+        return _cached(
+            "novelty",
+            [lit_key, item[1]],
+            lambda: pipeline.check_novelty(lit, item[1]),
+            decode=tuple,
+            store_if=lambda res: bool(res[1]) or res[3] is not None or _budget_allows_proof(),
+        )
 
-    # Attempt proofs in parallel; instantiate an isolated Solver per statement
-    results: list[tuple[str, str]] = []
-    futures = []
-    refiner = ResultRefiner(model=_map_model(model, has_tools=False), reasoning_effort="medium")
-
-    def _prove_stmt(statement: str) -> tuple[bool, str]:
-        local_solver = Solver(model=model)
-        return local_solver.solve(statement, 8, lit)
-
-    logger.info("[Phase] Proving: begin (candidates=%d)", len(novel_statements))
-    with ThreadPoolExecutor(max_workers=12) as ex:
-        for stmt in novel_statements:
-            futures.append((stmt, ex.submit(_prove_stmt, stmt)))
-        for stmt, fut in futures:
-            ok, proof_or_feedback = fut.result()
-            if not ok:
-                logger.info(
-                    "[Proving] Failed: %s",
-                    (stmt[:80] + "…") if len(stmt) > 80 else stmt,
-                )
-                continue
-            logger.info(
-                "[Proving] Success: %s", (stmt[:80] + "…") if len(stmt) > 80 else stmt
-            )
+    scheduler = _proof_scheduler(cfg, len(predicted))
+    work_queue = open_work_queue()
+
+    def _make_solver(prover_effort=None) -> Solver:
+        return Solver(model=model, prover_effort=prover_effort or cfg.prover_effort, judge_effort=cfg.judge_effort)
+
+    def _solve(stmt: str) -> tuple[bool, str, str | None]:
+        if work_queue is not None:
+            ok, payload, accepted = _queued_solve(work_queue, stmt, lit, model, cfg, scheduler, cancel_event)
+            effort = accepted.get("prover") if ok else None
+        else:
+            if scheduler is not None:
+                ok, payload, local_solver = scheduler.prove(stmt, lit, _make_solver, cancel_event=cancel_event)
+            else:
+                local_solver = _make_solver()
+                ok, payload = local_solver.solve(stmt, cfg.mean_iterations, lit, cancel_event)
+            effort = ((local_solver.accepted_effort if local_solver else None) or {}).get("prover") if ok else None
+        # A cut-short attempt must not be cached as this statement's outcome
+        _check_cancelled()
+        return ok, payload, effort
+
+    def _prove_stmt(item: tuple[int, str]) -> tuple[bool, str, str | None]:
+        if not _budget_allows_proof():
+            current_run_budget().note_skip("proof attempts not started")
+            logger.info("[Proving] Run budget nearly spent; not starting: %s", _short(item[1]))
+            return False, "Skipped: run budget", None
+        # A failure once the budget stops proofs may be an attempt the budget cut short
+        return _cached(
+            "prove",
+            [lit_key, item[1]],
+            lambda: _solve(item[1]),
+            decode=tuple,
+            store_if=lambda res: bool(res[0]) or _budget_allows_proof(),
+        )
 
-            def _refine_and_select(base_stmt: str, base_proof: str) -> tuple[str, str]:
-                try:
-                    refined = refiner.refine(base_stmt, base_proof)
-                except Exception:
-                    refined = None
-                if refined is not None:
-                    rs, rp = refined
+    def _refine_and_select(item: tuple[int, str, str]) -> tuple[str, str]:
+        return _cached("refine", [item[1], item[2]], lambda: _refine(item), decode=tuple)
+
+    def _refine(item: tuple[int, str, str]) -> tuple[str, str]:
+        _idx, base_stmt, base_proof = item
+        # ResultRefiner keeps per-call conversation state, so each task gets its own instance
+        refiner = ResultRefiner(model=_map_model(model, has_tools=False), effort_policy=cfg.refiner_effort)
+        try:
+            refined = refiner.refine(base_stmt, base_proof)
+        except Exception:
+            refined = None
+        if refined is not None:
+            rs, rp = refined
+        else:
+            rs, rp = base_stmt, base_proof
+        # Attempt tighten and judge
+        try:
+            tightened = refiner.tighten(rs, rp)
+            if tightened is not None:
+                t_stmt, t_proof = tightened
+                j = Judge(model=_map_model(model, has_tools=True))
+                jres = j.assess(t_stmt, t_proof)
+                if jres.correctness:
+                    logger.info("[Proving] Tighten accepted by Judge")
+                    return t_stmt, t_proof
                 else:
-                    rs, rp = base_stmt, base_proof
-                # Attempt tighten and judge
-                try:
-                    tightened = refiner.tighten(rs, rp)
-                    if tightened is not None:
-                        t_stmt, t_proof = tightened
-                        j = Judge(model=_map_model(model, has_tools=True))
-                        jres = j.assess(t_stmt, t_proof)
-                        if jres.correctness:
-                            logger.info("[Proving] Tighten accepted by Judge")
-                            return t_stmt, t_proof
-                        else:
-                            logger.info(
-                                "[Proving] Tighten rejected by Judge; keeping refined/original"
-                            )
-                except Exception:
-                    logger.exception(
-                        "[Proving] Tighten/Judge failed; keeping refined/original"
+                    logger.info(
+                        "[Proving] Tighten rejected by Judge; keeping refined/original"
                     )
-                return rs, rp
-
-            rs, rp = _refine_and_select(stmt, proof_or_feedback)
-            results.append((rs, rp))
+        except Exception:
+            logger.exception(
+                "[Proving] Tighten/Judge failed; keeping refined/original"
+            )
+        return rs, rp
+
+    def _after_novelty(item: tuple[int, str], res: tuple[str, bool, str | None, str | None]):
+        _stmt, is_novel, matched_stmt, matched_url = res
+        if is_novel:
+            counts["novel"] += 1
+            kept_by_idx[item[0]] = item[1]
+            logger.info("[Novelty] Novel; proving now: %s", _short(item[1]))
+            return [("prove", item)]
+        if pipeline.record_known_result(report_lit, matched_stmt, matched_url):
+            counts["known"] += 1
+        return []
+
+    def _after_prove(item: tuple[int, str], res: tuple[bool, str, str | None]):
+        ok, proof_or_feedback, effort = res
+        if not ok:
+            logger.info("[Proving] Failed: %s", _short(item[1]))
+            return []
+        logger.info("[Proving] Success (prover effort=%s): %s", effort, _short(item[1]))
+        if effort:
+            accepted_efforts[effort] = accepted_efforts.get(effort, 0) + 1
+        return [("refine", (item[0], item[1], proof_or_feedback))]
+
+    def _after_refine(item: tuple[int, str, str], res: tuple[str, str]):
+        refined_by_idx[item[0]] = res
+        return []
+
+    def _refine_failed(item: tuple[int, str, str], exc: BaseException):
+        logger.warning("[Proving] Refinement failed; keeping original: %s", exc)
+        refined_by_idx[item[0]] = (item[1], item[2])
+        return []
+
+    logger.info("[Phase] Novelty check + proving: begin (predicted=%d)", len(predicted))
+    graph = TaskGraph(
+        [
+            Stage("novelty", _check, workers=cfg.novelty_workers, then=_after_novelty),
+            Stage("prove", _prove_stmt, workers=cfg.prove_workers, then=_after_prove),
+            Stage("refine", _refine_and_select, workers=cfg.refine_workers, then=_after_refine, on_error=_refine_failed),
+        ],
+        cancel_event=cancel_event,
+    )
+    graph.run([("novelty", (idx, stmt)) for idx, stmt in enumerate(predicted)])
+    _check_cancelled()
+    logger.info(
+        "[Phase] Novelty check: kept %d/%d (appended known=%d)",
+        counts["novel"],
+        len(predicted),
+        counts["known"],
+    )
+    # Restore prediction order regardless of completion order
+    results: list[tuple[str, str]] = [refined_by_idx[i] for i in sorted(refined_by_idx)]
+    if store is not None:
+        store.save("kept", [lit_key, config_key], [kept_by_idx[i] for i in sorted(kept_by_idx)])
+        store.save("results", [lit_key, config_key], results)
+        logger.info("[Phase] Artifacts: %s", store.summary())
 
     # Compile final report from literature context and successful results
-    logger.info("[Phase] Proving: done (accepted=%d)", len(results))
+    logger.info("[Phase] Proving: done (accepted=%d, prover efforts=%s)", len(results), accepted_efforts)
     logger.info("[Phase] Report: begin")
-    report = pipeline.compile_final_report(lit, results)
+    report = pipeline.compile_final_report(report_lit, results)
     logger.info("[Phase] Report: done (length=%d)", len(report.report_markdown or ""))
     logger.info("[Phase] Pipeline complete")
     return results, report.report_markdown
@@ -192,7 +419,26 @@ def run_continuous_math_research(
 
     Each time a proof is found, append it immediately to correct_out_path.
     The list of proved statements is appended to the seed list for the next iteration.
+    Under a run budget the loop stops once new proofs are no longer allowed.
     """
+    with run_budget_scope():
+        _run_continuous_math_research(
+            seeds,
+            model=model,
+            research_guideline=research_guideline,
+            correct_out_path=correct_out_path,
+            seed_file_path=seed_file_path,
+        )
+
+
+def _run_continuous_math_research(
+    seeds: str | list[str],
+    *,
+    model: str,
+    research_guideline: str | None,
+    correct_out_path: str,
+    seed_file_path: str | None,
+) -> None:
     # Normalize seeds to list[str]
     if isinstance(seeds, str):
         current_seeds: list[str] = [seeds]
@@ -213,10 +459,18 @@ def run_continuous_math_research(
 
     iteration = 1
     logger = logging.getLogger(__name__)
+    # Literature context carried across iterations; only newly proved seeds are reviewed
+    lit = None
+    new_seeds: list[str] = list(current_seeds)
     while True:
-        logger.info("[Continuous] Iteration %d: seeds=%d", iteration, len(current_seeds))
-        # Literature review with possibly multiple seeds
-        lit = pipeline.literature_review(current_seeds)
+        budget = current_run_budget()
+        if budget is not None and not budget.allows("proof"):
+            logger.info("[Continuous] Run budget nearly spent; stopping before iteration %d", iteration)
+            break
+        logger.info(
+            "[Continuous] Iteration %d: seeds=%d (new=%d)", iteration, len(current_seeds), len(new_seeds)
+        )
+        lit = pipeline.incremental_literature_review(lit, new_seeds)
 
         # Predict and filter by novelty
         preds = pipeline.predict(lit)
@@ -225,79 +479,113 @@ def run_continuous_math_research(
             logger.info("[Continuous] Iteration %d: no novel predictions; stopping.", iteration)
             break
 
-        proved_this_round: list[tuple[str, str]] = []
+        proved_by_idx: dict[int, tuple[str, str]] = {}
+        cfg = pipeline.config
 
-        def _prove_stmt(statement: str) -> tuple[bool, str]:
-            local_solver = Solver(model=model)
-            return local_solver.solve(statement, 8, lit)
+        scheduler = _proof_scheduler(cfg, len(novel_statements))
+        work_queue = open_work_queue()
 
-        refiner = ResultRefiner(model=model, reasoning_effort="medium")
+        def _make_solver(prover_effort=None) -> Solver:
+            return Solver(
+                model=model,
+                prover_effort=prover_effort or cfg.prover_effort,
+                judge_effort=cfg.judge_effort,
+            )
 
-        with ThreadPoolExecutor(max_workers=12) as ex:
-            future_map = {ex.submit(_prove_stmt, stmt): stmt for stmt in novel_statements}
-            for fut in as_completed(future_map):
-                stmt = future_map[fut]
+        def _prove_stmt(item: tuple[int, str]) -> tuple[bool, str]:
+            if work_queue is not None:
+                ok, payload, _accepted = _queued_solve(work_queue, item[1], lit, model, cfg, scheduler)
+                return ok, payload
+            if scheduler is not None:
+                ok, payload, local_solver = scheduler.prove(item[1], lit, _make_solver)
+            else:
+                local_solver = _make_solver()
+                ok, payload = local_solver.solve(item[1], cfg.mean_iterations, lit)
+            if ok and local_solver is not None and local_solver.accepted_effort:
+                logger.info(
+                    "[Continuous] Accepted at prover effort=%s",
+                    local_solver.accepted_effort.get("prover"),
+                )
+            return ok, payload
+
+        def _refine_and_select(item: tuple[int, str, str]) -> tuple[str, str]:
+            _idx, stmt, proof_or_feedback = item
+            refiner = ResultRefiner(model=model, effort_policy=cfg.refiner_effort)
+            # Refine, then attempt tightening validated by Judge; fall back to refined/original
+            try:
+                refined = refiner.refine(stmt, proof_or_feedback)
+            except Exception as e:
+                logger.warning("[Continuous] Refiner failed; using original result: %s", e)
+                refined = None
+            if refined is not None:
+                base_stmt, base_proof = refined
+            else:
+                base_stmt, base_proof = stmt, proof_or_feedback
+
+            chosen_stmt, chosen_proof = base_stmt, base_proof
+            try:
+                tightened = refiner.tighten(base_stmt, base_proof)
+            except Exception as e:
+                logger.warning(
+                    "[Continuous] Tighten step failed; keeping refined result: %s", e
+                )
+                tightened = None
+            if tightened is not None:
+                t_stmt, t_proof = tightened
                 try:
-                    ok, proof_or_feedback = fut.result()
-                except Exception as e:
-                    logger.warning("[Continuous] Prover raised for a statement: %s", e)
-                    continue
-                if ok:
-                    # Refine, then attempt tightening validated by Judge; fall back to refined/original
-                    try:
-                        refined = refiner.refine(stmt, proof_or_feedback)
-                    except Exception as e:
-                        logger.warning("[Continuous] Refiner failed; using original result: %s", e)
-                        refined = None
-                    if refined is not None:
-                        base_stmt, base_proof = refined
+                    j = Judge(model=model)
+                    jres = j.assess(t_stmt, t_proof)
+                    if jres.correctness:
+                        chosen_stmt, chosen_proof = t_stmt, t_proof
+                        logger.info(
+                            "[Continuous] Tightened statement accepted by Judge"
+                        )
                     else:
-                        base_stmt, base_proof = stmt, proof_or_feedback
-
-                    chosen_stmt, chosen_proof = base_stmt, base_proof
-                    try:
-                        tightened = refiner.tighten(base_stmt, base_proof)
-                    except Exception as e:
-                        logger.warning(
-                            "[Continuous] Tighten step failed; keeping refined result: %s", e
+                        logger.info(
+                            "[Continuous] Tightened statement rejected by Judge; using refined/original"
                         )
-                        tightened = None
-                    if tightened is not None:
-                        t_stmt, t_proof = tightened
-                        try:
-                            j = Judge(model=model)
-                            jres = j.assess(t_stmt, t_proof)
-                            if jres.correctness:
-                                chosen_stmt, chosen_proof = t_stmt, t_proof
-                                logger.info(
-                                    "[Continuous] Tightened statement accepted by Judge"
-                                )
-                            else:
-                                logger.info(
-                                    "[Continuous] Tightened statement rejected by Judge; using refined/original"
-                                )
-                        except Exception as e:
-                            logger.warning(
-                                "[Continuous] Judge failed on tightened result; using refined/original: %s",
-                                e,
-                            )
-
-                    proved_this_round.append((chosen_stmt, chosen_proof))
-                    _append_correct_result_json(
-                        correct_out_path, chosen_stmt, chosen_proof
-                    )
-                    logger.info(
-                        "[Continuous] Proof accepted; appended to %s", correct_out_path
+                except Exception as e:
+                    logger.warning(
+                        "[Continuous] Judge failed on tightened result; using refined/original: %s",
+                        e,
                     )
+            return chosen_stmt, chosen_proof
+
+        def _after_prove(item: tuple[int, str], res: tuple[bool, str]):
+            ok, proof_or_feedback = res
+            return [("refine", (item[0], item[1], proof_or_feedback))] if ok else []
+
+        def _prove_failed(_item: tuple[int, str], exc: BaseException):
+            logger.warning("[Continuous] Prover raised for a statement: %s", exc)
+            return []
+
+        def _after_refine(item: tuple[int, str, str], res: tuple[str, str]):
+            chosen_stmt, chosen_proof = res
+            proved_by_idx[item[0]] = res
+            # Persist immediately (on the coordinating thread, so appends never interleave)
+            _append_correct_result_json(correct_out_path, chosen_stmt, chosen_proof)
+            logger.info("[Continuous] Proof accepted; appended to %s", correct_out_path)
+            return []
+
+        graph = TaskGraph(
+            [
+                Stage("prove", _prove_stmt, workers=cfg.prove_workers, then=_after_prove, on_error=_prove_failed),
+                Stage("refine", _refine_and_select, workers=cfg.refine_workers, then=_after_refine),
+            ]
+        )
+        graph.run([("prove", (idx, stmt)) for idx, stmt in enumerate(novel_statements)])
+        proved_this_round = [proved_by_idx[i] for i in sorted(proved_by_idx)]
 
         if not proved_this_round:
             logger.info("[Continuous] Iteration %d: no proofs succeeded; stopping.", iteration)
             break
 
         # Append proved statements to seeds for the next iteration (deduplicated)
+        new_seeds = []
         for stmt, _proof in proved_this_round:
             if stmt not in seen_statements:
                 current_seeds.append(stmt)
+                new_seeds.append(stmt)
                 seen_statements.add(stmt)
 
         # Persist updated seeds to file if a seed file path was provided
@@ -314,3 +602,9 @@ def run_continuous_math_research(
                 logger.warning("[Continuous] Failed to update seed file: %s", e)
 
         iteration += 1
+
+    # Refresh the legacy JSON array from the append-only result log
+    try:
+        open_result_store(correct_out_path).compact()
+    except Exception as e:
+        logger.warning("[Continuous] Failed to compact %s: %s", correct_out_path, e)
@@ -5,8 +5,17 @@ import sys
 import json
 import tempfile
 import subprocess
+import threading
+import time
 from typing import Dict, Any
 
+from .metrics import RUN_PYTHON_ACTIVE, RUN_PYTHON_SECONDS
+
+
+# Optional cap on concurrent snippets across all provers and judges; extra calls wait for a slot
+_LIMIT = int(os.getenv("DEEPRESEARCH_RUN_PYTHON_SLOTS", "0") or 0)
+_SLOTS = threading.BoundedSemaphore(_LIMIT) if _LIMIT > 0 else None
+
 
 def run_python(code: str, timeout_seconds: float = 10.0, memory_limit_mb: int = 256) -> Dict[str, Any]:
     """Execute untrusted Python code in a subprocess and return stdout and stderr.
@@ -15,7 +24,22 @@ def run_python(code: str, timeout_seconds: float = 10.0, memory_limit_mb: int =
     - Runs with isolated flags (-I) to minimize environment exposure.
     - Captures stdout/stderr, returns exit_code, and truncates large outputs.
     - Applies a soft memory limit on POSIX systems using 'resource' if available.
+    - With DEEPRESEARCH_RUN_PYTHON_SLOTS set, at most that many snippets run at once.
     """
+    if _SLOTS is None:
+        return _timed_run_python(code, timeout_seconds, memory_limit_mb)
+    start = time.perf_counter()
+    with _SLOTS:
+        RUN_PYTHON_SECONDS.observe(time.perf_counter() - start, phase="queue")
+        return _timed_run_python(code, timeout_seconds, memory_limit_mb)
+
+
+def _timed_run_python(code: str, timeout_seconds: float, memory_limit_mb: int) -> Dict[str, Any]:
+    with RUN_PYTHON_ACTIVE.track(), RUN_PYTHON_SECONDS.time(phase="exec"):
+        return _run_python(code, timeout_seconds, memory_limit_mb)
+
+
+def _run_python(code: str, timeout_seconds: float, memory_limit_mb: int) -> Dict[str, Any]:
     # Safety: do not allow ridiculously long code blobs
     if len(code) > 200_000:
         return {
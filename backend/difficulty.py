@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .effort import EffortPolicy
+from .output_schemas import LiteratureReviewResult
+from .portfolio import IterationPool
+from .similarity import normalize_latex, text_similarity
+from .solver import Solver, race_solvers
+
+
+logger = logging.getLogger("backend.difficulty")
+
+_QUANTIFIERS = {"\\forall", "\\exists", "every", "all", "each", "exists", "exist", "any"}
+_HARD_WORDS = {
+    "conjecture",
+    "infinitely",
+    "prime",
+    "primes",
+    "asymptotic",
+    "asymptotically",
+    "optimal",
+    "sharp",
+    "tight",
+    "characterize",
+    "classify",
+    "uniformly",
+    "\\leftrightarrow",
+    "iff",
+}
+
+
+def estimate_difficulty(statement: str, literature: Optional[LiteratureReviewResult] = None) -> float:
+    """Cheap difficulty score in [0, 1] from the statement's length and structure.
+
+    Long statements with nested quantifiers and "hard" vocabulary score high; a statement
+    that closely paraphrases a known result from the literature (what the novelty checker
+    compared it against) is likely a corollary and scores lower.
+    """
+    words = normalize_latex(statement).split()
+    length = min(1.0, len(words) / 120.0)
+    quantifiers = min(1.0, sum(1 for w in words if w in _QUANTIFIERS) / 6.0)
+    hard = min(1.0, sum(1 for w in words if w in _HARD_WORDS) / 3.0)
+    closeness = 0.0
+    if literature is not None:
+        for item in literature.results or []:
+            if item.url in {"seed://input", "problem://input"} and item.statement == statement:
+                continue
+            closeness = max(closeness, text_similarity(statement, item.statement, k=3))
+    score = 0.4 * length + 0.3 * quantifiers + 0.3 * hard - 0.3 * closeness
+    return min(1.0, max(0.0, score))
+
+
+@dataclass
+class ProofPlan:
+    difficulty: float
+    iterations: int
+    pairs: int
+
+
+class ProofScheduler:
+    """Difficulty-aware iteration budgets for many proof candidates sharing one pool.
+
+    Each candidate is guaranteed a base budget scaled by its estimated difficulty (easy
+    corollaries get few iterations, hard conjectures more and a second solver pair). A
+    one-iteration low-effort probe runs first so trivial statements finish cheaply.
+    Beyond the base, iterations come from the shared surplus, which also holds the
+    budget of candidates that never reached proving or that stopped early, and are only
+    granted while the candidate's judge feedback keeps changing (see IterationPool).
+    """
+
+    def __init__(
+        self,
+        candidates: int,
+        *,
+        mean_iterations: int = 8,
+        min_iterations: int = 2,
+        max_iterations: int = 16,
+        hard_threshold: float = 0.6,
+        max_pairs: int = 2,
+        probe: bool = True,
+        min_progress: float = 0.25,
+    ) -> None:
+        self.mean_iterations = max(1, int(mean_iterations))
+        self.min_iterations = max(1, min(int(min_iterations), self.mean_iterations))
+        self.max_iterations = max(self.mean_iterations, int(max_iterations))
+        self.hard_threshold = hard_threshold
+        self.max_pairs = max(1, int(max_pairs))
+        self.probe = probe
+        self.pool = IterationPool(self.mean_iterations * max(1, int(candidates)), min_progress=min_progress)
+        self._last_feedback: Dict[str, str] = {}
+        self._lock = Lock()
+
+    def plan(self, statement: str, literature: Optional[LiteratureReviewResult] = None) -> ProofPlan:
+        d = estimate_difficulty(statement, literature)
+        span = self.mean_iterations - self.min_iterations
+        iterations = int(round(self.min_iterations + 2.0 * d * span))
+        iterations = max(self.min_iterations, min(self.max_iterations, iterations))
+        pairs = self.max_pairs if d >= self.hard_threshold else 1
+        return ProofPlan(difficulty=d, iterations=iterations, pairs=pairs)
+
+    def _on_event(self, key: str, event: Dict[str, Any]) -> None:
+        kind = event.get("event")
+        if kind == "judge":
+            if event.get("judge") == 1 and event.get("accepted"):
+                self.pool.report(key, 1.0)
+            elif not event.get("accepted") and event.get("judge") == 1:
+                fb = str(event.get("feedback") or "")
+                with self._lock:
+                    last = self._last_feedback.get(key, "")
+                    self._last_feedback[key] = fb
+                # A different flaw each round means the prover is converging; the same flaw means it is stuck
+                self.pool.report(key, 0.5 * (1.0 - text_similarity(fb, last)))
+        elif kind == "stagnation":
+            self.pool.report(key, 0.0)
+
+    def _kwargs(self, key: str, cancel_event: Optional[Event] = None) -> Dict[str, Any]:
+        return {
+            "max_tries_per_prover": self.max_iterations,
+            "iteration_gate": lambda _i: not (cancel_event is not None and cancel_event.is_set())
+            and self.pool.acquire(key),
+            "on_event": lambda ev: self._on_event(key, ev),
+        }
+
+    def prove(
+        self,
+        statement: str,
+        literature: Optional[LiteratureReviewResult],
+        make_solver: Callable[[Optional[EffortPolicy]], Solver],
+        *,
+        key: Optional[str] = None,
+        cancel_event: Optional[Event] = None,
+    ) -> Tuple[bool, str, Optional[Solver]]:
+        """Prove one candidate within its planned budget.
+
+        make_solver(prover_effort) builds a Solver; None means the default effort policy.
+        Setting cancel_event stops every solver of this candidate at its next iteration.
+        Returns (ok, proof_or_feedback, accepting_solver_or_last_solver).
+        """
+        key = key or statement
+        plan = self.plan(statement, literature)
+        self.pool.register(key, plan.iterations, cap=self.max_iterations)
+        logger.info(
+            "[Budget] difficulty=%.2f iterations=%d pairs=%d (pool remaining=%d): %.80s",
+            plan.difficulty,
+            plan.iterations,
+            plan.pairs,
+            self.pool.remaining,
+            statement,
+        )
+        try:
+            if self.probe:
+                probe = make_solver(EffortPolicy.fixed("low"))
+                ok, payload = probe.solve(statement, literature=literature, **{**self._kwargs(key, cancel_event), "max_tries_per_prover": 1})
+                if ok:
+                    logger.info("[Budget] Solved by the low-effort probe: %.80s", statement)
+                    return ok, payload, probe
+
+            solvers: List[Solver] = []
+
+            def _make(_idx: int) -> Solver:
+                solver = make_solver(None)
+                solvers.append(solver)
+                return solver
+
+            first, results, _ = race_solvers(
+                _make,
+                statement,
+                plan.pairs,
+                literature=literature,
+                solve_kwargs=lambda _idx: self._kwargs(key, cancel_event),
+            )
+            if first is not None:
+                winner = next((s for s in solvers if s.accepted_effort), solvers[0] if solvers else None)
+                return first[0], first[1], winner
+            last = results[-1] if results else (False, "")
+            return False, last[1], solvers[-1] if solvers else None
+        finally:
+            # Whatever this candidate did not use goes back to the shared surplus
+            self.pool.release(key)
+            logger.info("[Budget] used %d iterations: %.80s", self.pool.used(key), statement)
+
+
+__all__ = ["ProofPlan", "ProofScheduler", "estimate_difficulty"]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+EFFORT_LEVELS = ("low", "medium", "high")
+
+# Reasons a stage may move to the next reasoning effort
+ESCALATION_REASONS = ("rejection", "parse", "timeout", "stagnation")
+
+
+def next_effort(level: Optional[str]) -> Optional[str]:
+    """Return the next higher reasoning effort, or None when already at the top (or unknown)."""
+    if level not in EFFORT_LEVELS:
+        return None
+    idx = EFFORT_LEVELS.index(level)
+    return EFFORT_LEVELS[idx + 1] if idx + 1 < len(EFFORT_LEVELS) else None
+
+
+@dataclass(frozen=True)
+class EffortPolicy:
+    """Reasoning-effort ladder for one stage: start low and climb to `ceiling` on trouble.
+
+    `escalate_on` lists the reasons that move the stage up one level: a rejected result,
+    a structured-output parse failure, a timeout, or a stagnation decision by the Solver.
+    """
+
+    start: str = "medium"
+    ceiling: str = "high"
+    escalate_on: Tuple[str, ...] = ESCALATION_REASONS
+
+    @classmethod
+    def fixed(cls, level: str) -> "EffortPolicy":
+        """Legacy behavior: stay at `level` unless the Solver decides progress has stalled."""
+        return cls(start=level, ceiling="high", escalate_on=("stagnation",))
+
+    def escalated(self, level: str, reason: str) -> Optional[str]:
+        """Return the level to use after `reason`, or None when the policy does not escalate."""
+        if reason not in self.escalate_on:
+            return None
+        nxt = next_effort(level)
+        if nxt is None or self.ceiling not in EFFORT_LEVELS:
+            return None
+        if EFFORT_LEVELS.index(nxt) > EFFORT_LEVELS.index(self.ceiling):
+            return None
+        return nxt
+
+
+__all__ = ["EFFORT_LEVELS", "ESCALATION_REASONS", "EffortPolicy", "next_effort"]
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import gc
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .jobs import JobContext
+
+
+logger = logging.getLogger("backend.job_process")
+
+
+class JobKilled(RuntimeError):
+    """The job's worker process was killed because the job was cancelled."""
+
+
+def runner_path(runner: Callable[..., Any]) -> Optional[str]:
+    """Import path ("module:qualname") of a module-level runner; None for closures and lambdas."""
+    module = getattr(runner, "__module__", None)
+    qualname = getattr(runner, "__qualname__", "")
+    if not module or not qualname or "<" in qualname:
+        return None
+    return f"{module}:{qualname}"
+
+
+def _resolve(path: str) -> Callable[..., Any]:
+    module_name, _, qualname = path.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _set_cpu_limit(cpu_seconds: Optional[int]) -> None:
+    if not cpu_seconds:
+        return
+    try:
+        import resource
+
+        # RLIMIT_CPU counts the whole process lifetime; allow this job cpu_seconds on top of past jobs
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        _soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = int(usage.ru_utime + usage.ru_stime) + int(cpu_seconds)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except Exception as e:
+        logger.warning("[JobProcess] Could not set CPU limit: %s", e)
+
+
+def _worker_main(conn: Any, memory_limit_mb: Optional[int], cpu_seconds: Optional[int]) -> None:
+    """Child loop: run one job at a time from the pipe and send back its events and result."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s", datefmt="%H:%M:%S")
+    if hasattr(os, "setsid"):
+        try:
+            # Own process group, so a kill also takes down run_python children
+            os.setsid()
+        except OSError:
+            pass
+    if memory_limit_mb:
+        try:
+            import resource
+
+            limit = int(memory_limit_mb) * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except Exception as e:
+            logger.warning("[JobProcess] Could not set memory limit: %s", e)
+    send_lock = threading.Lock()
+
+    def _send(message: Any) -> None:
+        with send_lock:
+            conn.send(message)
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        job_id, path, request, run_dir = message
+        _set_cpu_limit(cpu_seconds)
+        try:
+            ctx = JobContext(
+                job_id=job_id,
+                cancel_event=threading.Event(),
+                run_dir=Path(run_dir),
+                on_event=lambda event: _send(("event", event)) or 0,
+            )
+            result = _resolve(path)(request, ctx)
+            _send(("result", result))
+        except Exception as e:
+            _send(("error", f"{type(e).__name__}: {e}"))
+        # Hand memory held by the finished job back before the next one starts
+        gc.collect()
+
+
+@dataclass
+class _Worker:
+    process: Any
+    conn: Any
+    jobs: int = 0
+
+
+class JobProcessPool:
+    """Runs job runners in reusable, resource-limited worker subprocesses.
+
+    Each job gets a whole worker process: its events come back over a pipe and are
+    re-emitted through ctx.emit, and its result (or error) ends the exchange. Workers
+    are reused for up to `max_jobs_per_worker` jobs and then replaced, so memory a job
+    leaked goes back to the OS. Cancelling a job kills its worker's process group
+    outright instead of waiting for the runner to notice.
+
+    Limits apply per worker: `memory_limit_mb` caps its address space, `cpu_seconds`
+    caps the CPU time of each job. A worker that dies (including by hitting a limit)
+    fails only its own job.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_limit_mb: Optional[int] = None,
+        cpu_seconds: Optional[int] = None,
+        max_jobs_per_worker: int = 20,
+        poll_seconds: float = 0.2,
+    ) -> None:
+        self.memory_limit_mb = memory_limit_mb or None
+        self.cpu_seconds = cpu_seconds or None
+        self.max_jobs_per_worker = max(1, int(max_jobs_per_worker))
+        self.poll_seconds = float(poll_seconds)
+        # Spawn, not fork: the API process has live threads and SQLite connections
+        self._mp = multiprocessing.get_context("spawn")
+        self._idle: List[_Worker] = []
+        self._busy: Set[int] = set()
+        self._workers: Dict[int, _Worker] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _spawn(self) -> _Worker:
+        parent, child = self._mp.Pipe(duplex=True)
+        process = self._mp.Process(
+            target=_worker_main,
+            args=(child, self.memory_limit_mb, self.cpu_seconds),
+            name="api-job-worker",
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        logger.info("[JobProcess] Started worker pid=%s", process.pid)
+        return _Worker(process=process, conn=parent)
+
+    def _acquire(self) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    break
+                self._workers.pop(worker.process.pid, None)
+            else:
+                worker = None
+        if worker is None:
+            worker = self._spawn()
+        with self._lock:
+            self._workers[worker.process.pid] = worker
+            self._busy.add(worker.process.pid)
+        return worker
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            self._busy.discard(worker.process.pid)
+            keep = not self._closed and worker.process.is_alive() and worker.jobs < self.max_jobs_per_worker
+            if keep:
+                self._idle.append(worker)
+                return
+            self._workers.pop(worker.process.pid, None)
+        self._stop(worker)
+
+    def _stop(self, worker: _Worker) -> None:
+        try:
+            worker.conn.send(None)
+        except Exception:
+            pass
+        worker.process.join(timeout=5.0)
+        if worker.process.is_alive():
+            self._kill(worker)
+        worker.conn.close()
+
+    def _kill(self, worker: _Worker) -> None:
+        pid = worker.process.pid
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(pid, signal.SIGKILL)
+            else:  # pragma: no cover
+                worker.process.kill()
+        except (ProcessLookupError, PermissionError, OSError):
+            worker.process.kill()
+        worker.process.join(timeout=5.0)
+        with self._lock:
+            self._busy.discard(pid)
+            self._workers.pop(pid, None)
+
+    def run(self, runner: Callable[[Dict[str, Any], JobContext], Any], request: Dict[str, Any], ctx: JobContext) -> Any:
+        """Run one job in a worker; raises JobKilled on cancellation and RuntimeError on failure."""
+        path = runner_path(runner)
+        if path is None:
+            logger.warning("[JobProcess] Runner %r is not importable; running it in-process", runner)
+            return runner(request, ctx)
+        worker = self._acquire()
+        try:
+            worker.conn.send((ctx.job_id, path, request, str(ctx.run_dir)))
+        except Exception:
+            self._kill(worker)
+            raise
+        while True:
+            if ctx.cancel_event.is_set():
+                self._kill(worker)
+                raise JobKilled(f"Job {ctx.job_id} cancelled; worker pid={worker.process.pid} killed")
+            try:
+                if not worker.conn.poll(self.poll_seconds):
+                    continue
+                kind, payload = worker.conn.recv()
+            except (EOFError, OSError):
+                worker.process.join(timeout=5.0)
+                code = worker.process.exitcode
+                self._kill(worker)
+                raise RuntimeError(f"Job worker exited unexpectedly (exit code {code}); it may have hit its memory or CPU limit")
+            if kind == "event":
+                ctx.emit(payload)
+                continue
+            worker.jobs += 1
+            self._release(worker)
+            if kind == "result":
+                return payload
+            raise RuntimeError(str(payload))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"idle": len(self._idle), "busy": len(self._busy)}
+
+    def shutdown(self) -> None:
+        """Stop idle workers and kill busy ones."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            busy = [self._workers[pid] for pid in self._busy if pid in self._workers]
+        for worker in idle:
+            self._stop(worker)
+        for worker in busy:
+            self._kill(worker)
+
+
+__all__ = ["JobKilled", "JobProcessPool", "runner_path"]
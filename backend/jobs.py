@@ -0,0 +1,912 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .metrics import REGISTRY
+from .work_queue import new_worker_id
+
+
+logger = logging.getLogger("backend.jobs")
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+# Priority lanes: queued interactive jobs always start before queued research jobs
+LANE_INTERACTIVE = "interactive"
+LANE_RESEARCH = "research"
+_LANE_RANK = {LANE_INTERACTIVE: 0, LANE_RESEARCH: 1}
+
+DEFAULT_JOB_DB = "deepresearch_jobs.db"
+DEFAULT_USER = "anonymous"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS api_jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    request TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    user TEXT NOT NULL DEFAULT 'anonymous',
+    lane TEXT NOT NULL DEFAULT 'research',
+    fingerprint TEXT,
+    owner TEXT,
+    heartbeat REAL
+);
+CREATE INDEX IF NOT EXISTS api_jobs_status ON api_jobs(status, created);
+CREATE TABLE IF NOT EXISTS api_job_events (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+# Columns added after the table was first created; older job databases get them on open
+_MIGRATIONS = {
+    "user": "ALTER TABLE api_jobs ADD COLUMN user TEXT NOT NULL DEFAULT 'anonymous'",
+    "lane": "ALTER TABLE api_jobs ADD COLUMN lane TEXT NOT NULL DEFAULT 'research'",
+    "fingerprint": "ALTER TABLE api_jobs ADD COLUMN fingerprint TEXT",
+    "owner": "ALTER TABLE api_jobs ADD COLUMN owner TEXT",
+    "heartbeat": "ALTER TABLE api_jobs ADD COLUMN heartbeat REAL",
+}
+
+
+class QueueFull(RuntimeError):
+    """Raised by JobManager.submit when the queue is at capacity."""
+
+    def __init__(self, message: str, *, retry_after: float = 30.0) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class JobRecord:
+    id: str
+    kind: str
+    request: Dict[str, Any]
+    status: str
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    user: str = DEFAULT_USER
+    lane: str = LANE_RESEARCH
+    fingerprint: Optional[str] = None
+    # Server process that queues or runs the job, and when it last confirmed it is alive
+    owner: Optional[str] = None
+    heartbeat: Optional[float] = None
+    # Set on the record returned by submit when the request joined an existing job
+    coalesced: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "request": self.request,
+            "result": self.result,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "user": self.user,
+            "lane": self.lane,
+            "coalesced": self.coalesced,
+        }
+
+
+def _row_to_record(row: sqlite3.Row) -> JobRecord:
+    return JobRecord(
+        id=row["id"],
+        kind=row["kind"],
+        request=json.loads(row["request"]),
+        status=row["status"],
+        result=json.loads(row["result"]) if row["result"] is not None else None,
+        error=row["error"],
+        cancel_requested=bool(row["cancel_requested"]),
+        created=float(row["created"]),
+        started=row["started"],
+        finished=row["finished"],
+        user=row["user"],
+        lane=row["lane"],
+        fingerprint=row["fingerprint"],
+        owner=row["owner"],
+        heartbeat=row["heartbeat"],
+    )
+
+
+class JobStore:
+    """SQLite record of API jobs: request, status, result and cancellation flag.
+
+    The store outlives the server process, so clients can poll a job after reconnecting
+    and jobs interrupted by a restart can be found and resumed. Several server processes
+    can share one store file (WAL mode); each job has an owner process that renews a
+    heartbeat, and a job whose owner stopped renewing can be claimed by another process.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = str(Path(path).expanduser().resolve())
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(api_jobs)")}
+        for column, ddl in _MIGRATIONS.items():
+            if column not in columns:
+                conn.execute(ddl)
+        conn.execute("CREATE INDEX IF NOT EXISTS api_jobs_fingerprint ON api_jobs(fingerprint, created)")
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=60000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction on this thread's connection, exclusive across processes."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def create(
+        self,
+        kind: str,
+        request: Dict[str, Any],
+        *,
+        job_id: Optional[str] = None,
+        user: str = DEFAULT_USER,
+        lane: str = LANE_RESEARCH,
+        fingerprint: Optional[str] = None,
+        owner: Optional[str] = None,
+    ) -> JobRecord:
+        job_id = job_id or uuid.uuid4().hex
+        now = time.time()
+        self._conn().execute(
+            "INSERT INTO api_jobs(id, kind, request, status, created, user, lane, fingerprint, owner, heartbeat) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                job_id,
+                kind,
+                json.dumps(request, ensure_ascii=False),
+                QUEUED,
+                now,
+                user,
+                lane,
+                fingerprint,
+                owner,
+                now if owner else None,
+            ),
+        )
+        return JobRecord(
+            id=job_id,
+            kind=kind,
+            request=request,
+            status=QUEUED,
+            created=now,
+            user=user,
+            lane=lane,
+            fingerprint=fingerprint,
+            owner=owner,
+            heartbeat=now if owner else None,
+        )
+
+    def find_shared(self, fingerprint: str, *, cache_seconds: float = 0.0) -> Optional[JobRecord]:
+        """A job an identical request can join: one still in flight, else a recent success."""
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT * FROM api_jobs WHERE fingerprint = ? AND status IN (?, ?) AND cancel_requested = 0 "
+            "ORDER BY created LIMIT 1",
+            (fingerprint, QUEUED, RUNNING),
+        ).fetchone()
+        if row is None and cache_seconds > 0:
+            row = conn.execute(
+                "SELECT * FROM api_jobs WHERE fingerprint = ? AND status = ? AND finished >= ? "
+                "ORDER BY finished DESC LIMIT 1",
+                (fingerprint, SUCCEEDED, time.time() - cache_seconds),
+            ).fetchone()
+        return _row_to_record(row) if row is not None else None
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        row = self._conn().execute("SELECT * FROM api_jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_record(row) if row is not None else None
+
+    def list(self, *, status: Optional[str] = None, limit: int = 50) -> List[JobRecord]:
+        if status:
+            rows = self._conn().execute(
+                "SELECT * FROM api_jobs WHERE status = ? ORDER BY created DESC LIMIT ?", (status, int(limit))
+            ).fetchall()
+        else:
+            rows = self._conn().execute("SELECT * FROM api_jobs ORDER BY created DESC LIMIT ?", (int(limit),)).fetchall()
+        return [_row_to_record(r) for r in rows]
+
+    def mark_running(self, job_id: str, *, owner: Optional[str] = None) -> bool:
+        """Start a queued job; with `owner`, only if that process still owns it (or nobody does)."""
+        now = time.time()
+        cur = self._conn().execute(
+            "UPDATE api_jobs SET status = ?, started = ?, owner = COALESCE(?, owner), heartbeat = ? "
+            "WHERE id = ? AND status = ? AND cancel_requested = 0 AND (? IS NULL OR owner IS NULL OR owner = ?)",
+            (RUNNING, now, owner, now, job_id, QUEUED, owner, owner),
+        )
+        return cur.rowcount == 1
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        *,
+        result: Any = None,
+        error: Optional[str] = None,
+        owner: Optional[str] = None,
+    ) -> bool:
+        """Record the outcome; with `owner`, a process that lost the job cannot overwrite it."""
+        cur = self._conn().execute(
+            "UPDATE api_jobs SET status = ?, result = ?, error = ?, finished = ? "
+            "WHERE id = ? AND (? IS NULL OR owner IS NULL OR owner = ?)",
+            (
+                status,
+                json.dumps(result, ensure_ascii=False) if result is not None else None,
+                error,
+                time.time(),
+                job_id,
+                owner,
+                owner,
+            ),
+        )
+        return cur.rowcount == 1
+
+    def heartbeat(self, owner: str) -> int:
+        """Renew the owner's claim on all its unfinished jobs; returns how many it holds."""
+        cur = self._conn().execute(
+            "UPDATE api_jobs SET heartbeat = ? WHERE owner = ? AND status IN (?, ?)",
+            (time.time(), owner, QUEUED, RUNNING),
+        )
+        return cur.rowcount
+
+    def claim(self, job_id: str, owner: str, *, expected_owner: Optional[str]) -> bool:
+        """Take over an unfinished job if `expected_owner` still holds it (compare-and-set)."""
+        cur = self._conn().execute(
+            "UPDATE api_jobs SET owner = ?, heartbeat = ? WHERE id = ? AND status IN (?, ?) AND owner IS ?",
+            (owner, time.time(), job_id, QUEUED, RUNNING, expected_owner),
+        )
+        return cur.rowcount == 1
+
+    def states(self, job_ids: Iterable[str]) -> Dict[str, Tuple[str, Optional[str], bool]]:
+        """(status, owner, cancel_requested) per job id."""
+        ids = list(job_ids)
+        if not ids:
+            return {}
+        rows = self._conn().execute(
+            f"SELECT id, status, owner, cancel_requested FROM api_jobs WHERE id IN ({','.join('?' for _ in ids)})",
+            ids,
+        ).fetchall()
+        return {r["id"]: (r["status"], r["owner"], bool(r["cancel_requested"])) for r in rows}
+
+    def queued(self, *, created_before: float, exclude_owner: str, limit: int) -> List[JobRecord]:
+        """Queued jobs of other processes waiting since before `created_before`, in lane then age order."""
+        rows = self._conn().execute(
+            "SELECT * FROM api_jobs WHERE status = ? AND cancel_requested = 0 AND created < ? "
+            "AND (owner IS NULL OR owner != ?) "
+            "ORDER BY CASE lane WHEN ? THEN 0 ELSE 1 END, created LIMIT ?",
+            (QUEUED, created_before, exclude_owner, LANE_INTERACTIVE, int(limit)),
+        ).fetchall()
+        return [_row_to_record(r) for r in rows]
+
+    def queued_ahead(self, record: JobRecord) -> int:
+        """Queued jobs (across all processes) that would start before this one."""
+        row = self._conn().execute(
+            "SELECT COUNT(*) FROM api_jobs WHERE status = ? AND id != ? AND cancel_requested = 0 AND "
+            "(CASE lane WHEN ? THEN 0 ELSE 1 END < ? OR (lane = ? AND created < ?))",
+            (QUEUED, record.id, LANE_INTERACTIVE, _LANE_RANK.get(record.lane, 1), record.lane, record.created),
+        ).fetchone()
+        return int(row[0])
+
+    def request_cancel(self, job_id: str) -> Optional[JobRecord]:
+        """Flag a job for cancellation; a queued job is cancelled on the spot."""
+        conn = self._conn()
+        conn.execute("UPDATE api_jobs SET cancel_requested = 1 WHERE id = ? AND status IN (?, ?)", (job_id, QUEUED, RUNNING))
+        conn.execute(
+            "UPDATE api_jobs SET status = ?, finished = ? WHERE id = ? AND status = ?",
+            (CANCELLED, time.time(), job_id, QUEUED),
+        )
+        return self.get(job_id)
+
+    def interrupted(self) -> List[JobRecord]:
+        """Unfinished (queued or running) jobs of any process, oldest first; callers check ownership."""
+        rows = self._conn().execute(
+            "SELECT * FROM api_jobs WHERE status IN (?, ?) ORDER BY created", (QUEUED, RUNNING)
+        ).fetchall()
+        return [_row_to_record(r) for r in rows]
+
+    def requeue(self, job_id: str) -> None:
+        self._conn().execute("UPDATE api_jobs SET status = ?, started = NULL WHERE id = ?", (QUEUED, job_id))
+
+    def append_event(self, job_id: str, event: Dict[str, Any], *, owner: Optional[str] = None) -> int:
+        """Append to the job's event log; returns the event's sequence number (1, 2, ...).
+
+        With `owner`, nothing is written (and 0 returned) unless that process still owns the job.
+        """
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if owner is not None:
+                held = conn.execute("SELECT owner FROM api_jobs WHERE id = ?", (job_id,)).fetchone()
+                if held is None or held["owner"] not in (None, owner):
+                    conn.execute("ROLLBACK")
+                    return 0
+            row = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM api_job_events WHERE job_id = ?", (job_id,)).fetchone()
+            seq = int(row[0]) + 1
+            conn.execute(
+                "INSERT INTO api_job_events(job_id, seq, data, created) VALUES (?, ?, ?, ?)",
+                (job_id, seq, json.dumps(event, ensure_ascii=False), time.time()),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return seq
+
+    def events(self, job_id: str, *, after: int = 0, limit: int = 500) -> List[Tuple[int, Dict[str, Any]]]:
+        rows = self._conn().execute(
+            "SELECT seq, data FROM api_job_events WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+            (job_id, int(after), int(limit)),
+        ).fetchall()
+        return [(int(r["seq"]), json.loads(r["data"])) for r in rows]
+
+    def last_event_id(self, job_id: str) -> int:
+        row = self._conn().execute("SELECT COALESCE(MAX(seq), 0) FROM api_job_events WHERE job_id = ?", (job_id,)).fetchone()
+        return int(row[0])
+
+
+@dataclass
+class JobContext:
+    """What a job runner gets besides its request."""
+
+    job_id: str
+    cancel_event: threading.Event
+    run_dir: Path
+    extra: Dict[str, Any] = field(default_factory=dict)
+    on_event: Optional[Callable[[Dict[str, Any]], int]] = None
+
+    def emit(self, event: Dict[str, Any]) -> int:
+        """Append a progress event to the job's log; observers receive it as it lands."""
+        return self.on_event(event) if self.on_event is not None else 0
+
+
+# runner(request, ctx) -> JSON-able result
+JobRunner = Callable[[Dict[str, Any], JobContext], Any]
+
+
+class JobManager:
+    """Runs API jobs on a bounded background pool and records them in a JobStore.
+
+    Each job kind has a registered runner. Runners should watch ctx.cancel_event and may
+    keep resumable state under ctx.run_dir; `recover()` resubmits jobs that a previous
+    process left unfinished, so a runner that resumes from run_dir picks up where it left off.
+
+    Admission: at most `max_running` jobs run at once and at most `max_per_user` of them
+    belong to one user. Queued jobs start in lane order (interactive before research);
+    within a lane the user with the fewest running and earlier-queued jobs goes first (ties
+    go to whoever has started fewer jobs since the queue was last empty), so one user's
+    burst cannot starve the others. Once `max_queued` jobs are waiting, submit
+    raises QueueFull.
+
+    Requests submitted with a fingerprint are single-flighted: while a job with the same
+    fingerprint is queued or running, later submissions join it (same id, events and
+    result) instead of starting another, and for `cache_seconds` after it succeeds they
+    get its stored result.
+
+    Progress goes through ctx.emit into the job's durable event log. Observers read the
+    log from any position (`events(after=...)`), so any number of them can replay and
+    follow a job without touching the runner. The manager adds {"phase": "job",
+    "status": ...} events when a job starts and when it finishes.
+
+    With a `process_pool` (see job_process.JobProcessPool), runners execute in supervised
+    worker subprocesses instead of the manager's threads; cancelling then kills the worker.
+
+    Several server processes can run managers on one store. Each job is owned by the
+    process that queued (or took over) it, and `maintain()`, run periodically by
+    `start_maintenance`, keeps that ownership consistent: it renews the heartbeat on
+    the process's jobs, applies cancellations requested through other processes, takes
+    over jobs whose owner stopped heartbeating for `lease_seconds`, and, when this
+    process has free slots, takes queued jobs that another process has kept waiting
+    for `steal_after` seconds. Admission limits apply per process.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        *,
+        max_running: int = 4,
+        max_per_user: int = 2,
+        max_queued: int = 100,
+        cache_seconds: float = 0.0,
+        process_pool: Optional[Any] = None,
+        lease_seconds: float = 30.0,
+        steal_after: float = 5.0,
+        owner: Optional[str] = None,
+    ) -> None:
+        self.store = store
+        self.process_pool = process_pool
+        self.lease_seconds = max(1.0, float(lease_seconds))
+        self.steal_after = max(0.0, float(steal_after))
+        self.owner = owner or new_worker_id()
+        self.cache_seconds = max(0.0, float(cache_seconds))
+        self.runners: Dict[str, JobRunner] = {}
+        self.lanes: Dict[str, str] = {}
+        self.runs_root = Path(store.path).parent / "job_runs"
+        self.max_running = max(1, int(max_running))
+        self.max_per_user = max(1, int(max_per_user))
+        self.max_queued = max(0, int(max_queued))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_running, thread_name_prefix="api-job")
+        self._pending: List[JobRecord] = []
+        self._running_by_user: Dict[str, int] = {}
+        self._started_by_user: Dict[str, int] = {}
+        self._running = 0
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._latest_event: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Serializes the find-or-create step so identical concurrent requests share one job
+        self._submit_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._maintenance: Optional[threading.Thread] = None
+
+    def register(self, kind: str, runner: JobRunner, *, lane: str = LANE_RESEARCH) -> None:
+        if lane not in _LANE_RANK:
+            raise ValueError(f"Unknown lane: {lane}")
+        self.runners[kind] = runner
+        self.lanes[kind] = lane
+
+    def submit(
+        self,
+        kind: str,
+        request: Dict[str, Any],
+        *,
+        user: str = DEFAULT_USER,
+        fingerprint: Optional[str] = None,
+    ) -> JobRecord:
+        if kind not in self.runners:
+            raise KeyError(f"Unknown job kind: {kind}")
+        # The write transaction makes find-or-create atomic across server processes too
+        with self._submit_lock, self.store.transaction():
+            if fingerprint:
+                shared = self.store.find_shared(fingerprint, cache_seconds=self.cache_seconds)
+                if shared is not None:
+                    shared.coalesced = True
+                    logger.info("[Jobs] Request joins %s job %s (%s)", shared.kind, shared.id, shared.status)
+                    return shared
+            with self._lock:
+                waiting = len(self._pending)
+                full = waiting >= self.max_queued and self._running >= self.max_running
+            if full:
+                raise QueueFull(f"Job queue is full ({waiting} waiting)")
+            record = self.store.create(
+                kind,
+                request,
+                user=user or DEFAULT_USER,
+                lane=self.lanes[kind],
+                fingerprint=fingerprint,
+                owner=self.owner,
+            )
+        self._enqueue(record)
+        logger.info("[Jobs] Submitted %s job %s for %s (lane=%s)", kind, record.id, record.user, record.lane)
+        return record
+
+    def wait(self, job_id: str, *, timeout: Optional[float] = None, poll_seconds: float = 1.0) -> Optional[JobRecord]:
+        """Block until the job finishes; returns its record (None if unknown), or the live record on timeout."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            record = self.store.get(job_id)
+            if record is None or record.status in FINISHED:
+                return record
+            if deadline is not None and time.monotonic() >= deadline:
+                return record
+            time.sleep(poll_seconds)
+
+    def _enqueue(self, record: JobRecord) -> None:
+        with self._lock:
+            self._cancel_events[record.id] = threading.Event()
+            self._pending.append(record)
+        self._dispatch()
+
+    def _ordered_pending(self) -> List[JobRecord]:
+        """Queued jobs in the order they will start; caller holds the lock."""
+        ordinal: Dict[Tuple[str, str], int] = {}
+        keyed = []
+        for record in sorted(self._pending, key=lambda r: r.created):
+            slot = (record.lane, record.user)
+            n = ordinal.get(slot, 0)
+            ordinal[slot] = n + 1
+            share = self._running_by_user.get(record.user, 0) + n
+            served = self._started_by_user.get(record.user, 0)
+            keyed.append(((_LANE_RANK.get(record.lane, 1), share, served, record.created), record))
+        return [record for _key, record in sorted(keyed, key=lambda kr: kr[0])]
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            while self._running < self.max_running:
+                record = next(
+                    (r for r in self._ordered_pending() if self._running_by_user.get(r.user, 0) < self.max_per_user),
+                    None,
+                )
+                if record is None:
+                    break
+                self._pending.remove(record)
+                self._running += 1
+                self._running_by_user[record.user] = self._running_by_user.get(record.user, 0) + 1
+                self._started_by_user[record.user] = self._started_by_user.get(record.user, 0) + 1
+                self._pool.submit(self._execute, record)
+            if not self._pending:
+                # No contention left; start the next busy period with a clean slate
+                self._started_by_user.clear()
+
+    def position(self, job_id: str) -> Optional[int]:
+        """1-based place in the start order for a queued job; 0 once it is running or done.
+
+        Jobs queued by another process get an estimate from the shared store (lane, then age).
+        """
+        with self._lock:
+            ordered = self._ordered_pending()
+            local = job_id in self._cancel_events
+        for idx, record in enumerate(ordered):
+            if record.id == job_id:
+                return idx + 1
+        if local:
+            # Dispatched here, possibly not yet marked running in the store
+            return 0
+        record = self.store.get(job_id)
+        if record is None:
+            return None
+        return self.store.queued_ahead(record) + 1 if record.status == QUEUED else 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "running": self._running,
+                "max_running": self.max_running,
+                "queued": {lane: sum(1 for r in self._pending if r.lane == lane) for lane in _LANE_RANK},
+                "max_queued": self.max_queued,
+                "running_by_user": dict(self._running_by_user),
+            }
+
+    def _execute(self, record: JobRecord) -> None:
+        with self._lock:
+            cancel_event = self._cancel_events[record.id]
+        try:
+            if not self.store.mark_running(record.id, owner=self.owner):
+                logger.info("[Jobs] Job %s was cancelled or taken over before it started", record.id)
+                return
+            ctx = JobContext(
+                job_id=record.id,
+                cancel_event=cancel_event,
+                run_dir=self.runs_root / record.id,
+                # A runner that lost its job to another process must not write into that job's log
+                on_event=lambda event: self.emit(record.id, event, owner=self.owner),
+            )
+            self.emit(record.id, {"phase": "job", "status": RUNNING, "kind": record.kind}, owner=self.owner)
+            start = time.perf_counter()
+            try:
+                runner = self.runners[record.kind]
+                if self.process_pool is not None:
+                    result = self.process_pool.run(runner, record.request, ctx)
+                else:
+                    result = runner(record.request, ctx)
+            except Exception as e:
+                if cancel_event.is_set():
+                    if self.store.finish(record.id, CANCELLED, error="Cancelled", owner=self.owner):
+                        self.emit(record.id, {"phase": "job", "status": CANCELLED})
+                    logger.info("[Jobs] Job %s cancelled", record.id)
+                else:
+                    logger.exception("[Jobs] Job %s failed: %s", record.id, e)
+                    error = f"{type(e).__name__}: {e}"
+                    if self.store.finish(record.id, FAILED, error=error, owner=self.owner):
+                        self.emit(record.id, {"phase": "job", "status": FAILED, "error": error})
+                return
+            status = CANCELLED if cancel_event.is_set() else SUCCEEDED
+            if not self.store.finish(record.id, status, result=result, owner=self.owner):
+                logger.warning("[Jobs] Job %s was taken over by another process; result discarded", record.id)
+                return
+            self.emit(record.id, {"phase": "job", "status": status})
+            logger.info("[Jobs] Job %s %s in %.1fs", record.id, status, time.perf_counter() - start)
+        finally:
+            with self._lock:
+                self._cancel_events.pop(record.id, None)
+                # Once the job leaves this process the store is the only source of truth
+                self._latest_event.pop(record.id, None)
+                self._running -= 1
+                left = self._running_by_user.get(record.user, 1) - 1
+                if left > 0:
+                    self._running_by_user[record.user] = left
+                else:
+                    self._running_by_user.pop(record.user, None)
+            self._dispatch()
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        return self.store.get(job_id)
+
+    def emit(self, job_id: str, event: Dict[str, Any], *, owner: Optional[str] = None) -> int:
+        """Append an event to the job's log; with `owner`, only while that process owns the job."""
+        try:
+            seq = self.store.append_event(job_id, event, owner=owner)
+        except Exception as e:
+            # Progress reporting must never break the job itself
+            logger.warning("[Jobs] Failed to record event for %s: %s", job_id, e)
+            return 0
+        if not seq:
+            return 0
+        with self._lock:
+            # Cached only while the job runs (or waits) here; other jobs are read from the store
+            if job_id in self._cancel_events:
+                self._latest_event[job_id] = max(seq, self._latest_event.get(job_id, 0))
+        return seq
+
+    def latest_event_id(self, job_id: str) -> int:
+        """Newest event sequence number; answered from memory for jobs run by this process."""
+        with self._lock:
+            seq = self._latest_event.get(job_id)
+        return seq if seq is not None else self.store.last_event_id(job_id)
+
+    def events(self, job_id: str, *, after: int = 0, limit: int = 500) -> List[Tuple[int, Dict[str, Any]]]:
+        return self.store.events(job_id, after=after, limit=limit)
+
+    def cancel(self, job_id: str) -> Optional[JobRecord]:
+        before = self.store.get(job_id)
+        record = self.store.request_cancel(job_id)
+        with self._lock:
+            event = self._cancel_events.get(job_id)
+            queued = next((r for r in self._pending if r.id == job_id), None)
+            if queued is not None:
+                self._pending.remove(queued)
+                self._cancel_events.pop(job_id, None)
+        if event is not None:
+            event.set()
+        if before is not None and before.status == QUEUED and record is not None and record.status == CANCELLED:
+            self.emit(job_id, {"phase": "job", "status": CANCELLED})
+        return record
+
+    def _orphaned(self, record: JobRecord) -> bool:
+        if record.owner is None or record.heartbeat is None:
+            return True
+        if record.heartbeat < time.time() - self.lease_seconds:
+            return True
+        return _owner_exited(record.owner, self.owner)
+
+    def recover(self) -> int:
+        """Take over and resubmit unfinished jobs whose owner process is gone; returns how many."""
+        count = 0
+        for record in self.store.interrupted():
+            if record.owner == self.owner or not self._orphaned(record):
+                continue
+            if not self.store.claim(record.id, self.owner, expected_owner=record.owner):
+                # Another process took it over first
+                continue
+            if record.cancel_requested:
+                self.store.finish(record.id, CANCELLED, error="Cancelled")
+                continue
+            if record.kind not in self.runners:
+                self.store.finish(record.id, FAILED, error="Interrupted by a server restart")
+                continue
+            self.store.requeue(record.id)
+            record.status = QUEUED
+            self._enqueue(record)
+            count += 1
+        if count:
+            logger.info("[Jobs] Resumed %d interrupted job(s)", count)
+        return count
+
+    def _sync(self) -> None:
+        """Apply changes other processes made to this process's jobs."""
+        with self._lock:
+            local = list(self._cancel_events)
+            pending = {r.id for r in self._pending}
+        states = self.store.states(local)
+        for job_id in local:
+            status, owner, cancel_requested = states.get(job_id, (CANCELLED, None, True))
+            if job_id in pending:
+                if status != QUEUED or owner != self.owner:
+                    # Cancelled elsewhere or taken by a process with free slots
+                    with self._lock:
+                        self._pending = [r for r in self._pending if r.id != job_id]
+                        self._cancel_events.pop(job_id, None)
+                        self._latest_event.pop(job_id, None)
+                continue
+            if cancel_requested or (owner is not None and owner != self.owner):
+                with self._lock:
+                    event = self._cancel_events.get(job_id)
+                    if owner != self.owner:
+                        # The new owner appends to the log; a cached sequence number would go stale
+                        self._latest_event.pop(job_id, None)
+                if event is not None and not event.is_set():
+                    if owner != self.owner:
+                        logger.warning("[Jobs] Lost ownership of running job %s to %s; stopping it", job_id, owner)
+                    event.set()
+
+    def _steal(self) -> int:
+        with self._lock:
+            free = self.max_running - self._running - len(self._pending)
+        if free <= 0:
+            return 0
+        count = 0
+        candidates = self.store.queued(created_before=time.time() - self.steal_after, exclude_owner=self.owner, limit=free)
+        for record in candidates:
+            if record.kind not in self.runners:
+                continue
+            if not self.store.claim(record.id, self.owner, expected_owner=record.owner):
+                continue
+            logger.info("[Jobs] Took over queued job %s from %s", record.id, record.owner)
+            record.owner = self.owner
+            self._enqueue(record)
+            count += 1
+        return count
+
+    def maintain(self) -> None:
+        """One round of cross-process upkeep (heartbeat, remote cancels, takeovers)."""
+        self.store.heartbeat(self.owner)
+        self._sync()
+        self.recover()
+        self._steal()
+
+    def start_maintenance(self, interval: float = 5.0) -> None:
+        if self._maintenance is not None:
+            return
+
+        def _loop() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.maintain()
+                except Exception as e:
+                    logger.warning("[Jobs] Maintenance round failed: %s", e)
+
+        self._maintenance = threading.Thread(target=_loop, name="api-job-maintenance", daemon=True)
+        self._maintenance.start()
+
+    def shutdown(self, *, cancel_running: bool = False) -> None:
+        self._stop.set()
+        with self._lock:
+            self._pending.clear()
+            events = list(self._cancel_events.values())
+        if cancel_running:
+            for event in events:
+                event.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
+
+
+def _owner_exited(owner: str, me: str) -> bool:
+    """Whether an owner id (host-pid-suffix) names a process on this host that no longer runs."""
+    host, _, rest = owner.rpartition("-")
+    host, _, pid_text = host.rpartition("-")
+    my_host = me.rpartition("-")[0].rpartition("-")[0]
+    if host != my_host or not pid_text.isdigit():
+        return False
+    pid = int(pid_text)
+    if pid == os.getpid():
+        # Same pid but a different id: an earlier incarnation of this server (e.g. pid 1 in a container)
+        return owner != me
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return False
+    return False
+
+
+_MANAGER: Optional[JobManager] = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)) or default)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+def _running_jobs() -> Dict[Tuple[str, ...], float]:
+    manager = _MANAGER
+    return {(): float(manager.stats()["running"])} if manager is not None else {}
+
+
+def _queued_jobs() -> Dict[Tuple[str, ...], float]:
+    manager = _MANAGER
+    if manager is None:
+        return {}
+    return {(lane,): float(n) for lane, n in manager.stats()["queued"].items()}
+
+
+REGISTRY.gauge("deepresearch_jobs_running", "API jobs running now.", collect=_running_jobs)
+REGISTRY.gauge("deepresearch_jobs_queued", "API jobs waiting for a slot by lane.", ("lane",), collect=_queued_jobs)
+
+
+def get_job_manager() -> JobManager:
+    """Process-wide manager on DEEPRESEARCH_JOB_DB.
+
+    Limits come from DEEPRESEARCH_JOB_WORKERS (jobs running at once),
+    DEEPRESEARCH_JOB_MAX_PER_USER and DEEPRESEARCH_JOB_MAX_QUEUED; finished results are
+    reused for DEEPRESEARCH_JOB_CACHE_SECONDS (0 disables the cache).
+
+    DEEPRESEARCH_JOB_ISOLATION=process runs each job in a worker subprocess limited by
+    DEEPRESEARCH_JOB_MEMORY_MB and DEEPRESEARCH_JOB_CPU_SECONDS (0 means unlimited) and
+    replaced after DEEPRESEARCH_JOB_WORKER_MAX_JOBS jobs.
+
+    Server processes sharing the database take over each other's jobs once the owner has
+    not heartbeated for DEEPRESEARCH_JOB_LEASE_SECONDS.
+    """
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            path = os.getenv("DEEPRESEARCH_JOB_DB") or DEFAULT_JOB_DB
+            process_pool = None
+            if (os.getenv("DEEPRESEARCH_JOB_ISOLATION") or "").lower() == "process":
+                from .job_process import JobProcessPool
+
+                process_pool = JobProcessPool(
+                    memory_limit_mb=_env_int("DEEPRESEARCH_JOB_MEMORY_MB", 0),
+                    cpu_seconds=_env_int("DEEPRESEARCH_JOB_CPU_SECONDS", 0),
+                    max_jobs_per_worker=_env_int("DEEPRESEARCH_JOB_WORKER_MAX_JOBS", 20),
+                )
+            _MANAGER = JobManager(
+                JobStore(path),
+                max_running=_env_int("DEEPRESEARCH_JOB_WORKERS", 4),
+                max_per_user=_env_int("DEEPRESEARCH_JOB_MAX_PER_USER", 2),
+                max_queued=_env_int("DEEPRESEARCH_JOB_MAX_QUEUED", 100),
+                cache_seconds=_env_int("DEEPRESEARCH_JOB_CACHE_SECONDS", 900),
+                process_pool=process_pool,
+                lease_seconds=_env_int("DEEPRESEARCH_JOB_LEASE_SECONDS", 30),
+            )
+        return _MANAGER
+
+
+__all__ = [
+    "JobContext",
+    "JobManager",
+    "JobRecord",
+    "JobStore",
+    "QueueFull",
+    "get_job_manager",
+    "LANE_INTERACTIVE",
+    "LANE_RESEARCH",
+    "QUEUED",
+    "RUNNING",
+    "SUCCEEDED",
+    "FAILED",
+    "CANCELLED",
+    "FINISHED",
+]
@@ -1,4 +1,5 @@
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 try:
@@ -26,8 +27,10 @@ from .prompts import (
     build_judge_user_prompt_with_context,
 )
 from .llm_provider import generate_structured
+from .budget import with_run_budget
 from .tool_llm import generate_structured_with_tools
 from .code_tool import build_run_python_tool_definition, run_python
+from .effort import EffortPolicy
 
 
 class Judge:
@@ -37,13 +40,30 @@ class Judge:
     the first logical flaw and explain why it is a flaw, with no suggestions or extra flaws.
     """
 
-    def __init__(self, model: str = "gpt-5-mini", reasoning_effort: str = "high", timeout: float = 1800.0, max_timeout_retries: int = 2) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-5-mini",
+        reasoning_effort: str = "high",
+        timeout: float = 1800.0,
+        max_timeout_retries: int = 2,
+        effort_policy: Optional[EffortPolicy] = None,
+    ) -> None:
         self.model = model
-        self.reasoning_effort = reasoning_effort
+        self.effort_policy = effort_policy or EffortPolicy.fixed(reasoning_effort)
+        self.reasoning_effort = self.effort_policy.start
         self.timeout = timeout
         self.max_timeout_retries = max(0, int(max_timeout_retries))
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def escalate_effort(self, reason: str) -> bool:
+        """Move to the next reasoning effort if the policy allows it for `reason`."""
+        nxt = self.effort_policy.escalated(self.reasoning_effort, reason)
+        if nxt is None:
+            return False
+        self.logger.info("Escalating judge effort %s -> %s (%s)", self.reasoning_effort, nxt, reason)
+        self.reasoning_effort = nxt
+        return True
+
     def assess(
         self,
         problem: str,
@@ -55,7 +75,6 @@ class Judge:
         literature_results: Optional[list[tuple[str, str]]] = None,
     ) -> JudgeResponse:
         selected_model = model or self.model
-        selected_effort = reasoning_effort or self.reasoning_effort
 
         if literature_annotations is not None and literature_results is not None:
             user_prompt = build_judge_user_prompt_with_context(
@@ -75,6 +94,7 @@ class Judge:
 
         attempt = 0
         while True:
+            selected_effort = reasoning_effort or self.reasoning_effort
             try:
                 self.logger.debug("Judge assess: sending request (attempt %d)", attempt + 1)
                 # Allow code tool for small verification if needed
@@ -96,10 +116,18 @@ class Judge:
                     self.max_timeout_retries + 1,
                     e,
                 )
+                if isinstance(e, APITimeoutError):
+                    self.escalate_effort("timeout")
                 if attempt < self.max_timeout_retries:
                     attempt += 1
                     continue
                 raise
+            except ValueError as e:
+                if attempt < self.max_timeout_retries and self.escalate_effort("parse"):
+                    self.logger.warning("Judge assess parse failure; retrying: %s", e)
+                    attempt += 1
+                    continue
+                raise
 
 
 class FinalJudge:
@@ -160,4 +188,52 @@ class FinalJudge:
                     continue
                 raise
 
+    def tournament(
+        self,
+        problem: str,
+        proofs_markdown: list[str],
+        *,
+        max_workers: int = 8,
+        model: Optional[str] = None,
+        reasoning_effort: Optional[str] = None,
+    ) -> int:
+        """Select the least incorrect proof with a single-elimination tournament.
+
+        Each round pairs up the surviving proofs and runs the pairwise `select` calls
+        concurrently, so n proofs need ceil(log2 n) rounds and never more than two proofs
+        in one prompt. An odd proof out gets a bye. If a match fails, the earlier proof
+        advances. Returns the 0-based index into `proofs_markdown`.
+        """
+        survivors = list(range(len(proofs_markdown)))
+        if not survivors:
+            raise ValueError("tournament requires at least one proof")
+        round_idx = 0
+        while len(survivors) > 1:
+            round_idx += 1
+            matches = [(survivors[i], survivors[i + 1]) for i in range(0, len(survivors) - 1, 2)]
+            bye = survivors[-1] if len(survivors) % 2 else None
+            self.logger.info(
+                "FinalJudge tournament: round %d with %d match(es)%s",
+                round_idx,
+                len(matches),
+                " and a bye" if bye is not None else "",
+            )
 
+            def _play(match: tuple[int, int]) -> int:
+                a, b = match
+                try:
+                    chosen = self.select(
+                        problem,
+                        [proofs_markdown[a], proofs_markdown[b]],
+                        model=model,
+                        reasoning_effort=reasoning_effort,
+                    )
+                except Exception as e:
+                    self.logger.warning("FinalJudge tournament: match %d vs %d failed: %s", a, b, e)
+                    return a
+                return b if chosen == 1 else a
+
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(matches)))) as ex:
+                winners = list(ex.map(with_run_budget(_play), matches))
+            survivors = winners + ([bye] if bye is not None else [])
+        return survivors[0]
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .output_schemas import LiteratureResultItem
+from .similarity import fingerprint, normalize_latex
+
+
+logger = logging.getLogger("backend.literature_index")
+
+# Placeholder URLs that name an input rather than a source
+SEED_URL = "seed://input"
+PROBLEM_URL = "problem://input"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    fp TEXT NOT NULL UNIQUE,
+    statement TEXT NOT NULL,
+    url TEXT NOT NULL,
+    first_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS provenance (
+    item_id INTEGER NOT NULL REFERENCES items(id),
+    seed_fp TEXT NOT NULL,
+    source TEXT NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (item_id, seed_fp)
+);
+CREATE INDEX IF NOT EXISTS provenance_seed ON provenance(seed_fp);
+CREATE TABLE IF NOT EXISTS seeds (
+    seed_fp TEXT PRIMARY KEY,
+    seed TEXT NOT NULL,
+    annotations TEXT NOT NULL DEFAULT '',
+    updated REAL NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(statement, content='items', content_rowid='id');
+"""
+
+_WORD_RE = re.compile(r"[a-z0-9]{3,}")
+# Bumped whenever similarity.fingerprint changes; stored keys are recomputed on open
+_FP_VERSION = 1
+
+
+class LiteratureIndex:
+    """Persistent store of every literature statement gathered across runs.
+
+    Items are keyed by the LaTeX-normalized fingerprint of their statement, so the same
+    result found by different runs is stored once. Each item records which seeds it was
+    gathered for (provenance) and by which step (literature_review, novelty, open_problem).
+    Full-text search uses SQLite FTS5 when available and falls back to LIKE matching.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = str(Path(path).expanduser())
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._lock = Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:
+                logger.warning("[LiteratureIndex] FTS5 unavailable; falling back to LIKE search")
+                self.fts = False
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] < _FP_VERSION:
+                self._rekey()
+                self._conn.execute(f"PRAGMA user_version = {_FP_VERSION}")
+
+    def _rekey(self) -> None:
+        """Recompute stored fingerprints after a change to the statement normalization."""
+        for item_id, statement in self._conn.execute("SELECT id, statement FROM items").fetchall():
+            self._conn.execute("UPDATE OR IGNORE items SET fp = ? WHERE id = ?", (fingerprint(statement), item_id))
+        for old_fp, seed in self._conn.execute("SELECT seed_fp, seed FROM seeds").fetchall():
+            new_fp = fingerprint(seed)
+            if new_fp != old_fp:
+                self._conn.execute("UPDATE OR IGNORE seeds SET seed_fp = ? WHERE seed_fp = ?", (new_fp, old_fp))
+                self._conn.execute("UPDATE OR IGNORE provenance SET seed_fp = ? WHERE seed_fp = ?", (new_fp, old_fp))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def add(
+        self,
+        items: Iterable[LiteratureResultItem],
+        *,
+        seed: str,
+        source: str,
+        annotations: Optional[str] = None,
+    ) -> int:
+        """Record items gathered for `seed`; returns how many statements were new to the index."""
+        seed_fp = fingerprint(seed)
+        now = time.time()
+        added = 0
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO seeds(seed_fp, seed, annotations, updated) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(seed_fp) DO UPDATE SET updated=excluded.updated, "
+                "annotations=CASE WHEN excluded.annotations != '' THEN excluded.annotations ELSE seeds.annotations END",
+                (seed_fp, seed, annotations or "", now),
+            )
+            for item in items:
+                statement = str(getattr(item, "statement", "") or "").strip()
+                url = str(getattr(item, "url", "") or "").strip()
+                if not statement:
+                    continue
+                fp = fingerprint(statement)
+                row = self._conn.execute("SELECT id FROM items WHERE fp = ?", (fp,)).fetchone()
+                if row is None:
+                    cur = self._conn.execute(
+                        "INSERT INTO items(fp, statement, url, first_seen) VALUES (?, ?, ?, ?)",
+                        (fp, statement, url, now),
+                    )
+                    item_id = cur.lastrowid
+                    if self.fts:
+                        self._conn.execute("INSERT INTO items_fts(rowid, statement) VALUES (?, ?)", (item_id, statement))
+                    added += 1
+                else:
+                    item_id = row[0]
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO provenance(item_id, seed_fp, source, ts) VALUES (?, ?, ?, ?)",
+                    (item_id, seed_fp, source, now),
+                )
+        return added
+
+    def for_seed(self, seed: str) -> List[LiteratureResultItem]:
+        """Items previously gathered for this seed, in the order they were first seen."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT i.statement, i.url FROM items i JOIN provenance p ON p.item_id = i.id "
+                "WHERE p.seed_fp = ? ORDER BY i.id",
+                (fingerprint(seed),),
+            ).fetchall()
+        return [LiteratureResultItem(statement=s, url=u) for s, u in rows]
+
+    def coverage(self, seed: str) -> int:
+        """Number of non-placeholder sources recorded for this seed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM items i JOIN provenance p ON p.item_id = i.id "
+                "WHERE p.seed_fp = ? AND i.url NOT IN (?, ?)",
+                (fingerprint(seed), SEED_URL, PROBLEM_URL),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def annotations_for(self, seed: str) -> str:
+        with self._lock:
+            row = self._conn.execute("SELECT annotations FROM seeds WHERE seed_fp = ?", (fingerprint(seed),)).fetchone()
+        return str(row[0]) if row else ""
+
+    def lookup(self, statement: str) -> Optional[LiteratureResultItem]:
+        """Exact (normalized) match of a statement with a real source, if the index has one."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT statement, url FROM items WHERE fp = ? AND url != ?",
+                (fingerprint(statement), PROBLEM_URL),
+            ).fetchone()
+        return LiteratureResultItem(statement=row[0], url=row[1]) if row else None
+
+    def search(self, query: str, limit: int = 20, *, exclude: Sequence[str] = ()) -> List[LiteratureResultItem]:
+        """Full-text search over stored statements, best matches first."""
+        words = list(dict.fromkeys(_WORD_RE.findall(normalize_latex(query))))
+        if not words or limit <= 0:
+            return []
+        skip = set(exclude)
+        with self._lock:
+            if self.fts:
+                match = " OR ".join(f'"{w}"' for w in words[:32])
+                rows = self._conn.execute(
+                    "SELECT i.fp, i.statement, i.url FROM items_fts f JOIN items i ON i.id = f.rowid "
+                    "WHERE items_fts MATCH ? AND i.url NOT IN (?, ?) ORDER BY bm25(items_fts) LIMIT ?",
+                    (match, SEED_URL, PROBLEM_URL, limit + len(skip)),
+                ).fetchall()
+            else:
+                clause = " OR ".join("statement LIKE ?" for _ in words[:16])
+                rows = self._conn.execute(
+                    f"SELECT fp, statement, url FROM items WHERE ({clause}) AND url NOT IN (?, ?) LIMIT ?",
+                    (*[f"%{w}%" for w in words[:16]], SEED_URL, PROBLEM_URL, limit + len(skip)),
+                ).fetchall()
+        out = [LiteratureResultItem(statement=s, url=u) for fp, s, u in rows if fp not in skip]
+        return out[:limit]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            items = self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+            seeds = self._conn.execute("SELECT COUNT(*) FROM seeds").fetchone()[0]
+        return {"items": int(items), "seeds": int(seeds)}
+
+
+def merge_results(
+    *groups: Sequence[LiteratureResultItem],
+) -> Tuple[List[LiteratureResultItem], int]:
+    """Concatenate result lists, dropping repeats by fingerprint; returns (merged, dropped)."""
+    seen: set[str] = set()
+    merged: List[LiteratureResultItem] = []
+    dropped = 0
+    for group in groups:
+        for item in group:
+            fp = fingerprint(getattr(item, "statement", "") or "")
+            if fp in seen:
+                dropped += 1
+                continue
+            seen.add(fp)
+            merged.append(item)
+    return merged, dropped
+
+
+_INDEXES: Dict[str, LiteratureIndex] = {}
+_INDEXES_LOCK = Lock()
+
+
+def open_literature_index(path: Optional[str] = None) -> Optional[LiteratureIndex]:
+    """Shared index at `path` (or DEEPRESEARCH_LIT_INDEX); None when no index is configured."""
+    target = path or os.getenv("DEEPRESEARCH_LIT_INDEX")
+    if not target:
+        return None
+    key = str(Path(target).expanduser().resolve())
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            try:
+                index = LiteratureIndex(key)
+            except Exception as e:
+                logger.warning("[LiteratureIndex] Could not open %s: %s", key, e)
+                return None
+            _INDEXES[key] = index
+        return index
+
+
+__all__ = [
+    "LiteratureIndex",
+    "merge_results",
+    "open_literature_index",
+    "SEED_URL",
+    "PROBLEM_URL",
+]
@@ -1,18 +1,72 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
 import random
 
 from pydantic import BaseModel
 
+from .budget import budget_effort, record_llm_usage
+from .metrics import LLM_REPAIRS, LLM_RETRIES, llm_call, record_tokens
+
+
+_OPENAI_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+
+
+def openai_client(timeout: Optional[float] = None) -> Any:
+    """OpenAI client sharing one connection pool per endpoint across all calls.
+
+    Creating a client per call meant a new TLS handshake for every prover and judge
+    request. Per-call timeouts are applied with with_options, which reuses the pool.
+    """
+    from openai import OpenAI  # type: ignore
+
+    key = (os.getenv("OPENAI_BASE_URL", ""), os.getenv("OPENAI_API_KEY", ""))
+    with _OPENAI_CLIENTS_LOCK:
+        client = _OPENAI_CLIENTS.get(key)
+        if client is None:
+            client = _OPENAI_CLIENTS[key] = OpenAI()
+    return client.with_options(timeout=timeout)
+
 
 @dataclass
 class LLMResponse:
     output_parsed: BaseModel
     output_text: str
+    # {"input_tokens": ..., "output_tokens": ...} when the provider reports usage
+    usage: Dict[str, int] = field(default_factory=dict)
+
+
+def response_usage(resp: Any) -> Dict[str, int]:
+    """Token usage from an OpenAI, Groq or Google response object (empty when unavailable)."""
+    usage = getattr(resp, "usage", None) or getattr(resp, "usage_metadata", None)
+    if usage is None:
+        return {}
+
+    def _first(*names: str) -> int:
+        for name in names:
+            val = getattr(usage, name, None)
+            if isinstance(val, int):
+                return val
+        return 0
+
+    return {
+        "input_tokens": _first("input_tokens", "prompt_tokens", "prompt_token_count"),
+        "output_tokens": _first("output_tokens", "completion_tokens", "candidates_token_count"),
+    }
+
+
+def charge_usage(model: str, resp: Any) -> Dict[str, int]:
+    """Record a response's token usage against the active run budget and return it."""
+    usage = response_usage(resp)
+    if usage:
+        record_llm_usage(model, usage["input_tokens"], usage["output_tokens"])
+        record_tokens(model, usage)
+    return usage
 
 
 class GroqRetriesExhaustedError(RuntimeError):
@@ -48,7 +102,29 @@ def generate_structured(
     - Google: uses google-genai with response_schema=Pydantic model
     - OpenAI-compatible: uses Responses API parse with Pydantic
     """
+    # The response schema identifies the pipeline stage (ProofResponse, JudgeResponse, ...)
+    with llm_call(response_model.__name__, model):
+        return _generate_structured(
+            messages=messages,
+            response_model=response_model,
+            model=model,
+            reasoning_effort=reasoning_effort,
+            timeout=timeout,
+            tools=tools,
+        )
+
+
+def _generate_structured(
+    *,
+    messages: List[Dict[str, Any]],
+    response_model: Type[BaseModel],
+    model: str,
+    reasoning_effort: Optional[str],
+    timeout: Optional[float],
+    tools: Optional[List[Dict[str, Any]]],
+) -> LLMResponse:
     provider = (os.getenv("LLM_PROVIDER", "openai") or "openai").lower()
+    reasoning_effort = budget_effort(reasoning_effort)
     if (model == "openai/gpt-oss-120b") and os.getenv("GROQ_API_KEY"):
         provider = "groq"
 
@@ -72,7 +148,7 @@ def generate_structured(
         if parsed is None:
             # Best-effort: attempt to parse from text using the Pydantic model
             parsed = response_model.model_validate_json(text)
-        return LLMResponse(output_parsed=parsed, output_text=text)
+        return LLMResponse(output_parsed=parsed, output_text=text, usage=charge_usage(model, resp))
 
     if provider == "groq":
         # Use Groq Chat Completions with JSON schema response_format
@@ -118,16 +194,17 @@ def generate_structured(
         while attempt < max_attempts:
             try:
                 resp = client.chat.completions.create(**groq_kwargs)
+                usage = charge_usage(model, resp)
                 text = (getattr(resp.choices[0].message, "content", None) or "")
                 # Try strict JSON then fallback to pydantic JSON parsing; if both fail, retry
                 try:
                     raw = _json.loads(text or "{}")
                     parsed = response_model.model_validate(raw)
-                    return LLMResponse(output_parsed=parsed, output_text=_json.dumps(raw, ensure_ascii=False))
+                    return LLMResponse(output_parsed=parsed, output_text=_json.dumps(raw, ensure_ascii=False), usage=usage)
                 except Exception:
                     try:
                         parsed = response_model.model_validate_json(text)
-                        return LLMResponse(output_parsed=parsed, output_text=text)
+                        return LLMResponse(output_parsed=parsed, output_text=text, usage=usage)
                     except Exception as parse_exc:
                         last_exception = parse_exc
                         # Treat parsing errors as retryable
@@ -149,6 +226,7 @@ def generate_structured(
                             groq_kwargs["messages"] = repair_messages
                             groq_kwargs["max_completion_tokens"] = groq_max_completion_tokens
                             messages_patched = True
+                            LLM_REPAIRS.inc(provider="groq", model=model)
                         attempt += 1
                         time.sleep(1.0)
                         continue
@@ -173,6 +251,8 @@ def generate_structured(
                     groq_kwargs["messages"] = repair_messages
                     groq_kwargs["max_completion_tokens"] = groq_max_completion_tokens
                     messages_patched = True
+                    LLM_REPAIRS.inc(provider="groq", model=model)
+                LLM_RETRIES.inc(provider="groq", model=model)
                 attempt += 1
                 time.sleep(1.0)
         raise GroqRetriesExhaustedError(
@@ -180,7 +260,6 @@ def generate_structured(
         )
 
     # Default: OpenAI-compatible provider (OpenAI or Ollama via base URL)
-    from openai import OpenAI  # type: ignore
     try:  # Best-effort import across SDK versions
         from openai import (
             APITimeoutError,
@@ -196,7 +275,7 @@ def generate_structured(
         InternalServerError = Exception  # type: ignore
         APIStatusError = Exception  # type: ignore
 
-    client = OpenAI(timeout=timeout)
+    client = openai_client(timeout)
     # Simple retry loop for transient/network/server errors
     try:
         max_retries = max(0, int(os.getenv("OPENAI_RETRY_ATTEMPTS", "4")))
@@ -231,11 +310,12 @@ def generate_structured(
             break
         except Exception as e:
             if attempt < max_retries and _should_retry_error(e):
+                LLM_RETRIES.inc(provider="openai", model=model)
                 delay = base_backoff * (2 ** attempt) + random.uniform(0, base_backoff)
                 time.sleep(min(60.0, delay))
                 attempt += 1
                 continue
             raise
-    return LLMResponse(output_parsed=resp.output_parsed, output_text=resp.output_text)
+    return LLMResponse(output_parsed=resp.output_parsed, output_text=resp.output_text, usage=charge_usage(model, resp))
 
 
@@ -29,6 +29,7 @@ class ProverSolverLogManager:
         self._counter = 0
         self._lock = Lock()
         self._pair_loggers: dict[int, _PairLogger] = {}
+        self._cancelled: set[int] = set()
 
     @property
     def is_enabled(self) -> bool:
@@ -41,6 +42,7 @@ class ProverSolverLogManager:
         self._enabled = True
         self._counter = 0
         self._pair_loggers.clear()
+        self._cancelled.clear()
 
     def _folder_for_index(self, index: int) -> Path:
         assert self._base_dir is not None and self._base_stem is not None
@@ -112,6 +114,26 @@ class ProverSolverLogManager:
             text = f"- Judge #2: REJECT (feedback length: {feedback_len or 0})\n\n"
         pl.write(text)
 
+    def write_stagnation(self, index: Optional[int], iteration: int, action: str, feedback_sim: float, proof_sim: float) -> None:
+        if not self.is_enabled or index is None:
+            return
+        pl = self.get_pair_logger(index)
+        pl.write(
+            f"- Stagnation after iteration {iteration}: {action.upper()} "
+            f"(feedback similarity {feedback_sim:.2f}, proof similarity {proof_sim:.2f})\n\n"
+        )
+
+    def write_cancelled(self, index: Optional[int]) -> None:
+        """Mark a pair as cancelled because another pair succeeded (written once per pair)."""
+        if not self.is_enabled or index is None:
+            return
+        with self._lock:
+            if index in self._cancelled:
+                return
+            self._cancelled.add(index)
+        pl = self.get_pair_logger(index)
+        pl.write("=== Cancelled: another pair succeeded ===\n")
+
     # --- Detailed per-iteration logging ---
     def write_iteration_start(self, index: int, iteration: int, proof_markdown: str) -> None:
         """Create/reset Iteration{iteration}.log and write the proof section.
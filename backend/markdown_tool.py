@@ -3,8 +3,11 @@ from __future__ import annotations
 import re
 import shutil
 import subprocess
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
+from .metrics import KATEX_SECONDS
+
 
 def _balanced_delimiters(text: str) -> List[str]:
     errors: List[str] = []
@@ -39,7 +42,9 @@ def _find_math_segments(md: str) -> List[str]:
     return segments
 
 
+@lru_cache(maxsize=1)
 def _katex_available() -> bool:
+    # Probed once per process; installing KaTeX requires a restart to take effect
     if not shutil.which("node"):
         return False
     # Quick probe to see if katex is installed
@@ -86,10 +91,11 @@ def validate_markdown(markdown: str) -> Dict[str, Any]:
 
     katex_ok = _katex_available()
     if katex_ok:
-        for seg in _find_math_segments(markdown):
-            ok, err = _katex_validate(seg)
-            if not ok:
-                errors.append(f"KaTeX error: {err}")
+        with KATEX_SECONDS.time():
+            for seg in _find_math_segments(markdown):
+                ok, err = _katex_validate(seg)
+                if not ok:
+                    errors.append(f"KaTeX error: {err}")
 
     return {"ok": len(errors) == 0, "errors": errors}
 
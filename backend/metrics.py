@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger("backend.metrics")
+
+LabelValues = Tuple[str, ...]
+
+# Seconds: from sub-millisecond local checks up to hour-long reasoning calls
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.025, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _fmt(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Settable value; `collect` callbacks fill it at scrape time instead."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        *,
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self.collect = collect
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    @contextmanager
+    def track(self, **labels: Any) -> Iterator[None]:
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def _samples(self) -> List[str]:
+        values: Dict[LabelValues, float]
+        if self.collect is not None:
+            try:
+                values = dict(self.collect())
+            except Exception as e:
+                logger.debug("Gauge %s collector failed: %s", self.name, e)
+                values = {}
+        else:
+            with self._lock:
+                values = dict(self._values)
+        return [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: (per-bucket counts incl. +Inf, sum, count)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, n = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0, 0)
+            counts[idx] += 1
+            self._values[key] = (counts, total + value, n + 1)
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: Any) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(c), s, n)) for k, (c, s, n) in self._values.items())
+        lines: List[str] = []
+        for key, (counts, total, n) in items:
+            running = 0
+            for bound, c in zip((*self.buckets, float("inf")), counts):
+                running += c
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, ('le', _fmt(bound)))} {running}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_fmt(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {n}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = (), **kwargs: Any) -> Gauge:
+        return self.register(Gauge(name, help_text, labelnames, **kwargs))  # type: ignore[return-value]
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (), **kwargs: Any) -> Histogram:
+        return self.register(Histogram(name, help_text, labelnames, **kwargs))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+LLM_CALLS = REGISTRY.counter(
+    "deepresearch_llm_calls_total", "LLM calls by stage (response schema), model and outcome.", ("stage", "model", "outcome")
+)
+LLM_SECONDS = REGISTRY.histogram(
+    "deepresearch_llm_call_seconds", "Wall time of one LLM call including retries and tool rounds.", ("stage", "model")
+)
+LLM_RETRIES = REGISTRY.counter(
+    "deepresearch_llm_retries_total", "Provider requests retried after a transient error.", ("provider", "model")
+)
+LLM_REPAIRS = REGISTRY.counter(
+    "deepresearch_llm_repairs_total", "Corrective re-prompts after unparseable structured output.", ("provider", "model")
+)
+LLM_TOKENS = REGISTRY.counter("deepresearch_llm_tokens_total", "Tokens reported by providers.", ("model", "direction"))
+SOLVER_RUNS = REGISTRY.counter("deepresearch_solver_runs_total", "Finished Solver.solve runs by outcome.", ("outcome",))
+SOLVER_ITERATIONS = REGISTRY.histogram(
+    "deepresearch_solver_iterations_to_accept",
+    "Prover iterations until both judges accepted.",
+    buckets=(1, 2, 3, 4, 6, 8, 12, 16, 24, 32),
+)
+JUDGE_VERDICTS = REGISTRY.counter(
+    "deepresearch_judge_verdicts_total", "Judge verdicts inside the solver loop.", ("judge", "verdict")
+)
+RUN_PYTHON_SECONDS = REGISTRY.histogram(
+    "deepresearch_run_python_seconds", "run_python tool time executing, and waiting for a slot when slots are capped.", ("phase",)
+)
+RUN_PYTHON_ACTIVE = REGISTRY.gauge("deepresearch_run_python_active", "run_python snippets executing now.")
+KATEX_SECONDS = REGISTRY.histogram("deepresearch_katex_validate_seconds", "KaTeX validation time per markdown document.")
+POOL_BUSY = REGISTRY.gauge("deepresearch_pool_busy", "Busy workers per task-graph stage pool.", ("pool",))
+HTTP_SECONDS = REGISTRY.histogram(
+    "deepresearch_http_request_seconds", "API request latency by route and status.", ("method", "route", "status")
+)
+
+
+@contextmanager
+def llm_call(stage: str, model: str) -> Iterator[None]:
+    """Time one LLM call and count it as ok or error."""
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        LLM_CALLS.inc(stage=stage, model=model, outcome=outcome)
+        LLM_SECONDS.observe(time.perf_counter() - start, stage=stage, model=model)
+
+
+def record_tokens(model: str, usage: Dict[str, int]) -> None:
+    if usage.get("input_tokens"):
+        LLM_TOKENS.inc(usage["input_tokens"], model=model, direction="input")
+    if usage.get("output_tokens"):
+        LLM_TOKENS.inc(usage["output_tokens"], model=model, direction="output")
+
+
+def observe_solver_event(event: str, fields: Dict[str, Any]) -> None:
+    """Fold a Solver progress event into the solver and judge metrics."""
+    if event == "judge":
+        JUDGE_VERDICTS.inc(judge=str(fields.get("judge")), verdict="accept" if fields.get("accepted") else "reject")
+    elif event == "finished":
+        solved = bool(fields.get("solved"))
+        SOLVER_RUNS.inc(outcome="solved" if solved else "unsolved")
+        if solved and fields.get("iterations"):
+            SOLVER_ITERATIONS.observe(float(fields["iterations"]))
+    elif event == "cancelled":
+        SOLVER_RUNS.inc(outcome="cancelled")
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "REGISTRY",
+    "llm_call",
+    "record_tokens",
+    "observe_solver_event",
+    "render_metrics",
+]
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
 import threading
+from typing import Any, Callable, Dict, Optional
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .tool_llm import generate_structured_with_tools
 from .output_schemas import LiteratureReviewResult, LiteratureResultItem
-from .solver import Solver
+from .literature_index import PROBLEM_URL, open_literature_index
+from .similarity import fingerprint
+from .solver import Solver, select_best_failure
+from .portfolio import PortfolioSolver, portfolio_from_env
 from .prompts import (
     OPEN_PROBLEM_CONTEXT_SYSTEM_PROMPT,
     build_open_problem_context_user_prompt,
@@ -33,6 +35,20 @@ def _web_search_tool() -> Dict[str, str]:
 
 
 def _collect_related_results(problem: str, *, model: str, target_results: int) -> LiteratureReviewResult:
+    if target_results > 0:
+        cap = min(MAX_RESULTS_CAP, max(1, target_results))
+    else:
+        cap = MAX_RESULTS_CAP
+    problem_stmt = problem.strip()
+    index = open_literature_index()
+    if index is not None and problem_stmt and index.coverage(problem_stmt) >= cap:
+        local = [x for x in index.for_seed(problem_stmt) if x.url != PROBLEM_URL]
+        logger.info("[OpenProblemSolver] Using %d indexed results for this problem", len(local))
+        return LiteratureReviewResult(
+            annotations=index.annotations_for(problem_stmt),
+            results=[{"statement": problem_stmt, "url": PROBLEM_URL}] + [x.model_dump() for x in local[: cap - 1]],
+        )
+
     messages = [
         {"role": "system", "content": OPEN_PROBLEM_CONTEXT_SYSTEM_PROMPT},
         {"role": "user", "content": build_open_problem_context_user_prompt(problem, target_results)},
@@ -53,21 +69,60 @@ def _collect_related_results(problem: str, *, model: str, target_results: int) -
     )
     lit: LiteratureReviewResult = resp.output_parsed  # type: ignore[assignment]
     results = list(getattr(lit, "results", []) or [])
-    problem_stmt = problem.strip()
     if problem_stmt:
-        seed_item = LiteratureResultItem(statement=problem_stmt, url="problem://input")
+        seed_item = LiteratureResultItem(statement=problem_stmt, url=PROBLEM_URL)
         # Remove any existing duplicates of the problem entry
-        filtered = [item for item in results if getattr(item, "url", "") != "problem://input"]
+        filtered = [item for item in results if getattr(item, "url", "") != PROBLEM_URL]
         results = [seed_item] + filtered
-    if target_results > 0:
-        cap = min(MAX_RESULTS_CAP, max(1, target_results))
-    else:
-        cap = MAX_RESULTS_CAP
+    if index is not None and problem_stmt:
+        try:
+            index.add(results, seed=problem_stmt, source="open_problem", annotations=lit.annotations)
+            # Top up a short web result list with related statements gathered by earlier runs
+            if len(results) < cap:
+                results += index.search(
+                    problem_stmt,
+                    cap - len(results),
+                    exclude=[fingerprint(x.statement) for x in results],
+                )
+        except Exception as e:
+            logger.warning("[OpenProblemSolver] Literature index update failed: %s", e)
     lit.results = results[:cap]
     return lit
 
 
-def run_open_problem_solver(args: Dict[str, Any]) -> Dict[str, Any]:
+def run_open_problem_solver(
+    args: Dict[str, Any],
+    *,
+    on_event: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Dict[str, Any]:
+    """Collect related literature, then race solver pairs on the problem.
+
+    on_event receives phase events ({"phase": "literature" | "solver", ...}); solver
+    events carry the pair index and the Solver event (proof, judge, stagnation,
+    cancelled, stopped, finished). Setting cancel_event stops all pairs at their next
+    checkpoint and returns {"status": "cancelled"}.
+    """
+
+    def _emit(event: Dict[str, Any]) -> None:
+        if on_event is None:
+            return
+        try:
+            on_event(event)
+        except Exception as e:
+            logger.debug("[OpenProblemSolver] on_event hook failed: %s", e)
+
+    def _solver_event(event: Dict[str, Any]) -> None:
+        # Portfolio events already carry their own pair index and arm name; a lone Solver
+        # reports its logging index, which is None when pair logging is off
+        payload = {"phase": "solver", **event}
+        if payload.get("pair") is None:
+            payload["pair"] = 1
+        _emit(payload)
+
+    def _cancelled_result() -> Dict[str, Any]:
+        return {"status": "cancelled", "message": "Cancelled before a proof was accepted."}
+
     problem_raw = str(args.get("problem", ""))
     problem = problem_raw.strip()
     if not problem:
@@ -92,6 +147,7 @@ def run_open_problem_solver(args: Dict[str, Any]) -> Dict[str, Any]:
         target_results_val = DEFAULT_TARGET_RESULTS
     target_results = max(20, min(target_results_val, MAX_RESULTS_CAP))
 
+    _emit({"phase": "literature", "status": "begin", "target": target_results})
     try:
         literature = _collect_related_results(problem, model=search_model, target_results=target_results)
     except Exception as exc:  # pragma: no cover
@@ -100,24 +156,26 @@ def run_open_problem_solver(args: Dict[str, Any]) -> Dict[str, Any]:
             "status": "error",
             "message": f"Failed to collect related results: {type(exc).__name__}: {exc}",
         }
+    _emit({"phase": "literature", "status": "done", "count": len(literature.results)})
+    if cancel_event is not None and cancel_event.is_set():
+        return _cancelled_result()
 
     # Determine parallel pairs for solver runs in open-problem mode.
     # Respect DEEPRESEARCH_SOLVER_PAIRS if set; otherwise default to 3 for open-problem.
+    # With more than one pair, each pair runs a different portfolio configuration.
     try:
         pairs = int(os.getenv("DEEPRESEARCH_SOLVER_PAIRS", "") or "3")
     except Exception:
         pairs = 3
     pairs = max(1, pairs)
 
-    cancel_event = threading.Event()
-
-    def _run_one() -> tuple[bool, str]:
-        s = Solver(model=solver_model)
-        return s.solve(problem, max_iterations, literature, cancel_event=cancel_event)
-
-    if pairs == 1:
+    portfolio_stats: list[Dict[str, Any]] = []
+    _emit({"phase": "solver", "status": "begin", "pairs": pairs})
+    if pairs == 1 and not args.get("portfolio"):
         try:
-            solved, proof_or_feedback = _run_one()
+            solved, proof_or_feedback = Solver(model=solver_model).solve(
+                problem, max_iterations, literature, cancel_event, on_event=_solver_event
+            )
         except Exception as exc:  # pragma: no cover
             logger.exception("[OpenProblemSolver] Solver execution failed: %s", exc)
             return {
@@ -125,46 +183,37 @@ def run_open_problem_solver(args: Dict[str, Any]) -> Dict[str, Any]:
                 "message": f"Solver execution failed: {type(exc).__name__}: {exc}",
             }
     else:
-        results: list[tuple[bool, str]] = []
-        first_success: tuple[bool, str] | None = None
-        ex: ThreadPoolExecutor | None = None
+        arms = portfolio_from_env(solver_model, pairs, args.get("portfolio"))
+        portfolio = PortfolioSolver(
+            arms,
+            max_iterations=max_iterations,
+            stats_path=os.getenv("DEEPRESEARCH_PORTFOLIO_STATS") or None,
+        )
         try:
-            ex = ThreadPoolExecutor(max_workers=pairs)
-            futs = [ex.submit(_run_one) for _ in range(pairs)]
-            for fut in as_completed(futs):
-                try:
-                    ok, payload = fut.result()
-                except Exception as exc:  # pragma: no cover
-                    logger.exception("[OpenProblemSolver] Parallel solver failed: %s", exc)
-                    ok, payload = False, ""
-                results.append((ok, payload))
-                if ok and first_success is None:
-                    first_success = (ok, payload)
-                    # Signal other workers to stop ASAP and cancel pending ones
-                    cancel_event.set()
-                    for other in futs:
-                        if other is not fut:
-                            other.cancel()
-                    break
+            # Diverse configurations race; the first accepted proof wins
+            first_success, results = portfolio.solve(
+                problem,
+                literature,
+                on_event=_solver_event,
+                cancel_event=cancel_event,
+            )
         except Exception as exc:  # pragma: no cover
             logger.exception("[OpenProblemSolver] Parallel execution failed: %s", exc)
             return {
                 "status": "error",
                 "message": f"Parallel execution failed: {type(exc).__name__}: {exc}",
             }
-        finally:
-            if ex is not None:
-                try:
-                    # Do not wait; allow running tasks to see cancel_event and wind down
-                    ex.shutdown(wait=False, cancel_futures=True)
-                except Exception:
-                    pass
+        portfolio_stats = [st.to_dict() for st in portfolio.stats]
+        if first_success is None and cancel_event is not None and cancel_event.is_set():
+            return _cancelled_result()
         if first_success is not None:
             solved, proof_or_feedback = first_success
-        elif results:
-            solved, proof_or_feedback = max(results, key=lambda x: len(x[1] or ""))
         else:
-            solved, proof_or_feedback = False, "No result produced."
+            solved, proof_or_feedback = select_best_failure(problem, portfolio.solvers, results)
+
+    if not solved and cancel_event is not None and cancel_event.is_set():
+        return _cancelled_result()
+    _emit({"phase": "solver", "status": "done", "solved": bool(solved)})
 
     related_payload = [
         {
@@ -175,7 +224,7 @@ def run_open_problem_solver(args: Dict[str, Any]) -> Dict[str, Any]:
     ]
 
     if solved:
-        return {
+        result_ok: Dict[str, Any] = {
             "status": "solved",
             "proof_markdown": proof_or_feedback,
             "annotations": getattr(literature, "annotations", ""),
@@ -184,6 +233,9 @@ def run_open_problem_solver(args: Dict[str, Any]) -> Dict[str, Any]:
             "search_model": search_model_input,
             "max_iterations": max_iterations,
         }
+        if portfolio_stats:
+            result_ok["portfolio"] = portfolio_stats
+        return result_ok
 
     result: Dict[str, Any] = {
         "status": "failed",
@@ -196,6 +248,8 @@ def run_open_problem_solver(args: Dict[str, Any]) -> Dict[str, Any]:
     }
     if proof_or_feedback:
         result["feedback"] = proof_or_feedback
+    if portfolio_stats:
+        result["portfolio"] = portfolio_stats
     return result
 
 
@@ -235,6 +289,20 @@ def build_open_problem_solver_tool_definition() -> Dict[str, Any]:
                     "maximum": 30,
                     "description": "Target number of related results to gather before solving (default 25).",
                 },
+                "portfolio": {
+                    "type": "array",
+                    "description": "Optional solver configurations to run concurrently (defaults to a diverse mix around the prover model).",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "model": {"type": "string"},
+                            "reasoning_effort": {"type": "string", "enum": ["low", "medium", "high"]},
+                            "use_tools": {"type": "boolean"},
+                            "literature_fraction": {"type": "number", "minimum": 0.1, "maximum": 1.0},
+                        },
+                        "additionalProperties": False,
+                    },
+                },
             },
             "required": ["problem"],
             "additionalProperties": False,
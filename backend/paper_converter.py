@@ -35,6 +35,8 @@ from .prompts import (
     build_paper_result_tex_prompt,
 )
 from .tool_llm import generate_structured_with_tools
+from .result_store import load_results
+from .budget import STAGE_NO_NEW_PROOFS, STAGE_SKIP_TIGHTEN, current_run_budget, with_run_budget
 
 
 @dataclass
@@ -138,11 +140,13 @@ class LatexPaperConverter:
         """Convert a JSON file of results into a LaTeX paper folder."""
 
         src_path = Path(json_path).expanduser().resolve()
-        if not src_path.exists():
-            raise FileNotFoundError(f"Input JSON file not found: {src_path}")
-        data = json.loads(src_path.read_text(encoding="utf-8"))
-        if not isinstance(data, list):
-            raise ValueError("Input JSON must be an array of objects")
+        # Accepts the legacy JSON array or the append-only result log next to it
+        try:
+            data = load_results(src_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input JSON file not found: {src_path}") from None
+        except ValueError:
+            raise ValueError("Input JSON must be an array of objects") from None
 
         results = _ensure_results(data)
 
@@ -225,7 +229,8 @@ class LatexPaperConverter:
 
         max_workers = min(8, len(results)) or 1
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(_task, idx, entry): idx for idx, entry in enumerate(results)}
+            task = with_run_budget(_task)
+            futures = {executor.submit(task, idx, entry): idx for idx, entry in enumerate(results)}
             for future in as_completed(futures):
                 idx = futures[future]
                 try:
@@ -263,6 +268,11 @@ class LatexPaperConverter:
             raise ValueError("Label count does not match results count")
 
         labeled_statements = list(zip(labels, (r.statement for r in results)))
+        budget = current_run_budget()
+        if budget is not None and budget.at_least(STAGE_NO_NEW_PROOFS):
+            self.logger.warning("[Paper] Run budget nearly spent; skipping dependency extraction")
+            budget.note_skip("paper dependency extraction", len(results))
+            return [[] for _ in results]
 
         def _task(idx: int, entry: ResultEntry) -> List[PaperDependencyItem]:
             messages = [
@@ -294,7 +304,8 @@ class LatexPaperConverter:
 
         max_workers = min(8, len(results)) or 1
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(_task, idx, entry): idx for idx, entry in enumerate(results)}
+            task = with_run_budget(_task)
+            futures = {executor.submit(task, idx, entry): idx for idx, entry in enumerate(results)}
             for future in as_completed(futures):
                 idx = futures[future]
                 try:
@@ -447,6 +458,11 @@ class LatexPaperConverter:
     ) -> int:
         if not prepared:
             return 0
+        budget = current_run_budget()
+        if budget is not None and budget.at_least(STAGE_SKIP_TIGHTEN):
+            self.logger.info("[Paper] Run budget running low; skipping related-work augmentation")
+            budget.note_skip("related-work bibliography search")
+            return 0
 
         labeled_statements = [(p.latex_label, p.statement) for p in prepared]
         existing_keys = [entry.key for entry in bib_entries.entries]
@@ -575,8 +591,9 @@ class LatexPaperConverter:
 
         max_workers = min(8, len(prepared)) or 1
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            task = with_run_budget(_task)
             futures = {
-                executor.submit(_task, idx, prep): idx for idx, prep in enumerate(prepared)
+                executor.submit(task, idx, prep): idx for idx, prep in enumerate(prepared)
             }
             for future in as_completed(futures):
                 idx = futures[future]
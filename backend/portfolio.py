@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from threading import Event, Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .output_schemas import LiteratureReviewResult
+from .similarity import text_similarity
+from .solver import Solver, race_solvers
+
+
+logger = logging.getLogger("backend.portfolio")
+
+
+@dataclass
+class _ArmUsage:
+    base: int
+    cap: int
+    used: int = 0
+    score: float = 0.0
+    active: bool = True
+
+
+class IterationPool:
+    """Shared pool of prover iterations drawn one at a time by competing solver arms.
+
+    Every arm is guaranteed `base` iterations. Iterations beyond that come from the
+    shared surplus and are only granted while the arm's progress score (an exponential
+    moving average of per-iteration signals in [0, 1]) stays at or above
+    `min_progress`. Budget reserved for arms that finish early is released to the rest.
+    """
+
+    def __init__(self, total: int, *, min_progress: float = 0.25, smoothing: float = 0.5) -> None:
+        self.total = max(0, int(total))
+        self.min_progress = float(min_progress)
+        self.smoothing = min(1.0, max(0.0, float(smoothing)))
+        self._arms: Dict[str, _ArmUsage] = {}
+        self._spent = 0
+        self._lock = Lock()
+
+    def register(self, arm: str, base: int, *, cap: Optional[int] = None) -> None:
+        with self._lock:
+            base = max(0, int(base))
+            self._arms[arm] = _ArmUsage(base=base, cap=max(base, int(cap if cap is not None else self.total)))
+
+    def report(self, arm: str, progress: float) -> None:
+        """Fold one progress signal (0 = stuck on the same flaw, 1 = clear progress) into the arm score."""
+        with self._lock:
+            usage = self._arms.get(arm)
+            if usage is None:
+                return
+            progress = min(1.0, max(0.0, float(progress)))
+            usage.score = self.smoothing * progress + (1.0 - self.smoothing) * usage.score
+
+    def acquire(self, arm: str) -> bool:
+        """Take one iteration for `arm`; False means the arm should stop."""
+        with self._lock:
+            usage = self._arms.get(arm)
+            if usage is None or not usage.active or usage.used >= usage.cap:
+                return False
+            if self._spent >= self.total:
+                return False
+            if usage.used >= usage.base:
+                reserved = sum(
+                    max(0, other.base - other.used)
+                    for name, other in self._arms.items()
+                    if name != arm and other.active
+                )
+                if self.total - self._spent - reserved <= 0 or usage.score < self.min_progress:
+                    return False
+            usage.used += 1
+            self._spent += 1
+            return True
+
+    def release(self, arm: str) -> None:
+        """Mark an arm finished so its unused reservation returns to the surplus."""
+        with self._lock:
+            usage = self._arms.get(arm)
+            if usage is not None:
+                usage.active = False
+
+    def used(self, arm: str) -> int:
+        with self._lock:
+            usage = self._arms.get(arm)
+            return usage.used if usage is not None else 0
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return max(0, self.total - self._spent)
+
+
+@dataclass
+class PortfolioArm:
+    """One solver configuration in the portfolio."""
+
+    name: str
+    model: str
+    reasoning_effort: str = "high"
+    use_tools: Optional[bool] = None
+    # Fraction of the related results handed to this arm (the problem entry is always kept)
+    literature_fraction: float = 1.0
+
+
+@dataclass
+class ArmStats:
+    arm: PortfolioArm
+    iterations: int = 0
+    judge1_accepts: int = 0
+    rejections: int = 0
+    solved: bool = False
+    cancelled: bool = False
+    latency_seconds: float = 0.0
+    _started: float = field(default=0.0, repr=False)
+    _last_feedback: str = field(default="", repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "arm": asdict(self.arm),
+            "iterations": self.iterations,
+            "judge1_accepts": self.judge1_accepts,
+            "rejections": self.rejections,
+            "solved": self.solved,
+            "cancelled": self.cancelled,
+            "latency_seconds": round(self.latency_seconds, 3),
+        }
+
+
+def default_portfolio(model: str, pairs: int, extra_models: Sequence[str] = ()) -> List[PortfolioArm]:
+    """Build `pairs` diverse arms around `model`, followed by one arm per extra model."""
+    base = [
+        PortfolioArm(name="high-tools", model=model, reasoning_effort="high"),
+        PortfolioArm(name="medium-tools", model=model, reasoning_effort="medium"),
+        PortfolioArm(name="high-notools-half-lit", model=model, reasoning_effort="high", use_tools=False, literature_fraction=0.5),
+        PortfolioArm(name="medium-half-lit", model=model, reasoning_effort="medium", literature_fraction=0.5),
+    ]
+    arms: List[PortfolioArm] = []
+    for i in range(max(1, pairs)):
+        tmpl = base[i % len(base)]
+        suffix = f"-{i // len(base) + 1}" if i >= len(base) else ""
+        arms.append(PortfolioArm(**{**asdict(tmpl), "name": tmpl.name + suffix}))
+    for m in extra_models:
+        m = m.strip()
+        if m and m != model:
+            arms.append(PortfolioArm(name=f"{m}-high", model=m, reasoning_effort="high"))
+    return arms
+
+
+def parse_portfolio(spec: Any, model: str) -> List[PortfolioArm]:
+    """Parse an explicit portfolio (list of dicts with model/reasoning_effort/use_tools/literature_fraction)."""
+    arms: List[PortfolioArm] = []
+    for i, item in enumerate(spec or []):
+        if not isinstance(item, dict):
+            continue
+        arm_model = str(item.get("model") or model)
+        effort = str(item.get("reasoning_effort") or "high")
+        arms.append(
+            PortfolioArm(
+                name=str(item.get("name") or f"{arm_model}-{effort}-{i + 1}"),
+                model=arm_model,
+                reasoning_effort=effort,
+                use_tools=item.get("use_tools"),
+                literature_fraction=float(item.get("literature_fraction", 1.0)),
+            )
+        )
+    return arms
+
+
+def literature_subset(lit: LiteratureReviewResult, fraction: float, offset: int = 0) -> LiteratureReviewResult:
+    """Keep the problem entry plus a rotated `fraction` of the remaining related results."""
+    if fraction >= 1.0 or not lit.results:
+        return lit
+    head = [x for x in lit.results if getattr(x, "url", "") == "problem://input"]
+    rest = [x for x in lit.results if getattr(x, "url", "") != "problem://input"]
+    if not rest:
+        return lit
+    keep = max(1, int(round(len(rest) * max(0.0, fraction))))
+    start = (offset * keep) % len(rest)
+    rotated = rest[start:] + rest[:start]
+    return lit.model_copy(update={"results": head + rotated[:keep]})
+
+
+class PortfolioSolver:
+    """Run diverse solver configurations concurrently and steer iterations to the improving ones.
+
+    Arms share an IterationPool: each is guaranteed about half of `max_iterations`, and the
+    rest of the portfolio budget goes to arms whose judge feedback shows progress (Judge #1
+    accepting, or a new flaw instead of the same one). The first accepted proof wins.
+    """
+
+    def __init__(
+        self,
+        arms: Sequence[PortfolioArm],
+        *,
+        max_iterations: int,
+        min_progress: float = 0.25,
+        stats_path: Optional[str] = None,
+    ) -> None:
+        if not arms:
+            raise ValueError("PortfolioSolver requires at least one arm")
+        self.arms = list(arms)
+        self.max_iterations = max(1, int(max_iterations))
+        self.min_progress = min_progress
+        self.stats_path = stats_path
+        self.stats: List[ArmStats] = [ArmStats(arm=a) for a in self.arms]
+        self.solvers: List[Solver] = []
+        self._lock = Lock()
+
+    def _on_event(self, idx: int, pool: IterationPool, event: Dict[str, Any]) -> None:
+        st = self.stats[idx]
+        name = self.arms[idx].name
+        kind = event.get("event")
+        with self._lock:
+            if kind == "proof":
+                st.iterations += 1
+            elif kind == "judge":
+                if event.get("judge") == 1 and event.get("accepted"):
+                    st.judge1_accepts += 1
+                    pool.report(name, 1.0)
+                elif not event.get("accepted"):
+                    st.rejections += 1
+                    fb = str(event.get("feedback") or "")
+                    if event.get("judge") == 1:
+                        # A different flaw means the prover moved on; the same flaw means it is stuck
+                        pool.report(name, 0.5 * (1.0 - text_similarity(fb, st._last_feedback)))
+                    st._last_feedback = fb
+            elif kind in {"finished", "stopped", "cancelled"}:
+                st.latency_seconds = time.monotonic() - st._started
+                st.solved = bool(event.get("solved")) or st.solved
+                st.cancelled = st.cancelled or kind == "cancelled"
+                pool.release(name)
+
+    def _forward(
+        self,
+        idx: int,
+        pool: IterationPool,
+        event: Dict[str, Any],
+        on_event: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> None:
+        self._on_event(idx, pool, event)
+        if on_event is not None:
+            try:
+                on_event({**event, "pair": idx + 1, "arm": self.arms[idx].name})
+            except Exception as e:
+                logger.debug("Portfolio on_event hook failed: %s", e)
+
+    def solve(
+        self,
+        problem: str,
+        literature: Optional[LiteratureReviewResult],
+        *,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[Event] = None,
+    ) -> Tuple[Optional[Tuple[bool, str]], List[Tuple[bool, str]]]:
+        """Race the arms; on_event also receives every solver event tagged with its pair and arm."""
+        base = max(1, self.max_iterations // 2)
+        pool = IterationPool(self.max_iterations * len(self.arms), min_progress=self.min_progress)
+        for arm in self.arms:
+            pool.register(arm.name, base, cap=self.max_iterations * 2)
+
+        def _make(idx: int) -> Solver:
+            arm = self.arms[idx]
+            self.stats[idx]._started = time.monotonic()
+            return Solver(model=arm.model, reasoning_effort=arm.reasoning_effort, use_tools=arm.use_tools)
+
+        def _kwargs(idx: int) -> Dict[str, Any]:
+            arm = self.arms[idx]
+            lit = literature_subset(literature, arm.literature_fraction, idx) if literature is not None else None
+            return {
+                "literature": lit,
+                "max_tries_per_prover": self.max_iterations * 2,
+                "iteration_gate": lambda _i, name=arm.name: pool.acquire(name),
+                "on_event": lambda ev, i=idx: self._forward(i, pool, ev, on_event),
+            }
+
+        first_success, results, self.solvers = race_solvers(
+            _make, problem, len(self.arms), solve_kwargs=_kwargs, cancel_event=cancel_event
+        )
+        if first_success is not None:
+            now = time.monotonic()
+            with self._lock:
+                for st in self.stats:
+                    if not st.latency_seconds:
+                        st.latency_seconds = now - st._started
+                        st.cancelled = not st.solved
+        self._log_stats(problem)
+        return first_success, results
+
+    def _log_stats(self, problem: str) -> None:
+        for st in self.stats:
+            logger.info(
+                "[Portfolio] %s (model=%s, effort=%s, tools=%s, lit=%.2f): iterations=%d judge1_accepts=%d rejections=%d solved=%s cancelled=%s latency=%.1fs",
+                st.arm.name,
+                st.arm.model,
+                st.arm.reasoning_effort,
+                st.arm.use_tools,
+                st.arm.literature_fraction,
+                st.iterations,
+                st.judge1_accepts,
+                st.rejections,
+                st.solved,
+                st.cancelled,
+                st.latency_seconds,
+            )
+        if not self.stats_path:
+            return
+        try:
+            with open(self.stats_path, "a", encoding="utf-8") as f:
+                for st in self.stats:
+                    row = {"ts": time.time(), "problem_chars": len(problem), **st.to_dict()}
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        except Exception as e:
+            logger.warning("[Portfolio] Failed to append stats to %s: %s", self.stats_path, e)
+
+
+def portfolio_from_env(model: str, pairs: int, spec: Any = None) -> List[PortfolioArm]:
+    """Resolve the portfolio: explicit spec first, else defaults plus DEEPRESEARCH_PORTFOLIO_MODELS."""
+    arms = parse_portfolio(spec, model) if spec else []
+    if arms:
+        return arms
+    extra = [m for m in (os.getenv("DEEPRESEARCH_PORTFOLIO_MODELS") or "").split(",") if m.strip()]
+    return default_portfolio(model, pairs, extra)
+
+
+__all__ = [
+    "IterationPool",
+    "PortfolioArm",
+    "PortfolioSolver",
+    "default_portfolio",
+    "literature_subset",
+    "portfolio_from_env",
+]
@@ -27,6 +27,7 @@ from .output_schemas import ProofResponse
 from .llm_provider import generate_structured
 from .tool_llm import generate_structured_with_tools
 from .code_tool import build_run_python_tool_definition, run_python
+from .effort import EffortPolicy
 import logging
 
 
@@ -36,15 +37,78 @@ class Prover:
     Maintains conversation state to enable iterative reproving with feedback.
     """
 
-    def __init__(self, model: str = "gpt-5-mini", reasoning_effort: str = "high", timeout: float = 2400.0, max_timeout_retries: int = 2, use_tools: bool = True) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-5-mini",
+        reasoning_effort: str = "high",
+        timeout: float = 2400.0,
+        max_timeout_retries: int = 2,
+        use_tools: bool = True,
+        effort_policy: Optional[EffortPolicy] = None,
+    ) -> None:
         self.model = model
-        self.reasoning_effort = reasoning_effort
+        self.effort_policy = effort_policy or EffortPolicy.fixed(reasoning_effort)
+        self.reasoning_effort = self.effort_policy.start
         self.timeout = timeout
         self.max_timeout_retries = max(0, int(max_timeout_retries))
         self.use_tools = bool(use_tools)
         self._messages: List[Dict[str, Any]] = []
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def escalate_effort(self, reason: str) -> bool:
+        """Move to the next reasoning effort if the policy allows it for `reason`."""
+        nxt = self.effort_policy.escalated(self.reasoning_effort, reason)
+        if nxt is None:
+            return False
+        self.logger.info("Escalating reasoning effort %s -> %s (%s)", self.reasoning_effort, nxt, reason)
+        self.reasoning_effort = nxt
+        return True
+
+    def _request(self, label: str, selected_model: str, effort_override: Optional[str]) -> Any:
+        attempt = 0
+        while True:
+            selected_effort = effort_override or self.reasoning_effort
+            try:
+                self.logger.debug("LLM request (%s): parse attempt %d", label, attempt + 1)
+                if self.use_tools:
+                    return generate_structured_with_tools(
+                        messages=self._messages,
+                        response_model=ProofResponse,
+                        model=selected_model,
+                        tools=[build_run_python_tool_definition()],
+                        tool_registry={"run_python": lambda args: run_python(**args)},
+                        reasoning_effort=selected_effort,
+                        timeout=self.timeout,
+                    )
+                return generate_structured(
+                    messages=self._messages,
+                    response_model=ProofResponse,
+                    model=selected_model,
+                    reasoning_effort=selected_effort,
+                    timeout=self.timeout,
+                )
+            except (APITimeoutError, APIConnectionError, RateLimitError, InternalServerError, APIStatusError) as e:
+                self.logger.warning(
+                    "LLM request (%s) timed out/connection error on attempt %d/%d: %s",
+                    label,
+                    attempt + 1,
+                    self.max_timeout_retries + 1,
+                    e,
+                )
+                if isinstance(e, APITimeoutError):
+                    self.escalate_effort("timeout")
+                if attempt < self.max_timeout_retries:
+                    attempt += 1
+                    continue
+                raise
+            except ValueError as e:
+                # Structured output could not be parsed; retry only if a higher effort is available
+                if attempt < self.max_timeout_retries and self.escalate_effort("parse"):
+                    self.logger.warning("LLM request (%s) parse failure; retrying: %s", label, e)
+                    attempt += 1
+                    continue
+                raise
+
     def _reset_conversation(self) -> None:
         self._messages = [{"role": "system", "content": PROOF_SYSTEM_PROMPT}]
         self.logger.debug("Conversation reset with system prompt")
@@ -63,7 +127,6 @@ class Prover:
         Returns a ProofResponse with field proof_markdown.
         """
         selected_model = model or self.model
-        selected_effort = reasoning_effort or self.reasoning_effort
 
         self._reset_conversation()
         if literature_annotations is not None and literature_results is not None:
@@ -72,40 +135,7 @@ class Prover:
             prompt = build_proof_user_prompt(question)
         self._messages.append({"role": "user", "content": prompt})
         self.logger.info("LLM request (prove): sending initial prompt (%d bytes)", len(json.dumps(self._messages)))
-        attempt = 0
-        while True:
-            try:
-                self.logger.debug("LLM request (prove): parse attempt %d", attempt + 1)
-                if self.use_tools:
-                    resp = generate_structured_with_tools(
-                        messages=self._messages,
-                        response_model=ProofResponse,
-                        model=selected_model,
-                        tools=[build_run_python_tool_definition()],
-                        tool_registry={"run_python": lambda args: run_python(**args)},
-                        reasoning_effort=selected_effort,
-                        timeout=self.timeout,
-                    )
-                else:
-                    resp = generate_structured(
-                        messages=self._messages,
-                        response_model=ProofResponse,
-                        model=selected_model,
-                        reasoning_effort=selected_effort,
-                        timeout=self.timeout,
-                    )
-                break
-            except (APITimeoutError, APIConnectionError, RateLimitError, InternalServerError, APIStatusError) as e:
-                self.logger.warning(
-                    "LLM request (prove) timed out/connection error on attempt %d/%d: %s",
-                    attempt + 1,
-                    self.max_timeout_retries + 1,
-                    e,
-                )
-                if attempt < self.max_timeout_retries:
-                    attempt += 1
-                    continue
-                raise
+        resp = self._request("prove", selected_model, reasoning_effort)
         proof = resp.output_parsed
         self._messages.append({"role": "assistant", "content": resp.output_text})
         self.logger.info("LLM response (prove): received proof")
@@ -128,7 +158,6 @@ class Prover:
         understanding the existing proof and fixing it according to feedback.
         """
         selected_model = model or self.model
-        selected_effort = reasoning_effort or self.reasoning_effort
 
         # Reset conversation with the re-prove system prompt
         self._messages = [{"role": "system", "content": REPROVE_SYSTEM_PROMPT}]
@@ -147,40 +176,7 @@ class Prover:
             content = base_prompt
         self._messages.append({"role": "user", "content": content})
         self.logger.info("LLM request (reprove): sending reprove prompt (%d bytes)", len(json.dumps(self._messages)))
-        attempt = 0
-        while True:
-            try:
-                self.logger.debug("LLM request (reprove): parse attempt %d", attempt + 1)
-                if self.use_tools:
-                    resp = generate_structured_with_tools(
-                        messages=self._messages,
-                        response_model=ProofResponse,
-                        model=selected_model,
-                        tools=[build_run_python_tool_definition()],
-                        tool_registry={"run_python": lambda args: run_python(**args)},
-                        reasoning_effort=selected_effort,
-                        timeout=self.timeout,
-                    )
-                else:
-                    resp = generate_structured(
-                        messages=self._messages,
-                        response_model=ProofResponse,
-                        model=selected_model,
-                        reasoning_effort=selected_effort,
-                        timeout=self.timeout,
-                    )
-                break
-            except (APITimeoutError, APIConnectionError, RateLimitError, InternalServerError, APIStatusError) as e:
-                self.logger.warning(
-                    "LLM request (reprove) timed out/connection error on attempt %d/%d: %s",
-                    attempt + 1,
-                    self.max_timeout_retries + 1,
-                    e,
-                )
-                if attempt < self.max_timeout_retries:
-                    attempt += 1
-                    continue
-                raise
+        resp = self._request("reprove", selected_model, reasoning_effort)
         proof = resp.output_parsed
         # Track last assistant message for continuity
         self._messages.append({"role": "assistant", "content": resp.output_text})
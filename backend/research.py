@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
 import logging
 
-from .output_schemas import LiteratureReviewResult, PredictedResults, FinalReport, NoveltyCheck
+from .output_schemas import LiteratureReviewResult, LiteratureResultItem, PredictedResults, FinalReport, NoveltyCheck
 from .prompts import (
     LIT_REVIEW_SYSTEM_PROMPT,
     build_lit_review_user_prompt,
@@ -19,6 +19,10 @@ from .tool_llm import generate_structured_with_tools
 from .code_tool import run_python, build_run_python_tool_definition
 from .markdown_tool import validate_markdown, build_validate_markdown_tool_definition
 from .llm_provider import GroqRetriesExhaustedError
+from .effort import EffortPolicy
+from .similarity import cluster_near_duplicates, fingerprint, normalize_latex
+from .literature_index import SEED_URL, merge_results, open_literature_index
+from .budget import current_run_budget, with_run_budget
 
 
 def _python_tool_impl(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -48,14 +52,155 @@ class ResearchConfig:
     novelty_reasoning: str = "medium"
     # Optional directive to steer predictions toward a target research direction
     research_guideline: str | None = None
+    # Adaptive reasoning effort per proving stage: start low, escalate on the policy's escalate_on reasons.
+    # The Prover does not climb on a single rejection (that is what judge feedback is for), only when
+    # the Solver sees the same flaw repeat; add "rejection" to escalate_on to climb on every one.
+    # Judge #1 screens at judge_effort; the confirming Judge #2 always runs at its ceiling.
+    prover_effort: EffortPolicy = field(
+        default_factory=lambda: EffortPolicy(start="medium", escalate_on=("parse", "timeout", "stagnation"))
+    )
+    judge_effort: EffortPolicy = field(default_factory=lambda: EffortPolicy(start="medium"))
+    refiner_effort: EffortPolicy = field(default_factory=lambda: EffortPolicy(start="low", ceiling="medium"))
+    # Bounded worker pools for the streaming novelty -> prove -> refine stages
+    novelty_workers: int = 8
+    prove_workers: int = 12
+    refine_workers: int = 4
+    # Shingle Jaccard at or above which two predictions count as paraphrases (None disables)
+    dedupe_threshold: float | None = 0.6
+    # Persistent literature index shared across runs (falls back to DEEPRESEARCH_LIT_INDEX)
+    literature_index_path: str | None = None
+    # A seed with at least this many indexed sources skips the web literature review
+    min_local_results: int = 8
+    # Extra related statements pulled from the index by full-text search
+    local_related_results: int = 10
+    # Parallel per-seed reviews when only new seeds need context (continuous mode)
+    lit_review_workers: int = 4
+    # Difficulty-aware proving budget: iterations per candidate scale with estimated difficulty,
+    # averaging mean_iterations, and unused or stagnating budget flows to converging candidates
+    adaptive_budget: bool = True
+    mean_iterations: int = 8
+    min_iterations: int = 2
+    max_iterations: int = 16
+
+
+def _joint_seed_key(seeds: list[str]) -> str:
+    """Index key for a literature review of several seeds at once, independent of their order."""
+    return "\n\n".join(sorted(normalize_latex(s) for s in seeds))
 
 
 class ResearchPipeline:
     def __init__(self, config: ResearchConfig | None = None) -> None:
         self.config = config or ResearchConfig()
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.index = open_literature_index(self.config.literature_index_path)
 
     def literature_review(self, seed_result_latex: str | list[str]) -> LiteratureReviewResult:
+        """Gather related results for the seeds, from the local index first and the web for the rest."""
+        if self.index is None:
+            return self._literature_review_web(seed_result_latex)
+        seeds = [seed_result_latex] if isinstance(seed_result_latex, str) else list(seed_result_latex)
+        covered = [s for s in seeds if self.index.coverage(s) >= self.config.min_local_results]
+        missing = [s for s in seeds if s not in covered]
+        self.logger.info(
+            "[Research] Literature index: %d/%d seeds covered locally (%s)",
+            len(covered),
+            len(seeds),
+            self.index.stats(),
+        )
+
+        annotations: list[str] = []
+        groups: list[list[LiteratureResultItem]] = []
+        # A joint review cannot attribute items to individual seeds, so it is stored under the
+        # seed set as a whole: it serves the same set again but covers none of its seeds alone
+        review_key = missing[0] if len(missing) == 1 else _joint_seed_key(missing)
+        if len(missing) > 1 and self.index.coverage(review_key) >= self.config.min_local_results:
+            groups.append(self.index.for_seed(review_key))
+            ann = self.index.annotations_for(review_key)
+            if ann:
+                annotations.append(ann)
+        elif missing:
+            web = self._literature_review_web(missing[0] if isinstance(seed_result_latex, str) else missing)
+            web_results = list(web.results or [])
+            if web.annotations:
+                annotations.append(web.annotations)
+            groups.append(web_results)
+            try:
+                self.index.add(web_results, seed=review_key, source="literature_review", annotations=web.annotations)
+            except Exception as e:
+                self.logger.warning("[Research] Literature index update failed: %s", e)
+        for s in covered:
+            groups.append(self.index.for_seed(s))
+            ann = self.index.annotations_for(s)
+            if ann and ann not in annotations:
+                annotations.append(ann)
+        merged, _ = merge_results(*groups)
+        related = self.index.search(
+            "\n".join(seeds),
+            self.config.local_related_results,
+            exclude=[fingerprint(x.statement) for x in merged],
+        )
+        merged.extend(related)
+        self.logger.info(
+            "[Research] Literature review: done (%d results; web seeds=%d, local seeds=%d, related from index=%d)",
+            len(merged),
+            len(missing),
+            len(covered),
+            len(related),
+        )
+        return LiteratureReviewResult(
+            annotations="\n\n".join(annotations),
+            results=[x.model_dump() for x in merged],
+        )
+
+    def incremental_literature_review(
+        self,
+        prev: LiteratureReviewResult | None,
+        new_seeds: list[str],
+    ) -> LiteratureReviewResult:
+        """Extend an earlier literature context with reviews of new seeds only.
+
+        Each new seed is reviewed on its own, in parallel, and merged into `prev` with results
+        deduplicated by fingerprint and annotation paragraphs deduplicated by normalized text.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if prev is None:
+            return self.literature_review(new_seeds)
+        if not new_seeds:
+            return prev
+        self.logger.info("[Research] Incremental literature review: %d new seeds", len(new_seeds))
+        workers = max(1, min(self.config.lit_review_workers, len(new_seeds)))
+        reviews: list[LiteratureReviewResult] = []
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            review = with_run_budget(self.literature_review)
+            for fut in [ex.submit(review, s) for s in new_seeds]:
+                try:
+                    reviews.append(fut.result())
+                except Exception as e:
+                    self.logger.warning("[Research] Literature review failed for a new seed; skipping: %s", e)
+        # prev may itself hold repeats (e.g. from an older run); count new items against its deduplicated form
+        base, _ = merge_results(list(prev.results or []))
+        merged, dropped = merge_results(base, *[list(r.results or []) for r in reviews])
+        paragraphs: list[str] = []
+        seen: set[str] = set()
+        for text in [prev.annotations] + [r.annotations for r in reviews]:
+            for para in (text or "").split("\n\n"):
+                key = fingerprint(para)
+                if para.strip() and key not in seen:
+                    seen.add(key)
+                    paragraphs.append(para.strip())
+        self.logger.info(
+            "[Research] Incremental literature review: done (%d results, +%d new, %d duplicates dropped)",
+            len(merged),
+            len(merged) - len(base),
+            dropped,
+        )
+        return LiteratureReviewResult(
+            annotations="\n\n".join(paragraphs),
+            results=[x.model_dump() for x in merged],
+        )
+
+    def _literature_review_web(self, seed_result_latex: str | list[str]) -> LiteratureReviewResult:
         self.logger.info("[Research] Literature review: start (seed length %d)", len(seed_result_latex))
         messages = [
             {"role": "system", "content": LIT_REVIEW_SYSTEM_PROMPT},
@@ -160,41 +305,92 @@ class ResearchPipeline:
                 # Non-empty/other errors bubble up
                 raise
 
+    def check_novelty(self, lit: LiteratureReviewResult, stmt: str) -> tuple[str, bool, str | None, str | None]:
+        """Run one web-search novelty check; returns (statement, is_novel, matched_statement, matched_url)."""
+        if self.index is not None:
+            known = self.index.lookup(stmt)
+            if known is not None:
+                self.logger.info("[Research] Novelty: known from local index (%s)", known.url)
+                return stmt, False, known.statement, known.url
+        budget = current_run_budget()
+        if budget is not None and not budget.allows("proof"):
+            # Nothing found novel now could still be proved, so the web check is wasted
+            budget.note_skip("novelty checks (and the proofs they would lead to)")
+            return stmt, False, None, None
+        messages = [
+            {"role": "system", "content": NOVELTY_SYSTEM_PROMPT},
+            {"role": "user", "content": build_novelty_user_prompt(lit.annotations, stmt)},
+        ]
+        try:
+            resp = generate_structured_with_tools(
+                messages=messages,
+                response_model=NoveltyCheck,
+                model=self.config.novelty_model,
+                tools=[_web_search_tool_for_model(self.config.novelty_model)],
+                tool_registry={},
+                reasoning_effort=self.config.novelty_reasoning,
+                timeout=900.0,
+            )
+        except GroqRetriesExhaustedError:
+            # If novelty check fails globally by retries, mark as not novel to skip proving
+            return stmt, False, None, None
+        parsed = resp.output_parsed  # type: ignore[assignment]
+        is_novel = bool(getattr(parsed, "is_novel", False))
+        matched_stmt = getattr(parsed, "matched_statement", None)
+        matched_url = getattr(parsed, "matched_url", None)
+        return stmt, is_novel, matched_stmt, matched_url
+
+    def record_known_result(self, lit: LiteratureReviewResult, matched_stmt: str | None, matched_url: str | None) -> bool:
+        """Append a known result found by the novelty checker to the literature context, like Literature Review."""
+        if not matched_stmt or matched_url is None:
+            return False
+        try:
+            item = LiteratureResultItem(statement=str(matched_stmt), url=str(matched_url))
+            fp = fingerprint(item.statement)
+            if any(fingerprint(x.statement) == fp for x in lit.results):
+                return False
+            lit.results.append(item)
+        except Exception:
+            # Be resilient if schema shape changes; skip append on error
+            return False
+        if self.index is not None:
+            # Attribute the known result to the run's seed (the first seed entry of the context)
+            seed_item = next((x for x in lit.results if x.url == SEED_URL), lit.results[0])
+            try:
+                self.index.add([item], seed=seed_item.statement, source="novelty")
+            except Exception as e:
+                self.logger.warning("[Research] Literature index update failed: %s", e)
+        return True
+
+    def dedupe_predictions(self, statements: list[str]) -> list[str]:
+        """Collapse near-duplicate predictions to one representative each (the first occurrence)."""
+        threshold = self.config.dedupe_threshold
+        if not threshold or len(statements) < 2:
+            return list(statements)
+        clusters = cluster_near_duplicates(statements, threshold=threshold)
+        merged = [c for c in clusters if len(c) > 1]
+        self.logger.info(
+            "[Research] Dedupe: %d predictions -> %d clusters (merged clusters=%d, largest=%d, dropped=%d)",
+            len(statements),
+            len(clusters),
+            len(merged),
+            max((len(c) for c in clusters), default=0),
+            len(statements) - len(clusters),
+        )
+        for c in merged:
+            self.logger.debug("[Research] Dedupe cluster %s -> kept #%d", c, c[0])
+        return [statements[c[0]] for c in clusters]
+
     def novelty_filter(self, lit: LiteratureReviewResult, preds: PredictedResults) -> list[str]:
         """Run the novelty checker per predicted result with web_search tool in parallel; keep only novel results."""
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        tools = [_web_search_tool_for_model(self.config.novelty_model)]
-        registry: dict[str, Any] = {}
-
-        def _check(stmt: str) -> tuple[str, bool, str | None, str | None]:
-            messages = [
-                {"role": "system", "content": NOVELTY_SYSTEM_PROMPT},
-                {"role": "user", "content": build_novelty_user_prompt(lit.annotations, stmt)},
-            ]
-            try:
-                resp = generate_structured_with_tools(
-                    messages=messages,
-                    response_model=NoveltyCheck,
-                    model=self.config.novelty_model,
-                    tools=tools,
-                    tool_registry=registry,
-                    reasoning_effort=self.config.novelty_reasoning,
-                    timeout=900.0,
-                )
-            except GroqRetriesExhaustedError:
-                # If novelty check fails globally by retries, mark as not novel to skip proving
-                return stmt, False, None, None
-            parsed = resp.output_parsed  # type: ignore[assignment]
-            is_novel = bool(getattr(parsed, "is_novel", False))
-            matched_stmt = getattr(parsed, "matched_statement", None)
-            matched_url = getattr(parsed, "matched_url", None)
-            return stmt, is_novel, matched_stmt, matched_url
-
         kept: list[str] = []
         appended_non_novel = 0
-        with ThreadPoolExecutor(max_workers=8) as ex:
-            futures = {ex.submit(_check, s): s for s in preds.predicted_results}
+        candidates = self.dedupe_predictions(list(preds.predicted_results))
+        with ThreadPoolExecutor(max_workers=self.config.novelty_workers) as ex:
+            check = with_run_budget(self.check_novelty)
+            futures = {ex.submit(check, lit, s): s for s in candidates}
             for fut in as_completed(futures):
                 try:
                     stmt, is_novel, matched_stmt, matched_url = fut.result()
@@ -203,19 +399,13 @@ class ResearchPipeline:
                     continue
                 if is_novel:
                     kept.append(stmt)
-                else:
+                elif self.record_known_result(lit, matched_stmt, matched_url):
                     # If not novel and we have a matched known result with source, append it like Literature Review
-                    if matched_stmt and matched_url is not None:
-                        try:
-                            lit.results.append(type(lit.results[0])(statement=str(matched_stmt), url=str(matched_url)))
-                            appended_non_novel += 1
-                        except Exception:
-                            # Be resilient if schema shape changes; skip append on error
-                            pass
+                    appended_non_novel += 1
         self.logger.info(
             "[Research] Novelty check: kept %d/%d results (appended known=%d)",
             len(kept),
-            len(preds.predicted_results),
+            len(candidates),
             appended_non_novel,
         )
         return kept
@@ -228,7 +418,22 @@ class ResearchPipeline:
         """Use an LLM to compile a beautiful KaTeX Markdown report from literature context and new results.
 
         compiled_results: list of (new_result_latex, proof_markdown)
+
+        Under a run budget the report is always produced and ends with a section stating the
+        budget and what was skipped to stay within it.
         """
+        report = self._compile_final_report(lit, compiled_results)
+        budget = current_run_budget()
+        if budget is None:
+            return report
+        md = (getattr(report, "report_markdown", "") or "").rstrip()
+        return FinalReport(report_markdown=md + "\n\n" + budget.summary_markdown())
+
+    def _compile_final_report(
+        self,
+        lit: LiteratureReviewResult,
+        compiled_results: list[tuple[str, str]],
+    ) -> FinalReport:
         self.logger.info(
             "[Research] Final report: start (lit results=%d, new results=%d)",
             len(lit.results),
@@ -15,6 +15,8 @@ from .prompts import (
 )
 from .output_schemas import ResultRefinementResponse, RefineTightenResult
 from .llm_provider import generate_structured
+from .effort import EffortPolicy
+from .budget import current_run_budget
 import logging
 
 
@@ -29,17 +31,33 @@ class ResultRefiner:
     Returns either (new_statement, new_proof_markdown) when changed, or None when no change is required.
     """
 
-    def __init__(self, model: str = "gpt-5", reasoning_effort: str = "medium", timeout: float = 900.0, max_timeout_retries: int = 2) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-5",
+        reasoning_effort: str = "medium",
+        timeout: float = 900.0,
+        max_timeout_retries: int = 2,
+        effort_policy: Optional[EffortPolicy] = None,
+    ) -> None:
         self.model = model
-        self.reasoning_effort = reasoning_effort
+        self.effort_policy = effort_policy or EffortPolicy.fixed(reasoning_effort)
+        self.reasoning_effort = self.effort_policy.start
         self.timeout = timeout
         self.max_timeout_retries = max(0, int(max_timeout_retries))
         self.logger = logging.getLogger(self.__class__.__name__)
         self._messages = []
 
+    def escalate_effort(self, reason: str) -> bool:
+        """Move to the next reasoning effort if the policy allows it for `reason`."""
+        nxt = self.effort_policy.escalated(self.reasoning_effort, reason)
+        if nxt is None:
+            return False
+        self.logger.info("Escalating refiner effort %s -> %s (%s)", self.reasoning_effort, nxt, reason)
+        self.reasoning_effort = nxt
+        return True
+
     def refine(self, statement: str, proof_markdown: str, *, model: Optional[str] = None, reasoning_effort: Optional[str] = None) -> Optional[Tuple[str, str]]:
         selected_model = model or self.model
-        selected_effort = reasoning_effort or self.reasoning_effort
 
         # Reset conversation with system prompt
         self._messages = [{"role": "system", "content": RESULT_REFINER_SYSTEM_PROMPT}]
@@ -49,6 +67,7 @@ class ResultRefiner:
         self.logger.info("LLM request (refine): sending refinement prompt (%d bytes)", len(json.dumps(self._messages)))
         attempt = 0
         while True:
+            selected_effort = reasoning_effort or self.reasoning_effort
             try:
                 self.logger.debug("LLM request (refine): parse attempt %d", attempt + 1)
                 resp = generate_structured(
@@ -66,10 +85,18 @@ class ResultRefiner:
                     self.max_timeout_retries + 1,
                     e,
                 )
+                if isinstance(e, APITimeoutError):
+                    self.escalate_effort("timeout")
                 if attempt < self.max_timeout_retries:
                     attempt += 1
                     continue
                 raise
+            except ValueError as e:
+                if attempt < self.max_timeout_retries and self.escalate_effort("parse"):
+                    self.logger.warning("LLM request (refine) parse failure; retrying: %s", e)
+                    attempt += 1
+                    continue
+                raise
 
         result: ResultRefinementResponse = resp.output_parsed
         # Track assistant message for continuity
@@ -82,7 +109,11 @@ class ResultRefiner:
 
     def tighten(self, statement: str, proof_markdown: str, *, model: Optional[str] = None, reasoning_effort: Optional[str] = None) -> Optional[Tuple[str, str]]:
         selected_model = model or self.model
-        selected_effort = reasoning_effort or self.reasoning_effort
+        budget = current_run_budget()
+        if budget is not None and not budget.allows("tighten"):
+            self.logger.info("Skipping tighten: run budget running low")
+            budget.note_skip("tightening passes")
+            return None
 
         # Reset conversation with tightening system prompt
         self._messages = [{"role": "system", "content": TIGHTEN_SYSTEM_PROMPT}]
@@ -92,6 +123,7 @@ class ResultRefiner:
         self.logger.info("LLM request (tighten): sending tightening prompt (%d bytes)", len(json.dumps(self._messages)))
         attempt = 0
         while True:
+            selected_effort = reasoning_effort or self.reasoning_effort
             try:
                 self.logger.debug("LLM request (tighten): parse attempt %d", attempt + 1)
                 resp = generate_structured(
@@ -109,10 +141,18 @@ class ResultRefiner:
                     self.max_timeout_retries + 1,
                     e,
                 )
+                if isinstance(e, APITimeoutError):
+                    self.escalate_effort("timeout")
                 if attempt < self.max_timeout_retries:
                     attempt += 1
                     continue
                 raise
+            except ValueError as e:
+                if attempt < self.max_timeout_retries and self.escalate_effort("parse"):
+                    self.logger.warning("LLM request (tighten) parse failure; retrying: %s", e)
+                    attempt += 1
+                    continue
+                raise
 
         result: RefineTightenResult = resp.output_parsed
         # Track assistant message for continuity
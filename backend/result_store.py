@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional
+
+from .similarity import fingerprint
+
+try:  # POSIX advisory locks guard appends from concurrent processes
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger("backend.result_store")
+
+DEFAULT_COMPACT_EVERY = 10
+
+
+def _paths(path: str | os.PathLike[str]) -> tuple[Path, Path]:
+    """(jsonl log, legacy json array) for a path given as either form."""
+    p = Path(path).expanduser().resolve()
+    if p.suffix == ".jsonl":
+        return p, p.with_suffix(".json")
+    return p.with_suffix(".jsonl"), p
+
+
+def _read_array(path: Path) -> List[Dict[str, Any]]:
+    try:
+        raw = path.read_text(encoding="utf-8")
+        data = json.loads(raw) if raw.strip() else []
+    except Exception:
+        return []
+    return [x for x in data if isinstance(x, dict)] if isinstance(data, list) else []
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class ResultStore:
+    """Append-only JSONL log of accepted results with a legacy JSON array snapshot.
+
+    Every append is a single fsync'd line written under a process lock and an advisory
+    file lock, so concurrent writers never interleave and a crash loses at most the line
+    being written (torn lines are skipped on read). Records are indexed by statement
+    fingerprint; a later record for the same statement supersedes the earlier one. The
+    legacy array (`correct_predicted_results.json`) is rewritten atomically every
+    `compact_every` appends and on `compact()`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, compact_every: int = DEFAULT_COMPACT_EVERY) -> None:
+        self.log_path, self.array_path = _paths(path)
+        self.compact_every = max(0, int(compact_every))
+        self._lock = Lock()
+        self._since_compact = 0
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.log_path.exists() and self.array_path.exists():
+            # Adopt an existing legacy array so earlier results stay in the store
+            legacy = _read_array(self.array_path)
+            with self._locked():
+                if not self.log_path.exists():
+                    self._write_lines(legacy, mode="w")
+            logger.info("[ResultStore] Imported %d legacy results from %s", len(legacy), self.array_path)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            lock_file = open(self.log_path.with_name(self.log_path.name + ".lock"), "a")
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                lock_file.close()
+
+    def _write_lines(self, records: List[Dict[str, Any]], *, mode: str) -> None:
+        lines = []
+        for rec in records:
+            stmt = str(rec.get("statement", ""))
+            lines.append(
+                json.dumps(
+                    {
+                        "statement": stmt,
+                        "proof_markdown": str(rec.get("proof_markdown", "")),
+                        "fp": fingerprint(stmt),
+                        "ts": rec.get("ts") or time.time(),
+                    },
+                    ensure_ascii=False,
+                )
+                + "\n"
+            )
+        if mode == "w":
+            _write_atomic(self.log_path, "".join(lines))
+            return
+        with open(self.log_path, "ab") as f:
+            # A crash can leave a partial last line; start on a fresh line so this record survives
+            if f.tell() > 0:
+                with open(self.log_path, "rb") as r:
+                    r.seek(-1, os.SEEK_END)
+                    if r.read(1) != b"\n":
+                        lines.insert(0, "\n")
+            f.write("".join(lines).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append(self, statement: str, proof_markdown: str) -> None:
+        with self._locked():
+            self._write_lines([{"statement": statement, "proof_markdown": proof_markdown}], mode="a")
+            self._since_compact += 1
+            due = self.compact_every and self._since_compact >= self.compact_every
+        if due:
+            self.compact()
+
+    def _read_log(self) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crash
+                    if isinstance(rec, dict) and rec.get("statement"):
+                        records.append(rec)
+        except FileNotFoundError:
+            pass
+        return records
+
+    def index(self) -> Dict[str, Dict[str, Any]]:
+        """Latest record per statement fingerprint, in order of first appearance."""
+        out: Dict[str, Dict[str, Any]] = {}
+        for rec in self._read_log():
+            # Recomputed rather than trusting the stored "fp": logs written before the
+            # normalization kept relations merged statements such as x > 1 and x < 1
+            fp = fingerprint(rec["statement"])
+            if fp in out:
+                out[fp].update(rec)
+            else:
+                out[fp] = dict(rec)
+        return out
+
+    def get(self, statement: str) -> Optional[Dict[str, Any]]:
+        return self.index().get(fingerprint(statement))
+
+    def results(self) -> List[Dict[str, str]]:
+        """Deduplicated results in the legacy {statement, proof_markdown} shape."""
+        return [
+            {"statement": r["statement"], "proof_markdown": str(r.get("proof_markdown", ""))}
+            for r in self.index().values()
+        ]
+
+    def compact(self) -> int:
+        """Rewrite the log without superseded records and refresh the legacy array; returns the count."""
+        with self._locked():
+            records = list(self.index().values())
+            self._write_lines(records, mode="w")
+            legacy = [{"statement": r["statement"], "proof_markdown": str(r.get("proof_markdown", ""))} for r in records]
+            _write_atomic(self.array_path, json.dumps(legacy, indent=2, ensure_ascii=False))
+            self._since_compact = 0
+        return len(records)
+
+    def rewrite(self, results: List[Dict[str, Any]]) -> int:
+        """Replace the whole store (e.g. after refining every entry) and compact."""
+        with self._locked():
+            self._write_lines(results, mode="w")
+        return self.compact()
+
+
+_STORES: Dict[Path, ResultStore] = {}
+_STORES_LOCK = Lock()
+
+
+def open_result_store(path: str | os.PathLike[str]) -> ResultStore:
+    """Shared store for `path` (either the .json array or the .jsonl log)."""
+    key = _paths(path)[0]
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = ResultStore(key)
+            _STORES[key] = store
+        return store
+
+
+def load_results(path: str | os.PathLike[str]) -> List[Dict[str, Any]]:
+    """Read results from a store log when one exists, else from a legacy JSON array."""
+    log_path, array_path = _paths(path)
+    if log_path.exists():
+        return open_result_store(log_path).results()
+    if not array_path.exists():
+        raise FileNotFoundError(f"Results file not found: {Path(path)}")
+    raw = array_path.read_text(encoding="utf-8")
+    data = json.loads(raw) if raw.strip() else []
+    if not isinstance(data, list):
+        raise ValueError("JSON root must be a list")
+    return data
+
+
+__all__ = ["ResultStore", "open_result_store", "load_results"]
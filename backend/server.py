@@ -3,8 +3,11 @@ from __future__ import annotations
 import os
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
-from .api import router as api_router
+from .api import router as api_router, job_manager
+from .metrics import HTTP_SECONDS, render_metrics
+from .warmup import STATE as WARMUP, start_warmup
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -26,8 +29,19 @@ def _configure_logging() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # type: ignore[override]
+    # Jobs left unfinished by a previous process resume from their run directories
+    # With several workers on one job database, the maintenance loop also hands jobs of
+    # crashed workers to survivors and applies cancellations received by other workers
+    try:
+        job_manager().recover()
+        job_manager().start_maintenance()
+    except Exception as e:  # pragma: no cover
+        logger.warning("Failed to resume interrupted jobs: %s", e)
+    # /ready stays 503 until preloading, client and sandbox warm-up have finished
+    start_warmup()
     logger.info("API startup complete")
     yield
+    job_manager().shutdown()
     logger.info("API shutdown complete")
 
 
@@ -53,9 +67,21 @@ def create_app() -> FastAPI:
             logger.exception("!! %s %s failed in %.1f ms: %s", request.method, request.url.path, dur_ms, e)
             raise
         dur_ms = (time.perf_counter() - start) * 1000.0
+        # Label by route template (/jobs/{job_id}) so per-job paths do not explode the label set
+        route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+        HTTP_SECONDS.observe(dur_ms / 1000.0, method=request.method, route=route, status=getattr(response, "status_code", 0))
         logger.info("<- %s %s %s in %.1f ms", request.method, request.url.path, getattr(response, "status_code", "-"), dur_ms)
         return response
 
+    @app.get("/ready", include_in_schema=False)
+    async def ready() -> JSONResponse:
+        snapshot = WARMUP.snapshot()
+        return JSONResponse(snapshot, status_code=200 if snapshot["ready"] else 503)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
     app.include_router(api_router)
     return app
 
@@ -64,11 +90,14 @@ app = create_app()
 
 
 if __name__ == "__main__":  # pragma: no cover
-    # Run with: python -m backend.server or uvicorn backend.server:app --reload
+    # Run with: python -m backend.server or uvicorn backend.server:app --workers N
     import uvicorn
 
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
-    uvicorn.run("backend.server:app", host=host, port=port, reload=True)
+    # Workers share job state, events and results through DEEPRESEARCH_JOB_DB
+    workers = int(os.getenv("DEEPRESEARCH_SERVER_WORKERS") or os.getenv("WEB_CONCURRENCY") or "1")
+    reload = os.getenv("DEEPRESEARCH_RELOAD", "0") == "1"
+    uvicorn.run("backend.server:app", host=host, port=port, reload=reload, workers=None if reload else workers)
 
 
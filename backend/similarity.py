@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Dict, List, Sequence, Set, Tuple
+
+
+_PUNCT_RE = re.compile(r"[^\w\s\\]+", re.UNICODE)
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop punctuation and Markdown decoration, and collapse whitespace."""
+    lowered = (text or "").lower()
+    lowered = _PUNCT_RE.sub(" ", lowered)
+    return _WS_RE.sub(" ", lowered).strip()
+
+
+def shingles(text: str, k: int = 5) -> Set[str]:
+    """Word k-shingles of the normalized text (character shingles for very short texts)."""
+    norm = normalize_text(text)
+    words = norm.split()
+    if len(words) >= k:
+        return {" ".join(words[i : i + k]) for i in range(len(words) - k + 1)}
+    if len(norm) >= k:
+        return {norm[i : i + k] for i in range(len(norm) - k + 1)}
+    return {norm} if norm else set()
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def text_similarity(a: str, b: str, k: int = 5) -> float:
+    """Jaccard similarity of word shingles; 1.0 means the texts are effectively identical."""
+    return jaccard(shingles(a, k), shingles(b, k))
+
+
+# Spelling variants of the same LaTeX that should not make two statements look different
+_LATEX_ALIASES = {
+    r"\le": r"\leq",
+    r"\ge": r"\geq",
+    r"\ne": r"\neq",
+    r"\to": r"\rightarrow",
+    r"\gets": r"\leftarrow",
+    r"\iff": r"\leftrightarrow",
+    r"\land": r"\wedge",
+    r"\lor": r"\vee",
+    r"\lnot": r"\neg",
+    r"\dfrac": r"\frac",
+    r"\tfrac": r"\frac",
+}
+_LATEX_ALIAS_RE = re.compile(r"\\(" + "|".join(a[1:] for a in _LATEX_ALIASES) + r")(?![a-zA-Z])")
+# Layout-only commands: sizing, spacing and font switches
+_LATEX_NOISE_RE = re.compile(
+    r"\\(left|right|big|Big|bigg|Bigg|displaystyle|textstyle|quad|qquad|mathrm|mathbf|mathit|text|operatorname)(?![a-zA-Z])"
+    r"|\\[,;:! ]"
+)
+_LATEX_DELIM_RE = re.compile(r"\$+|\\\(|\\\)|\\\[|\\\]")
+# x^{n} and x^n are the same; x^{n+1} keeps its braces
+_SINGLE_SCRIPT_RE = re.compile(r"([_^])\s*\{\s*([A-Za-z0-9]|\\[a-zA-Z]+)\s*\}")
+# Sentence punctuation only; a dot between digits is a decimal point
+_PROSE_PUNCT_RE = re.compile(r"[,;:!?\"`]|(?<!\d)\.|\.(?!\d)")
+# Macros, escaped characters and every remaining symbol become separate tokens
+_LATEX_TOKEN_RE = re.compile(r"(\\[a-zA-Z]+|\\.|_|[^\w\s\\.])")
+
+
+def normalize_latex(text: str) -> str:
+    """Canonical spelling of a (LaTeX) statement.
+
+    Collapses whitespace, LaTeX aliases, layout macros, math delimiters, single-token
+    sub/superscript braces, sentence punctuation and the case of prose words. Relations,
+    operators, braces and sub/superscripts are kept, so `2^n > n^2` and `2^n < n^2`, or
+    `\\frac{1}{n+1}` and `\\frac{1}{n}+1`, stay different.
+    """
+    out = _LATEX_ALIAS_RE.sub(lambda m: _LATEX_ALIASES["\\" + m.group(1)], text or "")
+    out = _LATEX_NOISE_RE.sub(" ", out)
+    out = _LATEX_DELIM_RE.sub(" ", out)
+    out = _SINGLE_SCRIPT_RE.sub(r"\1\2", out)
+    out = _PROSE_PUNCT_RE.sub(" ", out)
+    out = _LATEX_TOKEN_RE.sub(r" \1 ", out)
+    # Single letters are math variables (case matters); longer words are prose
+    return " ".join(w.lower() if len(w) > 1 and w.isalpha() else w for w in out.split())
+
+
+def fingerprint(text: str) -> str:
+    """Stable hash of the LaTeX-normalized text; equal fingerprints mean the same statement."""
+    return hashlib.sha1(normalize_latex(text).encode("utf-8")).hexdigest()
+
+
+def _math_tokens(normalized: str) -> Tuple[str, ...]:
+    # Numbers, macros and symbols carry the mathematical content, in order: k^3 vs k^4,
+    # \leq vs \geq or x_2 vs x^2 are different statements even when the prose is identical.
+    return tuple(w for w in normalized.split() if w.startswith("\\") or not w.isalpha())
+
+
+def minhash_signature(features: Set[str], num_perm: int = 64) -> Tuple[int, ...]:
+    """MinHash signature of a feature set; matching slots estimate the Jaccard similarity."""
+    if not features:
+        return tuple([0] * num_perm)
+    sig = []
+    for i in range(num_perm):
+        salt = i.to_bytes(8, "little")
+        sig.append(
+            min(
+                int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8, salt=salt).digest(), "little")
+                for f in features
+            )
+        )
+    return tuple(sig)
+
+
+def cluster_near_duplicates(
+    texts: Sequence[str],
+    *,
+    threshold: float = 0.6,
+    k: int = 3,
+    num_perm: int = 64,
+    bands: int = 16,
+) -> List[List[int]]:
+    """Group indices of near-duplicate texts, preserving input order.
+
+    Exact matches are found by fingerprint; paraphrases by MinHash LSH over word
+    k-shingles of the LaTeX-normalized text, confirmed with exact Jaccard >= threshold
+    and identical numbers, macros and symbols in the same order (so changing a constant,
+    a relation or an index never merges).
+    The first index of each cluster is its earliest text.
+    """
+    n = len(texts)
+    parent = list(range(n))
+
+    def _find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(a: int, b: int) -> None:
+        ra, rb = _find(a), _find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+
+    by_fp: Dict[str, int] = {}
+    for i, t in enumerate(texts):
+        fp = fingerprint(t)
+        if fp in by_fp:
+            _union(by_fp[fp], i)
+        else:
+            by_fp[fp] = i
+
+    normalized = [normalize_latex(t) for t in texts]
+    feats = [shingles(t, k) for t in normalized]
+    math = [_math_tokens(t) for t in normalized]
+    rows = max(1, num_perm // max(1, bands))
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for i, f in enumerate(feats):
+        sig = minhash_signature(f, num_perm)
+        for b in range(0, num_perm, rows):
+            buckets.setdefault((b, sig[b : b + rows]), []).append(i)
+    checked: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                a, b = members[x], members[y]
+                if (a, b) in checked or _find(a) == _find(b):
+                    continue
+                checked.add((a, b))
+                if math[a] == math[b] and jaccard(feats[a], feats[b]) >= threshold:
+                    _union(a, b)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(n):
+        clusters.setdefault(_find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda c: c[0])
+
+
+__all__ = [
+    "normalize_text",
+    "normalize_latex",
+    "fingerprint",
+    "shingles",
+    "jaccard",
+    "text_similarity",
+    "minhash_signature",
+    "cluster_near_duplicates",
+]
@@ -1,26 +1,179 @@
-from typing import Tuple, Optional, Any
+from dataclasses import dataclass
+from typing import Tuple, Optional, Any, Callable, List, Dict
+import os
+import queue
 import threading
+import time
 import logging
 
-from .judge import Judge
+from .judge import Judge, FinalJudge
 from .prover import Prover
 from .output_schemas import LiteratureReviewResult
 from .logging_hooks import logging_manager
+from .similarity import text_similarity
+from .effort import EffortPolicy
+from .metrics import observe_solver_event
+from .budget import current_run_budget, with_run_budget
+
+
+@dataclass
+class StagnationPolicy:
+    """When consecutive rejections look alike, change strategy instead of re-proving blindly.
+
+    An iteration counts as stalled when its feedback (or its proof) is at least as similar
+    to the previous one as the thresholds. After `patience` consecutive stalled iterations
+    the next action in `actions` is taken: "restart" (fresh prove without feedback),
+    "escalate" (raise the prover's reasoning effort) or "abandon" (give up on this pair).
+    """
+
+    feedback_threshold: float = 0.6
+    proof_threshold: float = 0.9
+    patience: int = 2
+    actions: Tuple[str, ...] = ("restart", "escalate", "abandon")
+
+
+class _StagnationTracker:
+    def __init__(self, policy: StagnationPolicy) -> None:
+        self.policy = policy
+        self.prev_feedback: Optional[str] = None
+        self.prev_proof: Optional[str] = None
+        self.stalled = 0
+        self._next_action = 0
+
+    def observe(self, proof: str, feedback: str) -> Tuple[float, float]:
+        fb_sim = text_similarity(feedback, self.prev_feedback) if self.prev_feedback is not None else 0.0
+        pr_sim = text_similarity(proof, self.prev_proof) if self.prev_proof is not None else 0.0
+        if fb_sim >= self.policy.feedback_threshold or pr_sim >= self.policy.proof_threshold:
+            self.stalled += 1
+        else:
+            self.stalled = 0
+        self.prev_feedback, self.prev_proof = feedback, proof
+        return fb_sim, pr_sim
+
+    def next_action(self, can_escalate: bool) -> Optional[str]:
+        if self.stalled < max(1, self.policy.patience):
+            return None
+        while self._next_action < len(self.policy.actions):
+            action = self.policy.actions[self._next_action]
+            self._next_action += 1
+            if action == "escalate" and not can_escalate:
+                continue
+            self.stalled = 0
+            return action
+        return None
+
+
+# Solver runs at once across all jobs in this process (prove workers x racing pairs)
+_SOLVER_SLOTS = threading.BoundedSemaphore(max(1, int(os.getenv("DEEPRESEARCH_SOLVER_SLOTS", "12") or 12)))
 
 
 class Solver:
     """Coordinates a single Prover with two sequential Judges and a feedback loop."""
 
-    def __init__(self, model: str = "gpt-5") -> None:
+    def __init__(
+        self,
+        model: str = "gpt-5",
+        *,
+        reasoning_effort: str = "high",
+        use_tools: Optional[bool] = None,
+        judge_model: Optional[str] = None,
+        stagnation: Optional[StagnationPolicy] = None,
+        prover_effort: Optional[EffortPolicy] = None,
+        judge_effort: Optional[EffortPolicy] = None,
+    ) -> None:
         self.model = model
+        self.stagnation = stagnation or StagnationPolicy()
+        # Judge #1 screens with the (possibly adaptive) judge policy; Judge #2 always confirms at its ceiling
+        self.judge_effort = judge_effort
+        prover_policy = prover_effort or EffortPolicy.fixed(reasoning_effort)
         # If user selected gpt-oss-120b, use 120b for Prover with no tools; otherwise default behavior
         if model == "gpt-oss-120b":
-            self.prover = Prover(model="openai/gpt-oss-120b", use_tools=False)
+            self.prover = Prover(
+                model="openai/gpt-oss-120b",
+                use_tools=False if use_tools is None else use_tools,
+                effort_policy=prover_policy,
+            )
         else:
-            self.prover = Prover(model=model)
+            self.prover = Prover(
+                model=model,
+                use_tools=True if use_tools is None else use_tools,
+                effort_policy=prover_policy,
+            )
+        # Judges: if user selected gpt-oss-120b, prefer o4-mini for judges (tool-capable)
+        self.judge_model = judge_model or (
+            "o4-mini" if model in {"gpt-oss-120b", "openai/gpt-oss-120b"} else model
+        )
         self.logger = logging.getLogger(self.__class__.__name__)
         # Assign a logging pair index if logging is enabled by CLI
         self._pair_index: Optional[int] = logging_manager.assign_index()
+        # Last proof attempt and its first flaw, kept for final selection across pairs
+        self.last_proof: str = ""
+        self.last_feedback: str = ""
+        # Reasoning efforts in use when the proof was finally accepted (None until solved)
+        self.accepted_effort: Optional[Dict[str, str]] = None
+
+    def _cancelled(
+        self,
+        cancel_event: Optional[threading.Event],
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> bool:
+        if cancel_event is None or not cancel_event.is_set():
+            return False
+        try:
+            logging_manager.write_cancelled(self._pair_index)
+        except Exception:
+            pass
+        self._emit(on_event, "cancelled")
+        return True
+
+    def _on_stagnation(
+        self,
+        tracker: _StagnationTracker,
+        iter_idx: int,
+        proof_markdown: str,
+        feedback: str,
+        on_event: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> Optional[str]:
+        """Record a rejection and return the policy action to take, if progress has stalled."""
+        fb_sim, pr_sim = tracker.observe(proof_markdown or "", feedback or "")
+        policy = self.prover.effort_policy
+        action = tracker.next_action(
+            can_escalate=policy.escalated(self.prover.reasoning_effort, "stagnation") is not None
+        )
+        if action is None:
+            return None
+        if action == "escalate":
+            self.prover.escalate_effort("stagnation")
+        self.logger.info(
+            "Stagnation after iteration %d (feedback sim=%.2f, proof sim=%.2f): %s%s",
+            iter_idx,
+            fb_sim,
+            pr_sim,
+            action,
+            f" to {self.prover.reasoning_effort}" if action == "escalate" else "",
+        )
+        try:
+            logging_manager.write_stagnation(self._pair_index, iter_idx, action, fb_sim, pr_sim)
+        except Exception:
+            pass
+        self._emit(
+            on_event,
+            "stagnation",
+            iteration=iter_idx,
+            action=action,
+            feedback_similarity=round(fb_sim, 3),
+            proof_similarity=round(pr_sim, 3),
+        )
+        return action
+
+    def _emit(self, on_event: Optional[Callable[[Dict[str, Any]], None]], event: str, **fields: Any) -> None:
+        observe_solver_event(event, fields)
+        if on_event is None:
+            return
+        try:
+            on_event({"event": event, "pair": self._pair_index, **fields})
+        except Exception:
+            self.logger.debug("Solver event listener failed", exc_info=True)
 
     def solve(
         self,
@@ -28,6 +181,9 @@ class Solver:
         max_tries_per_prover: int = 10,
         literature: Optional[LiteratureReviewResult] = None,
         cancel_event: Optional[threading.Event] = None,
+        *,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+        iteration_gate: Optional[Callable[[int], bool]] = None,
     ) -> Tuple[bool, str]:
         """Run a single Prover with two sequential Judges and iterative feedback.
 
@@ -38,15 +194,56 @@ class Solver:
           - If Judge #2 says incorrect, return incorrect and feed its feedback to Prover in the next iteration.
           - If Judge #2 also says correct, return correct with the proof.
 
+        Optional hooks:
+        - on_event receives a dict per step ("proof", "judge", "stagnation", "cancelled", "stopped", "finished").
+        - iteration_gate is asked before every iteration; returning False stops early.
+
+        Rejections that repeat the previous flaw are tracked by the StagnationPolicy, which may
+        restart from a fresh proof, escalate reasoning effort, or abandon the pair early.
+
+        At most DEEPRESEARCH_SOLVER_SLOTS solvers (default 12) run at once in a process,
+        across every job; the others wait for a slot (or for cancel_event).
+
         Returns (correctness, proof_markdown_or_feedback).
         """
+        while not _SOLVER_SLOTS.acquire(timeout=0.5):
+            if self._cancelled(cancel_event, on_event):
+                return False, "Cancelled by parallel success"
+        try:
+            return self._solve(
+                problem,
+                max_tries_per_prover,
+                literature,
+                cancel_event,
+                on_event=on_event,
+                iteration_gate=iteration_gate,
+            )
+        finally:
+            _SOLVER_SLOTS.release()
 
+    def _solve(
+        self,
+        problem: str,
+        max_tries_per_prover: int = 10,
+        literature: Optional[LiteratureReviewResult] = None,
+        cancel_event: Optional[threading.Event] = None,
+        *,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+        iteration_gate: Optional[Callable[[int], bool]] = None,
+    ) -> Tuple[bool, str]:
         feedback: str = ""
         last_proof: str = ""
-        # Judges: if user selected gpt-oss-120b, prefer o4-mini for judges (tool-capable)
-        judge_model = "o4-mini" if self.model in {"gpt-oss-120b", "openai/gpt-oss-120b"} else self.model
-        judge1 = Judge(model=judge_model)
-        judge2 = Judge(model=judge_model)
+        # A reused Solver must not report the previous problem's attempt
+        self.last_proof = ""
+        self.last_feedback = ""
+        self.accepted_effort = None
+        if self.judge_effort is not None:
+            judge1 = Judge(model=self.judge_model, effort_policy=self.judge_effort)
+            judge2 = Judge(model=self.judge_model, reasoning_effort=self.judge_effort.ceiling)
+        else:
+            judge1 = Judge(model=self.judge_model)
+            judge2 = Judge(model=self.judge_model)
+        tracker = _StagnationTracker(self.stagnation)
 
         judge_context: dict[str, Any] = {}
         if literature is not None:
@@ -56,12 +253,22 @@ class Solver:
             }
 
         for iter_idx in range(1, max_tries_per_prover + 1):
-            if cancel_event is not None and cancel_event.is_set():
+            if self._cancelled(cancel_event, on_event):
                 return False, "Cancelled by parallel success"
+            if iteration_gate is not None and not iteration_gate(iter_idx):
+                self.logger.info("Iteration budget withdrawn after %d iteration(s)", iter_idx - 1)
+                self._emit(on_event, "stopped", iteration=iter_idx - 1)
+                break
+            budget = current_run_budget()
+            if budget is not None and not budget.allows("iteration"):
+                self.logger.warning("Run budget exhausted; stopping after %d iteration(s)", iter_idx - 1)
+                budget.note_skip("solver runs cut short")
+                self._emit(on_event, "stopped", iteration=iter_idx - 1)
+                break
             self.logger.info("Prover: attempting proof%s", " (with feedback)" if feedback else "")
 
             # Produce or revise proof
-            if cancel_event is not None and cancel_event.is_set():
+            if self._cancelled(cancel_event, on_event):
                 return False, "Cancelled by parallel success"
             if not feedback:
                 if judge_context:
@@ -73,7 +280,7 @@ class Solver:
                 else:
                     proof_resp = self.prover.prove(problem)
             else:
-                if cancel_event is not None and cancel_event.is_set():
+                if self._cancelled(cancel_event, on_event):
                     return False, "Cancelled by parallel success"
                 if judge_context:
                     proof_resp = self.prover.reprove(
@@ -88,15 +295,17 @@ class Solver:
 
             proof_markdown = proof_resp.proof_markdown
             last_proof = proof_markdown
+            self.last_proof = proof_markdown
             try:
                 logging_manager.write_iteration_header(self._pair_index, iter_idx, len(proof_markdown or ""))
                 logging_manager.write_iteration_start(self._pair_index, iter_idx, proof_markdown or "")
             except Exception:
                 pass
+            self._emit(on_event, "proof", iteration=iter_idx, length=len(proof_markdown or ""))
 
             # Judge #1 assessment
             self.logger.info("Submitting to Judge #1")
-            if cancel_event is not None and cancel_event.is_set():
+            if self._cancelled(cancel_event, on_event):
                 return False, "Cancelled by parallel success"
             if judge_context:
                 j1 = judge1.assess(
@@ -108,14 +317,22 @@ class Solver:
             else:
                 j1 = judge1.assess(problem, proof_markdown)
 
+            self._emit(on_event, "judge", iteration=iter_idx, judge=1, accepted=bool(j1.correctness), feedback=j1.feedback)
             if not j1.correctness:
                 feedback = j1.feedback
+                self.last_feedback = feedback
+                self.prover.escalate_effort("rejection")
                 self.logger.info("Judge #1 found a flaw; looping with feedback")
                 try:
                     logging_manager.write_judge1(self._pair_index, accepted=False, feedback_len=len(feedback or ""))
                     logging_manager.append_judge1_detail(self._pair_index, iter_idx, accepted=False, feedback=feedback)
                 except Exception:
                     pass
+                action = self._on_stagnation(tracker, iter_idx, proof_markdown, feedback, on_event)
+                if action == "abandon":
+                    break
+                if action == "restart":
+                    feedback = ""
                 continue
 
             # Judge #2 assessment only if Judge #1 accepted
@@ -125,7 +342,7 @@ class Solver:
                 logging_manager.append_judge1_detail(self._pair_index, iter_idx, accepted=True, feedback=j1.feedback)
             except Exception:
                 pass
-            if cancel_event is not None and cancel_event.is_set():
+            if self._cancelled(cancel_event, on_event):
                 return False, "Cancelled by parallel success"
             if judge_context:
                 j2 = judge2.assess(
@@ -137,6 +354,7 @@ class Solver:
             else:
                 j2 = judge2.assess(problem, proof_markdown)
 
+            self._emit(on_event, "judge", iteration=iter_idx, judge=2, accepted=bool(j2.correctness), feedback=j2.feedback)
             if j2.correctness:
                 self.logger.info("Judge #2 also accepted; returning correct proof")
                 try:
@@ -144,20 +362,172 @@ class Solver:
                     logging_manager.append_judge2_detail(self._pair_index, iter_idx, accepted=True, feedback=j2.feedback)
                 except Exception:
                     pass
+                self.accepted_effort = {
+                    "prover": self.prover.reasoning_effort,
+                    "judge1": judge1.reasoning_effort,
+                    "judge2": judge2.reasoning_effort,
+                }
+                self._emit(on_event, "finished", solved=True, iterations=iter_idx, effort=self.accepted_effort)
                 return True, proof_markdown
 
             # Judge #2 rejected; return incorrect now and use its feedback for the next iteration
             feedback = j2.feedback
+            self.last_feedback = feedback
+            self.prover.escalate_effort("rejection")
+            # Judge #1 let a flawed proof through; screen more carefully from now on
+            judge1.escalate_effort("rejection")
             self.logger.info("Judge #2 found a flaw; returning incorrect for this round and improving")
             try:
                 logging_manager.write_judge2(self._pair_index, accepted=False, feedback_len=len(feedback or ""))
                 logging_manager.append_judge2_detail(self._pair_index, iter_idx, accepted=False, feedback=feedback)
             except Exception:
                 pass
+            action = self._on_stagnation(tracker, iter_idx, proof_markdown, feedback, on_event)
+            if action == "abandon":
+                break
+            if action == "restart":
+                feedback = ""
 
-        # Exhausted tries; return the last available feedback
+        # Exhausted tries (or abandoned); return the last available feedback
         self.logger.info("Exhausted max tries; returning last feedback")
-        return False, feedback or "No correct proof found within allotted attempts."
+        self._emit(on_event, "finished", solved=False)
+        return False, self.last_feedback or "No correct proof found within allotted attempts."
+
+
+def race_solvers(
+    make_solver: Callable[[int], Solver],
+    problem: str,
+    pairs: int,
+    *,
+    max_tries_per_prover: int = 10,
+    literature: Optional[LiteratureReviewResult] = None,
+    stagger_seconds: Optional[float] = None,
+    solve_kwargs: Optional[Callable[[int], Dict[str, Any]]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[Optional[Tuple[bool, str]], List[Tuple[bool, str]], List[Solver]]:
+    """Run up to `pairs` solvers on the same problem and return on the first success.
+
+    Each pair runs on a daemon thread so the caller is never held back by the slower
+    pairs: once one succeeds, the shared cancel event is set, the remaining pairs get a
+    cancellation marker in their logs right away and wind down at their next checkpoint.
+
+    With `stagger_seconds`, only one pair starts immediately; another is launched each
+    time the running pairs have not produced a success within the threshold (or all of
+    them finished without one), until `pairs` are running.
+
+    `solve_kwargs(idx)` may override per-pair arguments of Solver.solve (literature,
+    max_tries_per_prover, on_event, iteration_gate).
+
+    Setting the caller's `cancel_event` stops every pair the same way and returns at once
+    with no success.
+
+    Returns (first_success_or_None, finished_results, solvers_launched).
+    """
+    logger = logging.getLogger("Solver.race")
+    pairs = max(1, int(pairs))
+    external_cancel = cancel_event
+    # Pairs stop on this one; a success must not set the caller's event
+    cancel_event = threading.Event()
+    finished: "queue.Queue[Tuple[int, Optional[Tuple[bool, str]]]]" = queue.Queue()
+    solvers: List[Solver] = []
+    running: set[int] = set()
+    results: List[Tuple[bool, str]] = []
+
+    def _run(idx: int, solver: Solver) -> None:
+        kwargs: Dict[str, Any] = {"max_tries_per_prover": max_tries_per_prover, "literature": literature}
+        try:
+            if solve_kwargs is not None:
+                kwargs.update(solve_kwargs(idx))
+            outcome: Optional[Tuple[bool, str]] = solver.solve(problem, cancel_event=cancel_event, **kwargs)
+        except Exception as e:
+            logger.exception("Solver pair %d failed: %s", idx + 1, e)
+            outcome = None
+        finished.put((idx, outcome))
+
+    def _launch() -> None:
+        idx = len(solvers)
+        solver = make_solver(idx)
+        solvers.append(solver)
+        running.add(idx)
+        threading.Thread(
+            target=with_run_budget(_run), args=(idx, solver), name=f"solver-pair-{idx + 1}", daemon=True
+        ).start()
+        logger.info("Launched solver pair %d/%d", idx + 1, pairs)
+
+    staggered = stagger_seconds is not None and stagger_seconds > 0
+    for _ in range(1 if staggered else pairs):
+        _launch()
+    next_launch_at = time.monotonic() + float(stagger_seconds) if staggered else 0.0
+
+    while running:
+        if external_cancel is not None and external_cancel.is_set():
+            cancel_event.set()
+            logger.info("Race cancelled by caller; %d pair(s) winding down", len(running))
+            return None, results, solvers
+        can_launch = staggered and len(solvers) < pairs
+        wait_for = max(0.0, next_launch_at - time.monotonic()) if can_launch else None
+        if external_cancel is not None:
+            wait_for = 0.5 if wait_for is None else min(wait_for, 0.5)
+        try:
+            idx, outcome = finished.get(timeout=wait_for)
+        except queue.Empty:
+            if not can_launch or time.monotonic() < next_launch_at:
+                continue
+            # Latency threshold passed without a success: add another pair
+            _launch()
+            next_launch_at = time.monotonic() + float(stagger_seconds)
+            continue
+        running.discard(idx)
+        if outcome is not None:
+            results.append(outcome)
+            if outcome[0]:
+                cancel_event.set()
+                for other in running:
+                    try:
+                        logging_manager.write_cancelled(solvers[other]._pair_index)
+                    except Exception:
+                        pass
+                logger.info(
+                    "Solver pair %d succeeded; cancelled %d running pair(s)", idx + 1, len(running)
+                )
+                return outcome, results, solvers
+        if can_launch and not running:
+            _launch()
+            next_launch_at = time.monotonic() + float(stagger_seconds)
+    return None, results, solvers
 
 
+def select_best_failure(
+    problem: str,
+    solvers: List[Solver],
+    results: List[Tuple[bool, str]],
+    *,
+    max_workers: int = 8,
+) -> Tuple[bool, str]:
+    """Pick the most promising failed attempt across pairs.
 
+    With two or more judged attempts, a FinalJudge tournament chooses the least incorrect
+    proof and the payload is that proof followed by its first flaw. Otherwise fall back to
+    the failure with the longest feedback.
+    """
+    attempts = [s for s in solvers if s.last_proof and s.last_feedback]
+    if len(attempts) == 1:
+        best = attempts[0]
+    elif attempts:
+        try:
+            idx = FinalJudge(model=attempts[0].judge_model).tournament(
+                problem, [s.last_proof for s in attempts], max_workers=max_workers
+            )
+            best = attempts[idx]
+        except Exception as e:
+            logging.getLogger("Solver.select").warning("FinalJudge tournament failed: %s", e)
+            best = None
+    else:
+        best = None
+    if best is not None:
+        return False, (
+            "### Best attempt\n\n" + best.last_proof.strip() + "\n\n### First flaw\n\n" + best.last_feedback.strip()
+        )
+    if results:
+        return max(results, key=lambda x: len(x[1] or ""))
+    return False, "No result produced."
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import contextvars
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .metrics import POOL_BUSY
+
+
+# A routed item: (stage name, payload)
+Route = Tuple[str, Any]
+
+
+@dataclass
+class Stage:
+    """One node of a streaming task graph.
+
+    - fn runs on the stage's own bounded thread pool.
+    - then(item, result) runs on the coordinating thread as soon as the task finishes and
+      returns the items to hand to downstream stages (possibly none).
+    - on_error(item, exc) does the same for failed tasks; by default failures are logged
+      and the item is dropped.
+    """
+
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 4
+    then: Optional[Callable[[Any, Any], Iterable[Route]]] = None
+    on_error: Optional[Callable[[Any, BaseException], Iterable[Route]]] = None
+
+
+def _tracked(stage: Stage, item: Any) -> Any:
+    with POOL_BUSY.track(pool=stage.name):
+        return stage.fn(item)
+
+
+class TaskGraph:
+    """Run stages as a streaming DAG: no stage waits for the whole previous stage.
+
+    Every item moves to its next stage the moment its own task completes, so a slow
+    item only delays itself. Routing callbacks run on the thread that called `run`,
+    which keeps any state they update free of locking.
+    """
+
+    def __init__(self, stages: Sequence[Stage], *, cancel_event: Optional[threading.Event] = None) -> None:
+        self.stages: Dict[str, Stage] = {s.name: s for s in stages}
+        self.cancel_event = cancel_event
+        self.logger = logging.getLogger("TaskGraph")
+        self.completed: Dict[str, int] = {s.name: 0 for s in stages}
+        self.failed: Dict[str, int] = {s.name: 0 for s in stages}
+
+    def run(self, initial: Iterable[Route]) -> None:
+        executors = {
+            name: ThreadPoolExecutor(max_workers=max(1, stage.workers), thread_name_prefix=f"graph-{name}")
+            for name, stage in self.stages.items()
+        }
+        pending: Dict[Future, Route] = {}
+
+        def _submit(routes: Iterable[Route]) -> None:
+            for stage_name, item in routes:
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    return
+                stage = self.stages.get(stage_name)
+                if stage is None:
+                    raise KeyError(f"Unknown stage: {stage_name}")
+                # Tasks run in a copy of the caller's context, so per-run state (the run budget) follows them
+                ctx = contextvars.copy_context()
+                pending[executors[stage_name].submit(ctx.run, _tracked, stage, item)] = (stage_name, item)
+
+        try:
+            _submit(initial)
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    stage_name, item = pending.pop(fut)
+                    stage = self.stages[stage_name]
+                    try:
+                        result = fut.result()
+                    except BaseException as e:  # noqa: BLE001
+                        self.failed[stage_name] += 1
+                        if stage.on_error is not None:
+                            _submit(stage.on_error(item, e) or [])
+                        else:
+                            self.logger.warning("[TaskGraph] stage %s failed: %s", stage_name, e)
+                        continue
+                    self.completed[stage_name] += 1
+                    if stage.then is not None:
+                        _submit(stage.then(item, result) or [])
+        finally:
+            cancelled = self.cancel_event is not None and self.cancel_event.is_set()
+            for ex in executors.values():
+                ex.shutdown(wait=not cancelled, cancel_futures=cancelled)
+
+    def summary(self) -> List[str]:
+        return [
+            f"{name}: done={self.completed[name]} failed={self.failed[name]}"
+            for name in self.stages
+        ]
+
+
+__all__ = ["Stage", "TaskGraph"]
@@ -9,7 +9,9 @@ import logging
 
 from pydantic import BaseModel
 
-from .llm_provider import LLMResponse
+from .budget import budget_effort
+from .llm_provider import LLMResponse, charge_usage, openai_client
+from .metrics import LLM_REPAIRS, LLM_RETRIES, llm_call
 
 
 def _collect_text_from_response(resp: Any) -> str:
@@ -65,8 +67,31 @@ def generate_structured_with_tools(
       submitting their outputs via submit_tool_outputs
     - Returns LLMResponse with output_parsed (Pydantic) and output_text (raw JSON string)
     """
+    with llm_call(response_model.__name__, model):
+        return _generate_structured_with_tools(
+            messages=messages,
+            response_model=response_model,
+            model=model,
+            tools=tools,
+            tool_registry=tool_registry,
+            reasoning_effort=reasoning_effort,
+            timeout=timeout,
+        )
+
+
+def _generate_structured_with_tools(
+    *,
+    messages: List[Dict[str, Any]],
+    response_model: type[BaseModel],
+    model: str,
+    tools: Optional[List[Dict[str, Any]]],
+    tool_registry: Optional[Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]],
+    reasoning_effort: Optional[str],
+    timeout: Optional[float],
+) -> LLMResponse:
     logger = logging.getLogger("ToolLLM")
     provider = (os.getenv("LLM_PROVIDER", "openai") or "openai").lower()
+    reasoning_effort = budget_effort(reasoning_effort)
 
     if provider == "google":
         # Fall back to provider-agnostic structured call without tool loop
@@ -92,7 +117,6 @@ def generate_structured_with_tools(
             timeout=timeout,
         )
 
-    from openai import OpenAI  # type: ignore
     try:  # Best-effort import of typed exceptions across SDK versions
         from openai import (
             APITimeoutError,
@@ -108,7 +132,7 @@ def generate_structured_with_tools(
         InternalServerError = Exception  # type: ignore
         APIStatusError = Exception  # type: ignore
 
-    client = OpenAI(timeout=timeout)
+    client = openai_client(timeout)
 
     # Retry configuration (env-tunable)
     try:
@@ -138,19 +162,28 @@ def generate_structured_with_tools(
             return 500 <= status < 600
         return False
 
+    # Token usage summed over every request of the tool loop
+    total_usage: Dict[str, int] = {}
+
+    def _charged(resp: Any) -> Any:
+        for key, val in charge_usage(model, resp).items():
+            total_usage[key] = total_usage.get(key, 0) + val
+        return resp
+
     def _parse_with_retry(*, input_messages: List[Dict[str, Any]]) -> Any:
         attempt = 0
         while True:
             try:
-                return client.responses.parse(
+                return _charged(client.responses.parse(
                     model=model,
                     input=input_messages,
                     tools=tools or [],
                     reasoning={"effort": reasoning_effort} if reasoning_effort else None,
                     text_format=response_model,
-                )
+                ))
             except Exception as e:  # pragma: no cover
                 if attempt < max_retries and _should_retry_error(e):
+                    LLM_RETRIES.inc(provider="openai", model=model)
                     logger.warning(
                         "[ToolLLM] parse failed (attempt %d/%d): %s",
                         attempt + 1,
@@ -166,12 +199,13 @@ def generate_structured_with_tools(
         attempt = 0
         while True:
             try:
-                return client.responses.submit_tool_outputs(
+                return _charged(client.responses.submit_tool_outputs(
                     response_id=response_id,
                     tool_outputs=tool_outputs,
-                )
+                ))
             except Exception as e:  # pragma: no cover
                 if attempt < max_retries and _should_retry_error(e):
+                    LLM_RETRIES.inc(provider="openai", model=model)
                     logger.warning(
                         "[ToolLLM] submit_tool_outputs failed (attempt %d/%d): %s",
                         attempt + 1,
@@ -271,15 +305,16 @@ def generate_structured_with_tools(
 
             last_retry_text = text
             for _attempt in range(max_format_retries):
+                LLM_REPAIRS.inc(provider="openai", model=model)
                 repair_messages = list(messages) + [{"role": "user", "content": repair_instruction}]
                 try:
-                    resp_retry = client.responses.parse(
+                    resp_retry = _charged(client.responses.parse(
                         model=model,
                         input=repair_messages,
                         tools=[],  # avoid triggering new tool calls during repair
                         reasoning={"effort": reasoning_effort} if reasoning_effort else None,
                         text_format=response_model,
-                    )
+                    ))
                 except Exception:
                     # If the retry request itself fails, continue to next attempt
                     continue
@@ -291,14 +326,14 @@ def generate_structured_with_tools(
                         retry_text = _collect_text_from_response(resp_retry) or json.dumps(parsed_retry.model_dump(), ensure_ascii=False)
                     except Exception:
                         retry_text = _collect_text_from_response(resp_retry)
-                    return LLMResponse(output_parsed=parsed_retry, output_text=retry_text)
+                    return LLMResponse(output_parsed=parsed_retry, output_text=retry_text, usage=total_usage)
 
                 # Fallback: try to parse whatever text we got
                 last_retry_text = _collect_text_from_response(resp_retry)
                 if last_retry_text:
                     try:
                         parsed_retry = response_model.model_validate_json(last_retry_text)
-                        return LLMResponse(output_parsed=parsed_retry, output_text=last_retry_text)
+                        return LLMResponse(output_parsed=parsed_retry, output_text=last_retry_text, usage=total_usage)
                     except Exception:
                         pass  # continue retries
 
@@ -308,6 +343,6 @@ def generate_structured_with_tools(
                 f"{type(e).__name__}: {e}\nRaw text (last):\n{last_retry_text}"
             )
 
-    return LLMResponse(output_parsed=parsed, output_text=text)
+    return LLMResponse(output_parsed=parsed, output_text=text, usage=total_usage)
 
 
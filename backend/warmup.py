@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger("backend.warmup")
+
+# Heavy modules the first report, proof or paper request would otherwise import cold
+_MODULES = (
+    "research",
+    "solver",
+    "paper_converter",
+    "cli_research",
+    "open_problem_tool",
+    "result_refiner",
+    "tool_llm",
+)
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up; `ready` flips once every step has run."""
+
+    ready: bool = False
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    steps: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, step: str, seconds: float, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.steps[step] = round(seconds, 3)
+            if error is not None:
+                self.errors[step] = error
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "started": self.started,
+                "finished": self.finished,
+                "steps": dict(self.steps),
+                "errors": dict(self.errors),
+            }
+
+
+STATE = WarmupState()
+
+
+def _preload_modules() -> None:
+    for name in _MODULES:
+        importlib.import_module(f".{name}", __package__)
+
+
+def _init_clients() -> None:
+    provider = (os.getenv("LLM_PROVIDER", "openai") or "openai").lower()
+    if provider == "openai":
+        from .llm_provider import openai_client
+
+        openai_client()
+
+
+def _warm_sandbox() -> None:
+    # Pulls the interpreter, numpy and scipy into the page cache for the sandboxed children
+    from .code_tool import run_python
+
+    out = run_python("import numpy, scipy\nprint('ok')", timeout_seconds=60.0, memory_limit_mb=1024)
+    if out.get("exit_code") != 0:
+        raise RuntimeError((out.get("stderr") or "sandbox warm-up failed").strip()[-300:])
+
+
+def _warm_katex() -> None:
+    from .markdown_tool import validate_markdown
+
+    validate_markdown("Warm-up \\(x^2\\).")
+
+
+def _probe_provider() -> None:
+    # A model listing authenticates and opens a pooled connection without spending tokens
+    provider = (os.getenv("LLM_PROVIDER", "openai") or "openai").lower()
+    if provider != "openai":
+        logger.info("[Warmup] Provider probe only supports the OpenAI-compatible provider; skipped")
+        return
+    from .llm_provider import openai_client
+
+    openai_client(timeout=15.0).models.list()
+
+
+STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ("modules", _preload_modules),
+    ("clients", _init_clients),
+    ("sandbox", _warm_sandbox),
+    ("katex", _warm_katex),
+]
+
+
+def run_warmup(*, probe: Optional[bool] = None, state: WarmupState = STATE) -> WarmupState:
+    """Run every warm-up step, then mark the instance ready.
+
+    Steps are best effort: a failure is logged and reported in the state but does not
+    keep the instance out of rotation. The provider probe runs when `probe` is true
+    (default: DEEPRESEARCH_WARMUP_PROBE=1).
+    """
+    if probe is None:
+        probe = os.getenv("DEEPRESEARCH_WARMUP_PROBE", "0") == "1"
+    steps = list(STEPS) + ([("provider", _probe_provider)] if probe else [])
+    state.started = time.time()
+    for name, fn in steps:
+        start = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            logger.warning("[Warmup] %s failed: %s", name, e)
+            state.record(name, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+            continue
+        state.record(name, time.perf_counter() - start)
+    state.finished = time.time()
+    state.ready = True
+    logger.info("[Warmup] Ready after %.1fs (%s)", state.finished - state.started, state.steps)
+    return state
+
+
+def start_warmup(state: WarmupState = STATE) -> Optional[threading.Thread]:
+    """Warm up on a background thread; DEEPRESEARCH_WARMUP=0 marks the instance ready at once."""
+    if os.getenv("DEEPRESEARCH_WARMUP", "1") == "0":
+        state.ready = True
+        return None
+    thread = threading.Thread(target=run_warmup, kwargs={"state": state}, name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+__all__ = ["WarmupState", "STATE", "run_warmup", "start_warmup"]
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from .artifacts import digest
+
+
+logger = logging.getLogger("backend.work_queue")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs(status, created);
+"""
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    lease_owner: Optional[str] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+
+
+def _row_to_job(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row["id"],
+        kind=row["kind"],
+        payload=json.loads(row["payload"]),
+        status=row["status"],
+        attempts=int(row["attempts"]),
+        max_attempts=int(row["max_attempts"]),
+        lease_owner=row["lease_owner"],
+        result=json.loads(row["result"]) if row["result"] is not None else None,
+        error=row["error"],
+    )
+
+
+class WorkQueue:
+    """Durable job queue in a SQLite file shared by producers and `python -m backend.worker`.
+
+    Semantics are at-least-once: a claimed job is leased to one worker, which must
+    heartbeat before the lease expires; a job whose lease lapses (worker crashed or
+    lost its host) is handed to another worker, up to max_attempts claims. Only the
+    worker holding the current lease can complete a job, so a worker that lost its lease
+    cannot overwrite the new owner's result. Submitting the same work (same kind and
+    payload) while it is queued or running returns the in-flight job; once it has
+    finished, a resubmission runs it again.
+
+    Workers on other hosts need the file on a filesystem with working POSIX locks.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, max_attempts: int = 3) -> None:
+        self.path = str(Path(path).expanduser().resolve())
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max(1, int(max_attempts))
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=60.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=60000")
+            self._local.conn = conn
+        return conn
+
+    def _tx(self):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        return conn
+
+    def submit(self, kind: str, payload: Dict[str, Any], *, key: Optional[str] = None) -> str:
+        """Queue a job; joins the same work if it is still in flight, else (re)runs it."""
+        job_id = key or digest([kind, payload])[:32]
+        now = time.time()
+        conn = self._conn()
+        # A finished job is not a cache: its outcome may have come from a cancelled or
+        # budget-limited attempt, so a resubmission resets it to queued
+        conn.execute(
+            "INSERT INTO jobs(id, kind, payload, status, max_attempts, created, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET payload = excluded.payload, status = excluded.status, "
+            "attempts = 0, max_attempts = excluded.max_attempts, lease_owner = NULL, lease_expires = NULL, "
+            "result = NULL, error = NULL, created = excluded.created, updated = excluded.updated "
+            "WHERE jobs.status IN (?, ?)",
+            (job_id, kind, json.dumps(payload, ensure_ascii=False), QUEUED, self.max_attempts, now, now, DONE, FAILED),
+        )
+        return job_id
+
+    def claim(
+        self,
+        worker_id: str,
+        *,
+        kinds: Optional[Sequence[str]] = None,
+        lease_seconds: float = 120.0,
+    ) -> Optional[Job]:
+        """Lease the oldest runnable job (queued, or running with an expired lease)."""
+        now = time.time()
+        conn = self._tx()
+        try:
+            # A lease that lapsed on the last allowed attempt leaves nothing to retry
+            expired = conn.execute(
+                "UPDATE jobs SET status = ?, error = COALESCE(error, ?), lease_owner = NULL, lease_expires = NULL, "
+                "updated = ? WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (FAILED, "Lease expired on the last attempt", now, RUNNING, now),
+            )
+            if expired.rowcount:
+                logger.warning("[WorkQueue] %d job(s) failed: lease expired on the last attempt", expired.rowcount)
+            sql = (
+                "SELECT * FROM jobs WHERE (status = ? OR (status = ? AND lease_expires < ?)) "
+                "AND attempts < max_attempts"
+            )
+            params: list[Any] = [QUEUED, RUNNING, now]
+            if kinds:
+                sql += f" AND kind IN ({','.join('?' for _ in kinds)})"
+                params.extend(kinds)
+            row = conn.execute(sql + " ORDER BY created LIMIT 1", params).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            if row["status"] == RUNNING:
+                logger.warning("[WorkQueue] Lease of job %s by %s expired; reassigning", row["id"], row["lease_owner"])
+            conn.execute(
+                "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated = ? "
+                "WHERE id = ?",
+                (RUNNING, worker_id, now + lease_seconds, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        job = _row_to_job(row)
+        job.status = RUNNING
+        job.lease_owner = worker_id
+        job.attempts += 1
+        return job
+
+    def heartbeat(self, job_id: str, worker_id: str, *, lease_seconds: float = 120.0) -> bool:
+        """Extend the lease; False means the job was reassigned or already finished."""
+        now = time.time()
+        cur = self._conn().execute(
+            "UPDATE jobs SET lease_expires = ?, updated = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+            (now + lease_seconds, now, job_id, RUNNING, worker_id),
+        )
+        return cur.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result: Any) -> bool:
+        """Store the result if `worker_id` still holds the lease; returns whether this write won."""
+        cur = self._conn().execute(
+            "UPDATE jobs SET status = ?, result = ?, error = NULL, lease_expires = NULL, updated = ? "
+            "WHERE id = ? AND status = ? AND lease_owner = ?",
+            (DONE, json.dumps(result, ensure_ascii=False), time.time(), job_id, RUNNING, worker_id),
+        )
+        return cur.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> None:
+        """Record a failed attempt; the job is retried until max_attempts, then marked failed."""
+        self._conn().execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END, "
+            "error = ?, lease_owner = NULL, lease_expires = NULL, updated = ? "
+            "WHERE id = ? AND status = ? AND lease_owner = ?",
+            (FAILED, QUEUED, error, time.time(), job_id, RUNNING, worker_id),
+        )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row is not None else None
+
+    def wait(
+        self,
+        job_id: str,
+        *,
+        timeout: Optional[float] = None,
+        poll_seconds: float = 2.0,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Optional[Job]:
+        """Block until the job is done or failed; None on timeout or cancellation."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            job = self.get(job_id)
+            if job is not None and job.status in (DONE, FAILED):
+                return job
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_seconds)
+
+    def stats(self) -> Dict[str, int]:
+        rows = self._conn().execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: int(row["n"]) for row in rows}
+
+
+def new_worker_id() -> str:
+    return f"{os.uname().nodename if hasattr(os, 'uname') else 'host'}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+def open_work_queue(path: Optional[str] = None) -> Optional[WorkQueue]:
+    """Queue at `path` (or DEEPRESEARCH_WORK_QUEUE); None when no queue is configured."""
+    target = path or os.getenv("DEEPRESEARCH_WORK_QUEUE")
+    return WorkQueue(target) if target else None
+
+
+__all__ = [
+    "Job",
+    "WorkQueue",
+    "open_work_queue",
+    "new_worker_id",
+    "QUEUED",
+    "RUNNING",
+    "DONE",
+    "FAILED",
+]
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from .effort import EffortPolicy
+from .output_schemas import LiteratureReviewResult
+from .solver import Solver
+from .work_queue import Job, WorkQueue, new_worker_id
+
+
+logger = logging.getLogger("backend.worker")
+
+SOLVE = "solve"
+
+# How long a producer waits for a worker to finish a solve job (DEEPRESEARCH_REMOTE_TIMEOUT)
+DEFAULT_REMOTE_TIMEOUT = 6 * 3600.0
+
+
+def _remote_timeout() -> float:
+    try:
+        return float(os.getenv("DEEPRESEARCH_REMOTE_TIMEOUT") or DEFAULT_REMOTE_TIMEOUT)
+    except ValueError:
+        return DEFAULT_REMOTE_TIMEOUT
+
+
+def _policy_to_dict(policy: Optional[EffortPolicy]) -> Optional[Dict[str, Any]]:
+    return asdict(policy) if policy is not None else None
+
+
+def _policy_from_dict(data: Optional[Dict[str, Any]]) -> Optional[EffortPolicy]:
+    if not data:
+        return None
+    fields = dict(data)
+    if "escalate_on" in fields:
+        fields["escalate_on"] = tuple(fields["escalate_on"])
+    return EffortPolicy(**fields)
+
+
+def solve_job_payload(
+    statement: str,
+    literature: Optional[LiteratureReviewResult],
+    *,
+    model: str,
+    max_tries_per_prover: int,
+    prover_effort: Optional[EffortPolicy] = None,
+    judge_effort: Optional[EffortPolicy] = None,
+) -> Dict[str, Any]:
+    return {
+        "statement": statement,
+        "literature": literature.model_dump(mode="json") if literature is not None else None,
+        "model": model,
+        "max_tries_per_prover": int(max_tries_per_prover),
+        "prover_effort": _policy_to_dict(prover_effort),
+        "judge_effort": _policy_to_dict(judge_effort),
+    }
+
+
+def run_solve_job(payload: Dict[str, Any], cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+    lit_raw = payload.get("literature")
+    literature = LiteratureReviewResult.model_validate(lit_raw) if lit_raw else None
+    solver = Solver(
+        model=str(payload.get("model") or "gpt-5"),
+        prover_effort=_policy_from_dict(payload.get("prover_effort")),
+        judge_effort=_policy_from_dict(payload.get("judge_effort")),
+    )
+    ok, text = solver.solve(
+        str(payload["statement"]),
+        int(payload.get("max_tries_per_prover") or 8),
+        literature,
+        cancel_event,
+    )
+    return {"ok": bool(ok), "payload": text, "accepted_effort": solver.accepted_effort or {}}
+
+
+def remote_solve(
+    queue: WorkQueue,
+    statement: str,
+    literature: Optional[LiteratureReviewResult],
+    *,
+    model: str,
+    max_tries_per_prover: int,
+    prover_effort: Optional[EffortPolicy] = None,
+    judge_effort: Optional[EffortPolicy] = None,
+    cancel_event: Optional[threading.Event] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[bool, str, Dict[str, Any]]:
+    """Publish a Solver.solve job and block until a worker finishes it (or `timeout` passes)."""
+    job_id = queue.submit(
+        SOLVE,
+        solve_job_payload(
+            statement,
+            literature,
+            model=model,
+            max_tries_per_prover=max_tries_per_prover,
+            prover_effort=prover_effort,
+            judge_effort=judge_effort,
+        ),
+    )
+    logger.info("[Worker] Submitted solve job %s", job_id)
+    job = queue.wait(job_id, timeout=timeout if timeout is not None else _remote_timeout(), cancel_event=cancel_event)
+    if job is None:
+        if cancel_event is not None and cancel_event.is_set():
+            return False, "Cancelled while waiting for a worker", {}
+        logger.warning("[Worker] Timed out waiting for solve job %s", job_id)
+        return False, "Timed out waiting for a worker", {}
+    if job.status != "done" or not isinstance(job.result, dict):
+        return False, f"Worker job failed: {job.error or 'unknown error'}", {}
+    return bool(job.result.get("ok")), str(job.result.get("payload") or ""), dict(job.result.get("accepted_effort") or {})
+
+
+HANDLERS: Dict[str, Callable[[Dict[str, Any], Optional[threading.Event]], Any]] = {SOLVE: run_solve_job}
+
+
+class Worker:
+    """Claims jobs from a WorkQueue, runs them on a local thread pool and heartbeats their leases."""
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        *,
+        concurrency: int = 4,
+        lease_seconds: float = 120.0,
+        poll_seconds: float = 2.0,
+        kinds: Optional[Sequence[str]] = None,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        self.queue = queue
+        self.concurrency = max(1, int(concurrency))
+        self.lease_seconds = float(lease_seconds)
+        self.poll_seconds = float(poll_seconds)
+        self.kinds = list(kinds) if kinds else list(HANDLERS)
+        self.worker_id = worker_id or new_worker_id()
+        self.stop_event = threading.Event()
+
+    def _execute(self, job: Job) -> None:
+        handler = HANDLERS.get(job.kind)
+        if handler is None:
+            self.queue.fail(job.id, self.worker_id, f"No handler for job kind {job.kind!r}")
+            return
+        lost = threading.Event()
+        done = threading.Event()
+
+        def _heartbeat() -> None:
+            while not done.wait(self.lease_seconds / 3.0):
+                if not self.queue.heartbeat(job.id, self.worker_id, lease_seconds=self.lease_seconds):
+                    # Another worker owns (or finished) the job now; stop wasting work on it
+                    logger.warning("[Worker] Lost lease on job %s", job.id)
+                    lost.set()
+                    return
+
+        beat = threading.Thread(target=_heartbeat, name=f"heartbeat-{job.id[:8]}", daemon=True)
+        beat.start()
+        try:
+            result = handler(job.payload, lost)
+        except Exception as e:
+            logger.exception("[Worker] Job %s failed (attempt %d/%d)", job.id, job.attempts, job.max_attempts)
+            self.queue.fail(job.id, self.worker_id, f"{type(e).__name__}: {e}")
+            return
+        finally:
+            done.set()
+        if lost.is_set():
+            # The handler was cut short; its outcome is not this job's result
+            logger.info("[Worker] Job %s was reassigned; discarded this attempt", job.id)
+            return
+        if self.queue.complete(job.id, self.worker_id, result):
+            logger.info("[Worker] Job %s done", job.id)
+        else:
+            logger.info("[Worker] Job %s is no longer leased to this worker; discarded its result", job.id)
+
+    def run(self, *, idle_exit_seconds: Optional[float] = None) -> None:
+        """Process jobs until stop_event is set (or the queue stays empty for idle_exit_seconds)."""
+        logger.info("[Worker] %s serving %s from %s (concurrency=%d)", self.worker_id, self.kinds, self.queue.path, self.concurrency)
+        idle_since = time.monotonic()
+        running: set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="worker") as pool:
+            while not self.stop_event.is_set():
+                job = None
+                if len(running) < self.concurrency:
+                    job = self.queue.claim(self.worker_id, kinds=self.kinds, lease_seconds=self.lease_seconds)
+                if job is not None:
+                    logger.info("[Worker] Claimed job %s (%s, attempt %d)", job.id, job.kind, job.attempts)
+                    running.add(pool.submit(self._execute, job))
+                    idle_since = time.monotonic()
+                    continue
+                if running:
+                    finished, running = wait(running, timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                    running = set(running)
+                    if finished:
+                        idle_since = time.monotonic()
+                    continue
+                if idle_exit_seconds is not None and time.monotonic() - idle_since >= idle_exit_seconds:
+                    logger.info("[Worker] Idle for %.0fs; exiting", idle_exit_seconds)
+                    break
+                self.stop_event.wait(self.poll_seconds)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Consume proof jobs from a DeepResearch work queue.")
+    parser.add_argument("--queue", required=True, help="Path to the shared SQLite work queue (DEEPRESEARCH_WORK_QUEUE on producers).")
+    parser.add_argument("--concurrency", type=int, default=4, help="Jobs to run at once on this host.")
+    parser.add_argument("--lease-seconds", type=float, default=120.0, help="Lease length; heartbeats renew it every third.")
+    parser.add_argument("--idle-exit-seconds", type=float, default=None, help="Exit after the queue has been empty this long.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    worker = Worker(WorkQueue(args.queue), concurrency=args.concurrency, lease_seconds=args.lease_seconds)
+    try:
+        worker.run(idle_exit_seconds=args.idle_exit_seconds)
+    except KeyboardInterrupt:
+        worker.stop_event.set()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+
+
+__all__ = ["Worker", "remote_solve", "run_solve_job", "solve_job_payload", "main"]
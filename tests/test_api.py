@@ -0,0 +1,296 @@
+import threading
+from types import SimpleNamespace
+
+import backend.judge
+import backend.research
+import backend.result_refiner
+import backend.solver
+from backend.api import _run_report_stream_job
+from backend.jobs import JobContext
+
+
+def test_report_stream_post_proof_work_does_not_block_other_proofs(monkeypatch, tmp_path):
+    events = []
+    fast_accepted = threading.Event()
+    slow_refining = threading.Event()
+
+    def _emit(event):
+        events.append(event)
+        if event.get("status") == "accepted" and event.get("statement") == "fast":
+            fast_accepted.set()
+        return len(events)
+
+    class _Pipeline:
+        def __init__(self, cfg):
+            pass
+
+        def literature_review(self, seeds):
+            return SimpleNamespace(results=[])
+
+        def predict(self, lit):
+            return SimpleNamespace(predicted_results=["slow", "fast"])
+
+        def novelty_filter(self, lit, preds):
+            return ["slow", "fast"]
+
+        def compile_final_report(self, lit, results):
+            return SimpleNamespace(report_markdown=f"{len(results)} results")
+
+    class _Solver:
+        def __init__(self, **kwargs):
+            pass
+
+        def solve(self, stmt, *args):
+            if stmt == "fast":
+                # Finishes only after the other proof is already in post-processing
+                assert slow_refining.wait(5)
+            return True, f"proof of {stmt}"
+
+    class _Refiner:
+        def __init__(self, **kwargs):
+            pass
+
+        def refine(self, stmt, proof):
+            if stmt == "slow":
+                slow_refining.set()
+                # A slow refinement must not hold back the other proof's events
+                assert fast_accepted.wait(5)
+            return None
+
+        def tighten(self, stmt, proof):
+            return None
+
+    class _Judge:
+        def __init__(self, **kwargs):
+            pass
+
+        def assess(self, stmt, proof):
+            return SimpleNamespace(correctness=True)
+
+    monkeypatch.setattr(backend.research, "ResearchPipeline", _Pipeline)
+    monkeypatch.setattr(backend.solver, "Solver", _Solver)
+    monkeypatch.setattr(backend.result_refiner, "ResultRefiner", _Refiner)
+    monkeypatch.setattr(backend.judge, "Judge", _Judge)
+
+    ctx = JobContext(job_id="j", cancel_event=threading.Event(), run_dir=tmp_path, on_event=_emit)
+    result = _run_report_stream_job({"seeds": ["seed"], "model": "gpt-5"}, ctx)
+
+    assert result["report_markdown"] == "2 results"
+    accepted = [e["statement"] for e in events if e.get("status") == "accepted"]
+    assert accepted == ["fast", "slow"]
+    assert events[-1]["phase"] == "complete"
+
+
+def test_open_problem_job_streams_solver_events_and_honours_cancel(monkeypatch, tmp_path):
+    import backend.open_problem_tool as opt
+    from backend.api import _run_open_problem_job
+    from backend.output_schemas import LiteratureReviewResult
+
+    events = []
+    cancel = threading.Event()
+
+    class _Solver(backend.solver.Solver):
+        def solve(self, problem, max_tries, literature, cancel_event, on_event=None):
+            # Events go through the real Solver._emit, which stamps its own pair index
+            self._emit(on_event, "proof", iteration=1, length=10)
+            self._emit(on_event, "judge", iteration=1, judge=1, accepted=False, feedback="gap")
+            cancel.set()
+            assert cancel_event is cancel
+            return False, "Cancelled by parallel success"
+
+    monkeypatch.setenv("DEEPRESEARCH_SOLVER_PAIRS", "1")
+    monkeypatch.setattr(opt, "_collect_related_results", lambda *a, **k: LiteratureReviewResult(annotations="", results=[]))
+    monkeypatch.setattr(opt, "Solver", _Solver)
+
+    ctx = JobContext(job_id="j", cancel_event=cancel, run_dir=tmp_path, on_event=lambda e: events.append(e) or len(events))
+    result = _run_open_problem_job({"problem": "Prove P."}, ctx)
+
+    assert result["status"] == "cancelled"
+    solver_events = [e for e in events if e["phase"] == "solver" and "event" in e]
+    assert [(e["event"], e["pair"]) for e in solver_events] == [("proof", 1), ("judge", 1)]
+    assert events[0] == {"phase": "literature", "status": "begin", "target": 25}
+    assert events[-1] == {"phase": "complete", "status": "cancelled"}
+
+
+def test_proof_job_cancel_reaches_every_solver_pair(monkeypatch, tmp_path):
+    import backend.cli_research as cr
+    from backend.api import _run_proof_job
+
+    cancel = threading.Event()
+    seen = []
+
+    class _Solver:
+        def __init__(self, **kwargs):
+            pass
+
+        def solve(self, problem, cancel_event=None, **kwargs):
+            # Returns only once the job's cancellation reached this pair
+            seen.append(cancel_event is not None and cancel_event.wait(5))
+            return False, "Cancelled by parallel success"
+
+    monkeypatch.setattr(cr, "Solver", _Solver)
+    monkeypatch.setattr(cr, "select_best_failure", lambda *a: (_ for _ in ()).throw(AssertionError("no tournament")))
+    ctx = JobContext(job_id="j", cancel_event=cancel, run_dir=tmp_path)
+    cancel.set()
+    for pairs, race in (("1", ""), ("2", ""), ("2", "1")):
+        monkeypatch.setenv("DEEPRESEARCH_SOLVER_PAIRS", pairs)
+        monkeypatch.setenv("DEEPRESEARCH_SOLVER_RACE", race)
+        assert _run_proof_job({"problem": "Prove P."}, ctx)["ok"] is False
+    assert len(seen) >= 3 and all(seen)
+
+
+def test_tail_events_reads_the_job_store_off_the_event_loop(monkeypatch):
+    import asyncio
+
+    import backend.api
+
+    loop_thread = threading.get_ident()
+    reads = []
+    log = [(1, {"phase": "start"}), (2, {"phase": "job", "status": "succeeded"})]
+
+    class _Manager:
+        def _read(self):
+            reads.append(threading.get_ident())
+
+        def latest_event_id(self, job_id):
+            self._read()
+            return len(log)
+
+        def events(self, job_id, after=0):
+            self._read()
+            return [e for e in log if e[0] > after]
+
+        def get(self, job_id):
+            self._read()
+            return SimpleNamespace(status="succeeded")
+
+    monkeypatch.setattr(backend.api, "job_manager", lambda: _Manager())
+
+    async def _collect():
+        return [item async for item in backend.api._tail_events("j", 0)]
+
+    assert asyncio.run(_collect()) == log
+    assert reads and loop_thread not in reads
+
+
+def test_open_problem_jobs_use_the_interactive_lane(monkeypatch, tmp_path):
+    import backend.api
+    from backend.jobs import LANE_INTERACTIVE, JobManager, JobStore
+
+    manager = JobManager(JobStore(tmp_path / "jobs.db"))
+    monkeypatch.setattr(backend.api, "get_job_manager", lambda: manager)
+    backend.api.job_manager()
+    manager.runners["open_problem"] = lambda request, ctx: {"status": "solved"}
+    request = SimpleNamespace(headers={}, client=None)
+    record = backend.api._submit_job("open_problem", backend.api.OpenProblemRequest(problem="Prove P."), request)
+    # Starts ahead of queued research reports, like /proof
+    assert record.lane == manager.lanes["proof"] == LANE_INTERACTIVE
+    manager.wait(record.id, poll_seconds=0.01)
+    manager.shutdown()
+
+
+def test_concurrent_report_jobs_share_the_solver_slots(monkeypatch, tmp_path):
+    import time
+
+    import backend.api
+    import backend.cli_research as cr
+    from backend.jobs import JobManager, JobStore
+    from backend.output_schemas import LiteratureReviewResult, PredictedResults
+    from backend.research import ResearchConfig
+
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    class _Pipeline:
+        def __init__(self, cfg):
+            self.config = ResearchConfig(adaptive_budget=False)
+
+        def literature_review(self, seeds):
+            return LiteratureReviewResult(annotations="", results=[{"statement": str(seeds), "url": "seed"}])
+
+        def predict(self, lit):
+            seed = lit.results[0].statement
+            return PredictedResults(annotations="", predicted_results=[f"{seed} {i}" for i in range(4)])
+
+        def dedupe_predictions(self, statements):
+            return statements
+
+        def check_novelty(self, lit, stmt):
+            return stmt, True, None, None
+
+        def compile_final_report(self, lit, results):
+            return SimpleNamespace(report_markdown=f"{len(results)} results")
+
+    class _Prover(backend.solver.Prover):
+        def prove(self, problem, **kwargs):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return SimpleNamespace(proof_markdown=f"proof of {problem}")
+
+    class _Judge(backend.solver.Judge):
+        def assess(self, problem, proof, **kwargs):
+            return SimpleNamespace(correctness=True, feedback="")
+
+    class _Refiner:
+        def __init__(self, model, effort_policy=None):
+            pass
+
+        def refine(self, stmt, proof):
+            return None
+
+        def tighten(self, stmt, proof):
+            return None
+
+    monkeypatch.setattr(cr, "ResearchPipeline", _Pipeline)
+    monkeypatch.setattr(cr, "ResultRefiner", _Refiner)
+    monkeypatch.setattr(cr, "open_work_queue", lambda: None)
+    monkeypatch.setattr(backend.solver, "Prover", _Prover)
+    monkeypatch.setattr(backend.solver, "Judge", _Judge)
+    monkeypatch.setattr(backend.solver, "_SOLVER_SLOTS", threading.BoundedSemaphore(3))
+
+    manager = JobManager(JobStore(tmp_path / "jobs.db"), max_running=2, max_per_user=2)
+    monkeypatch.setattr(backend.api, "get_job_manager", lambda: manager)
+    request = SimpleNamespace(headers={}, client=None)
+    records = [
+        backend.api._submit_job("report", backend.api.ReportRequest(seeds=seed), request) for seed in ("A", "B")
+    ]
+    for record in records:
+        done = manager.wait(record.id, timeout=10, poll_seconds=0.01)
+        assert done.status == "succeeded" and done.result["report_markdown"] == "4 results"
+    manager.shutdown()
+
+    # Eight proofs across two jobs with twelve prove workers each, never more than three at once
+    assert active["peak"] == 3
+
+
+def test_report_jobs_run_under_the_configured_budget(monkeypatch, tmp_path):
+    import backend.cli_research as cr
+    from backend.api import _run_report_job
+    from backend.output_schemas import FinalReport, LiteratureReviewResult, PredictedResults
+
+    class _Pipeline(backend.research.ResearchPipeline):
+        def literature_review(self, seeds):
+            return LiteratureReviewResult(annotations="", results=[])
+
+        def predict(self, lit):
+            return PredictedResults(annotations="", predicted_results=[])
+
+        def novelty_filter(self, lit, preds):
+            return []
+
+        def _compile_final_report(self, lit, results):
+            return FinalReport(report_markdown="# Report")
+
+    monkeypatch.delenv("DEEPRESEARCH_LIT_INDEX", raising=False)
+    monkeypatch.setenv("DEEPRESEARCH_MAX_TOKENS", "100000")
+    monkeypatch.setattr(backend.research, "ResearchPipeline", _Pipeline)
+    monkeypatch.setattr(cr, "ResearchPipeline", _Pipeline)
+
+    for run in (_run_report_job, _run_report_stream_job):
+        ctx = JobContext(job_id="j", cancel_event=threading.Event(), run_dir=tmp_path / run.__name__, on_event=lambda e: 0)
+        report = run({"seeds": ["seed"], "model": "gpt-5"}, ctx)["report_markdown"]
+        assert report.startswith("# Report") and "## Run budget" in report
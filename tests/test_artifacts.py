@@ -0,0 +1,32 @@
+from backend.artifacts import ArtifactStore
+from backend.output_schemas import PredictedResults
+
+
+def test_cached_stage_outputs_are_reused_across_stores(tmp_path):
+    calls = []
+
+    def predict():
+        calls.append(1)
+        return PredictedResults(annotations="", predicted_results=["A", "B"])
+
+    first = ArtifactStore(tmp_path / "run")
+    assert first.cached("prediction", ["lit", "cfg"], predict, model=PredictedResults).predicted_results == ["A", "B"]
+
+    resumed = ArtifactStore(tmp_path / "run")
+    again = resumed.cached("prediction", ["lit", "cfg"], predict, model=PredictedResults)
+    assert isinstance(again, PredictedResults) and again.predicted_results == ["A", "B"]
+    assert resumed.cached("prove", ["lit", "A"], lambda: (True, "proof", "medium"), decode=tuple) == (True, "proof", "medium")
+    # Different inputs miss the cache
+    resumed.cached("prediction", ["other-lit", "cfg"], predict, model=PredictedResults)
+
+    assert len(calls) == 2
+    assert resumed.hits == {"prediction": 1} and resumed.misses == {"prove": 1, "prediction": 1}
+
+
+def test_values_rejected_by_store_if_are_recomputed(tmp_path):
+    store = ArtifactStore(tmp_path / "run")
+    outcomes = iter([(False, "Stopped: run budget"), (True, "proof")])
+    keep = lambda res: res[0]
+    assert store.cached("prove", ["lit", "A"], lambda: next(outcomes), decode=tuple, store_if=keep) == (False, "Stopped: run budget")
+    assert store.cached("prove", ["lit", "A"], lambda: next(outcomes), decode=tuple, store_if=keep) == (True, "proof")
+    assert ArtifactStore(tmp_path / "run").cached("prove", ["lit", "A"], lambda: (False, "x"), decode=tuple) == (True, "proof")
@@ -0,0 +1,54 @@
+def test_run_budget_degrades_in_stages_and_reports_skips(monkeypatch):
+    from backend import budget as budget_mod
+    from backend.output_schemas import FinalReport, LiteratureReviewResult
+    from backend.research import ResearchPipeline
+
+    budget = budget_mod.RunBudget(max_tokens=1000)
+    steps = []
+    for tokens in (0, 650, 100, 150, 100):
+        budget.record("gpt-5", tokens, 0)
+        steps.append((budget.allows("tighten"), budget.cap_effort("high"), budget.allows("proof"), budget.allows("iteration")))
+    assert steps == [
+        (True, "high", True, True),
+        (False, "high", True, True),
+        (False, "low", True, True),
+        (False, "low", False, True),
+        (False, "low", False, False),
+    ]
+
+    previous = budget_mod.activate_run_budget(budget)
+    budget.note_skip("tightening passes", 2)
+    monkeypatch.setattr(ResearchPipeline, "_compile_final_report", lambda self, lit, res: FinalReport(report_markdown="# Report"))
+    try:
+        md = ResearchPipeline().compile_final_report(LiteratureReviewResult(annotations="", results=[]), []).report_markdown
+    finally:
+        budget_mod.activate_run_budget(previous)
+    assert md.startswith("# Report") and "## Run budget" in md and "tightening passes: 2" in md
+
+
+def test_concurrent_runs_keep_their_own_budget():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from backend import budget as budget_mod
+
+    limits = {"a": 100, "b": 5000}
+    seen = {}
+    barrier = threading.Barrier(2)
+
+    def _run(name):
+        budget = budget_mod.RunBudget(max_tokens=limits[name])
+        budget_mod.activate_run_budget(budget)  # each thread starts with its own context
+        barrier.wait()
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            # Usage recorded on pool threads lands in this run's budget only
+            list(ex.map(budget_mod.with_run_budget(lambda _: budget_mod.record_llm_usage("gpt-5", 50, 0)), range(2)))
+        seen[name] = (budget_mod.current_run_budget() is budget, budget.tokens, budget.allows("proof"))
+
+    threads = [threading.Thread(target=_run, args=(name,)) for name in limits]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert seen == {"a": (True, 100, False), "b": (True, 100, True)}
+    assert budget_mod.current_run_budget() is None
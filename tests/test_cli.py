@@ -146,3 +146,134 @@ def test_refine_json_path(monkeypatch, tmp_path):
     assert updated and updated[0]["statement"] == "S*"
     assert updated[0]["proof_markdown"] == "P*"
 
+
+
+def test_continuous_mode_refines_while_proving_and_keeps_prediction_order(monkeypatch, tmp_path):
+    import threading
+
+    import backend.cli_research as cr
+    from backend.research import ResearchConfig
+
+    rounds = iter([["S0", "S1", "S2", "S3"], []])
+    refined = threading.Event()
+
+    class FakePipeline:
+        def __init__(self, config):
+            self.config = ResearchConfig(adaptive_budget=False)
+
+        def incremental_literature_review(self, lit, seeds):
+            return types.SimpleNamespace(annotations="", results=[])
+
+        def predict(self, lit):
+            return None
+
+        def novelty_filter(self, lit, preds):
+            return next(rounds)
+
+    class FakeSolver:
+        accepted_effort = None
+
+        def __init__(self, **kwargs):
+            pass
+
+        def solve(self, stmt, iterations, lit):
+            if stmt == "S0":
+                # Still proving when a later statement has already been refined
+                assert refined.wait(5)
+            if stmt == "S3":
+                raise RuntimeError("prover crashed")
+            return stmt != "S1", f"proof of {stmt}"
+
+    class FakeRefiner:
+        def __init__(self, model, effort_policy=None):
+            pass
+
+        def refine(self, stmt, proof):
+            if stmt == "S2":
+                refined.set()
+            return stmt + "'", proof
+
+        def tighten(self, stmt, proof):
+            return None
+
+    monkeypatch.setattr(cr, "ResearchPipeline", FakePipeline)
+    monkeypatch.setattr(cr, "Solver", FakeSolver)
+    monkeypatch.setattr(cr, "ResultRefiner", FakeRefiner)
+    monkeypatch.setattr(cr, "open_work_queue", lambda: None)
+
+    out = tmp_path / "correct.json"
+    seed_file = tmp_path / "seeds.txt"
+    cr.run_continuous_math_research("Seed", correct_out_path=str(out), seed_file_path=str(seed_file))
+
+    # Results are persisted as they finish; the next round's seeds follow prediction order
+    assert [r["statement"] for r in json.loads(out.read_text(encoding="utf-8"))] == ["S2'", "S0'"]
+    assert json.loads(seed_file.read_text(encoding="utf-8")) == ["Seed", "S0'", "S2'"]
+
+
+def test_known_results_found_while_proving_only_reach_the_report(monkeypatch):
+    import threading
+
+    import backend.cli_research as cr
+    from backend.output_schemas import LiteratureReviewResult, PredictedResults
+    from backend.research import ResearchConfig, ResearchPipeline
+
+    recorded = threading.Event()
+    proved_with: list[list[str]] = []
+    reported_with: list[list[str]] = []
+
+    class FakePipeline:
+        index = None
+        record_known_result = ResearchPipeline.record_known_result
+
+        def __init__(self, config):
+            self.config = ResearchConfig(adaptive_budget=False)
+
+        def literature_review(self, seeds):
+            return LiteratureReviewResult(annotations="", results=[{"statement": "Seed", "url": "seed"}])
+
+        def predict(self, lit):
+            return PredictedResults(annotations="", predicted_results=["Known", "New"])
+
+        def dedupe_predictions(self, statements):
+            return statements
+
+        def check_novelty(self, lit, stmt):
+            if stmt == "Known":
+                return stmt, False, "A known result", "https://example.org/known"
+            # Prove "New" only after the known result has been recorded
+            assert recorded.wait(5)
+            return stmt, True, None, None
+
+        def compile_final_report(self, lit, results):
+            reported_with.append([x.statement for x in lit.results])
+            return types.SimpleNamespace(report_markdown="report")
+
+    real_record = FakePipeline.record_known_result
+
+    def record_known_result(self, lit, matched_stmt, matched_url):
+        try:
+            return real_record(self, lit, matched_stmt, matched_url)
+        finally:
+            recorded.set()
+
+    FakePipeline.record_known_result = record_known_result
+
+    class FakeSolver:
+        accepted_effort = None
+
+        def __init__(self, **kwargs):
+            pass
+
+        def solve(self, stmt, iterations, lit, cancel_event=None):
+            proved_with.append([x.statement for x in lit.results])
+            return False, "no proof"
+
+    monkeypatch.setattr(cr, "ResearchPipeline", FakePipeline)
+    monkeypatch.setattr(cr, "Solver", FakeSolver)
+    monkeypatch.setattr(cr, "open_work_queue", lambda: None)
+
+    cr.run_automate_math_research("Seed")
+
+    # The prover sees the literature its cached outcome is keyed on; the report gets both
+    assert proved_with == [["Seed"]]
+    assert reported_with == [["Seed", "A known result"]]
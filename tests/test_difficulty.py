@@ -0,0 +1,35 @@
+def test_proof_scheduler_scales_budget_with_difficulty_and_reclaims_it():
+    from backend.difficulty import ProofScheduler
+
+    sched = ProofScheduler(2, mean_iterations=6, min_iterations=2, max_iterations=12, probe=True)
+    easy = "If $n$ is even then $n^2$ is even."
+    hard = (
+        "Conjecture: for every prime $p$ there exist infinitely many primes $q$ such that for all "
+        "integers $k$ and each $m$, the asymptotic density of $\\{n : n^k \\equiv m \\pmod{pq}\\}$ is "
+        "optimal, and the bound is sharp uniformly in $p$; moreover every such $q$ satisfies a tight "
+        + "additional condition on residues " * 10
+    )
+    assert sched.plan(easy).iterations < sched.plan(hard).iterations
+    assert sched.plan(hard).pairs == 2 and sched.plan(easy).pairs == 1
+
+    seen = []
+
+    class FakeSolver:
+        accepted_effort = None
+
+        def __init__(self, effort):
+            self.effort = effort
+
+        def solve(self, problem, max_tries_per_prover=10, literature=None, cancel_event=None, *, on_event=None, iteration_gate=None):
+            used = 0
+            while used < max_tries_per_prover and iteration_gate(used + 1):
+                used += 1
+                on_event({"event": "judge", "judge": 1, "accepted": False, "feedback": "same flaw"})
+            seen.append((self.effort.start if self.effort else "default", used))
+            return False, "same flaw"
+
+    ok, payload, _ = sched.prove(easy, None, FakeSolver)
+    assert not ok and payload == "same flaw"
+    # The probe takes one low-effort iteration, then the stuck solver stops at its base budget
+    assert seen == [("low", 1), ("default", sched.plan(easy).iterations - 1)]
+    assert sched.pool.remaining == 12 - sched.plan(easy).iterations
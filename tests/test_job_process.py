@@ -0,0 +1,52 @@
+import os
+import threading
+import time
+
+from backend.job_process import JobProcessPool
+from backend.jobs import CANCELLED, JobContext, JobManager, JobStore
+
+
+def echo_runner(request, ctx):
+    ctx.emit({"phase": "echo", "v": request["v"]})
+    return {"v": request["v"], "pid": os.getpid(), "run_dir": ctx.run_dir.name}
+
+
+def hang_runner(request, ctx):
+    ctx.emit({"phase": "hanging"})
+    time.sleep(60)
+
+
+def test_process_pool_streams_events_and_reuses_workers(tmp_path):
+    pool = JobProcessPool(max_jobs_per_worker=2)
+    events = []
+    try:
+        results = []
+        for i in range(3):
+            ctx = JobContext(job_id=f"j{i}", cancel_event=threading.Event(), run_dir=tmp_path / f"r{i}", on_event=events.append)
+            results.append(pool.run(echo_runner, {"v": i}, ctx))
+    finally:
+        pool.shutdown()
+    assert [r["v"] for r in results] == [0, 1, 2]
+    assert [e["v"] for e in events] == [0, 1, 2]
+    assert results[0]["run_dir"] == "r0"
+    assert results[0]["pid"] != os.getpid()
+    # Reused for a second job, then replaced after max_jobs_per_worker
+    assert results[0]["pid"] == results[1]["pid"] != results[2]["pid"]
+
+
+def test_manager_kills_worker_on_cancel(tmp_path):
+    pool = JobProcessPool()
+    manager = JobManager(JobStore(tmp_path / "jobs.db"), process_pool=pool)
+    manager.register("hang", hang_runner)
+    try:
+        record = manager.submit("hang", {})
+        deadline = time.monotonic() + 30
+        while not any(e.get("phase") == "hanging" for _, e in manager.events(record.id)):
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+        manager.cancel(record.id)
+        final = manager.wait(record.id, timeout=10, poll_seconds=0.05)
+        assert final.status == CANCELLED
+        assert pool.stats() == {"idle": 0, "busy": 0}
+    finally:
+        manager.shutdown()
@@ -0,0 +1,242 @@
+import threading
+import time
+
+from backend.jobs import CANCELLED, FAILED, RUNNING, SUCCEEDED, JobManager, JobStore
+
+
+def _wait_for(manager, job_id, statuses, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        record = manager.get(job_id)
+        if record.status in statuses:
+            return record
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} stuck in {manager.get(job_id).status}")
+
+
+def test_jobs_succeed_fail_and_cancel(tmp_path):
+    manager = JobManager(JobStore(tmp_path / "jobs.db"), max_running=2)
+    started = threading.Event()
+
+    def _slow(request, ctx):
+        started.set()
+        while not ctx.cancel_event.wait(0.01):
+            pass
+        raise RuntimeError("stopped")
+
+    manager.register("echo", lambda request, ctx: {"echo": request["v"], "run_dir": ctx.run_dir.name})
+    manager.register("boom", lambda request, ctx: 1 / 0)
+    manager.register("slow", _slow)
+
+    ok = manager.submit("echo", {"v": 3})
+    bad = manager.submit("boom", {})
+    slow = manager.submit("slow", {})
+    assert _wait_for(manager, ok.id, {SUCCEEDED}).result == {"echo": 3, "run_dir": ok.id}
+    assert "ZeroDivisionError" in _wait_for(manager, bad.id, {FAILED}).error
+    assert started.wait(5)
+    assert manager.get(slow.id).status == RUNNING
+    manager.cancel(slow.id)
+    assert _wait_for(manager, slow.id, {CANCELLED}).cancel_requested
+    manager.shutdown()
+
+
+def test_recover_resumes_interrupted_jobs(tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    left_running = store.create("echo", {"v": 1})
+    store.mark_running(left_running.id)
+    orphan = store.create("gone", {})
+
+    # A fresh process on the same store picks the unfinished work back up
+    manager = JobManager(JobStore(tmp_path / "jobs.db"))
+    manager.register("echo", lambda request, ctx: {"echo": request["v"]})
+    assert manager.recover() == 1
+    assert _wait_for(manager, left_running.id, {SUCCEEDED}).result == {"echo": 1}
+    assert manager.get(orphan.id).status == FAILED
+    manager.shutdown()
+
+
+def test_event_log_replays_and_follows(tmp_path, monkeypatch):
+    import asyncio
+
+    from backend import api
+
+    manager = JobManager(JobStore(tmp_path / "jobs.db"))
+    release = threading.Event()
+
+    def _runner(request, ctx):
+        ctx.emit({"phase": "step", "n": 1})
+        release.wait(5)
+        ctx.emit({"phase": "step", "n": 2})
+        return {}
+
+    manager.register("steps", _runner)
+    monkeypatch.setattr(api, "job_manager", lambda: manager)
+    record = manager.submit("steps", {})
+
+    async def _collect(after):
+        return [item async for item in api._tail_events(record.id, after, poll_seconds=0.01) if item is not None]
+
+    async def _follow_then_release():
+        follower = asyncio.ensure_future(_collect(0))
+        await asyncio.sleep(0.1)
+        release.set()
+        return await follower
+
+    live = asyncio.run(_follow_then_release())
+    assert [e for _, e in live] == [
+        {"phase": "job", "status": "running", "kind": "steps"},
+        {"phase": "step", "n": 1},
+        {"phase": "step", "n": 2},
+        {"phase": "job", "status": SUCCEEDED},
+    ]
+    # A reconnecting observer resumes after the last id it saw
+    replay = asyncio.run(_collect(live[1][0]))
+    assert [seq for seq, _ in replay] == [seq for seq, _ in live[2:]]
+    manager.shutdown()
+
+
+def test_admission_lanes_fair_share_and_backpressure(tmp_path):
+    import pytest
+
+    from backend.jobs import LANE_INTERACTIVE, QueueFull
+
+    manager = JobManager(JobStore(tmp_path / "jobs.db"), max_running=1, max_per_user=1, max_queued=4)
+    gate = threading.Event()
+    order = []
+
+    def _runner(request, ctx):
+        order.append(request["name"])
+        gate.wait(5)
+        return {}
+
+    manager.register("research", _runner)
+    manager.register("proof", _runner, lane=LANE_INTERACTIVE)
+
+    blocker = manager.submit("research", {"name": "blocker"}, user="alice")
+    a1 = manager.submit("research", {"name": "a1"}, user="alice")
+    a2 = manager.submit("research", {"name": "a2"}, user="alice")
+    b1 = manager.submit("research", {"name": "b1"}, user="bob")
+    p1 = manager.submit("proof", {"name": "p1"}, user="alice")
+    with pytest.raises(QueueFull):
+        manager.submit("research", {"name": "overflow"}, user="carol")
+
+    # Interactive first; then bob, who has nothing running, ahead of alice's backlog
+    assert [manager.position(j.id) for j in (p1, b1, a1, a2)] == [1, 2, 3, 4]
+    assert manager.position(blocker.id) == 0
+    gate.set()
+    for job in (a2, blocker):
+        _wait_for(manager, job.id, {SUCCEEDED})
+    assert order == ["blocker", "p1", "b1", "a1", "a2"]
+    manager.shutdown()
+
+
+def test_identical_requests_share_one_job(tmp_path):
+    from backend.api import ProofRequest, ReportRequest, request_fingerprint
+
+    same = request_fingerprint("report", ReportRequest(seeds=["B  result", "A result"], research_guideline=" primes "))
+    assert same == request_fingerprint("report", ReportRequest(seeds=["A result", "B result"], research_guideline="primes"))
+    assert same != request_fingerprint("report", ReportRequest(seeds=["A result", "B result"], model="o4-mini"))
+    assert same != request_fingerprint("proof", ProofRequest(problem="A result"))
+    # A streamed report never joins a /jobs report (it would have no progress events)
+    assert same != request_fingerprint("report_stream", ReportRequest(seeds=["A result", "B result"], research_guideline="primes"))
+
+    manager = JobManager(JobStore(tmp_path / "jobs.db"), cache_seconds=60)
+    gate = threading.Event()
+    calls = []
+
+    def _runner(request, ctx):
+        calls.append(request)
+        gate.wait(5)
+        return {"n": len(calls)}
+
+    manager.register("report", _runner)
+    first = manager.submit("report", {"v": 1}, fingerprint="fp")
+    joined = manager.submit("report", {"v": 1}, fingerprint="fp", user="someone-else")
+    assert joined.id == first.id and joined.coalesced and not first.coalesced
+    gate.set()
+    assert manager.wait(first.id, poll_seconds=0.01).result == {"n": 1}
+    # Served from the result cache after completion; other fingerprints still run
+    assert manager.submit("report", {"v": 1}, fingerprint="fp").id == first.id
+    other = manager.submit("report", {"v": 2}, fingerprint="other")
+    assert manager.wait(other.id, poll_seconds=0.01).result == {"n": 2}
+    manager.cache_seconds = 0
+    fresh = manager.submit("report", {"v": 1}, fingerprint="fp")
+    assert fresh.id != first.id
+    manager.wait(fresh.id, poll_seconds=0.01)
+    assert len(calls) == 3
+    manager.shutdown()
+
+
+def test_managers_sharing_a_store_steal_cancel_and_take_over(tmp_path):
+    release = threading.Event()
+
+    def _block(request, ctx):
+        while not (release.is_set() or ctx.cancel_event.is_set()):
+            time.sleep(0.01)
+        return {"ran": request["v"]}
+
+    # Two server processes on one database, each with one slot
+    a = JobManager(JobStore(tmp_path / "jobs.db"), max_running=1, steal_after=0.0, owner="host-1-a")
+    b = JobManager(JobStore(tmp_path / "jobs.db"), max_running=1, steal_after=0.0, owner="host-2-b")
+    for manager in (a, b):
+        manager.register("block", _block)
+        manager.register("echo", lambda request, ctx: {"echo": request["v"]})
+
+    busy = a.submit("block", {"v": 0})
+    _wait_for(a, busy.id, {RUNNING})
+    waiting = a.submit("block", {"v": 1}, fingerprint="fp")
+    assert b.submit("block", {"v": 1}, fingerprint="fp").id == waiting.id
+
+    # The idle process takes the job that is waiting behind A's busy slot
+    b.maintain()
+    assert _wait_for(a, waiting.id, {RUNNING}).owner == "host-2-b"
+
+    # A cancel received by A reaches the job running in B
+    a.cancel(waiting.id)
+    b.maintain()
+    assert _wait_for(a, waiting.id, {CANCELLED}).status == CANCELLED
+    assert a.position(busy.id) == 0
+
+    # A job whose owner stopped heartbeating is resumed by a survivor
+    orphan = a.store.create("echo", {"v": 7}, owner="gone-9-z")
+    a.store.mark_running(orphan.id, owner="gone-9-z")
+    a.store._conn().execute("UPDATE api_jobs SET heartbeat = 0 WHERE id = ?", (orphan.id,))
+    b.maintain()
+    assert _wait_for(b, orphan.id, {SUCCEEDED}).result == {"echo": 7}
+
+    release.set()
+    assert _wait_for(b, busy.id, {SUCCEEDED}).result == {"ran": 0}
+    a.shutdown()
+    b.shutdown()
+
+
+def test_runner_that_lost_its_job_stops_writing_events(tmp_path):
+    taken = threading.Event()
+    emitted = []
+
+    def _chatty(request, ctx):
+        ctx.emit({"phase": "work", "n": 1})
+        assert taken.wait(5)
+        # Ownership moved to another process: this write must not land in its log
+        emitted.append(ctx.emit({"phase": "work", "n": 2}))
+        return {"done": True}
+
+    a = JobManager(JobStore(tmp_path / "jobs.db"), owner="host-1-a")
+    b = JobManager(JobStore(tmp_path / "jobs.db"), owner="host-2-b")
+    a.register("chatty", _chatty)
+    record = a.submit("chatty", {})
+    _wait_for(a, record.id, {RUNNING})
+    while a.latest_event_id(record.id) < 2:
+        time.sleep(0.01)
+    assert a.store.claim(record.id, "host-2-b", expected_owner="host-1-a")
+    b.emit(record.id, {"phase": "work", "by": "b"}, owner="host-2-b")
+    a.maintain()  # notices the takeover
+    assert a.latest_event_id(record.id) == 3
+    taken.set()
+    while record.id in a._cancel_events:
+        time.sleep(0.01)
+    assert emitted == [0]
+    assert [e.get("n", e.get("by")) for _, e in a.events(record.id)] == [None, 1, "b"]
+    assert a.latest_event_id(record.id) == b.latest_event_id(record.id) == 3
+    a.shutdown()
+    b.shutdown()
@@ -0,0 +1,113 @@
+from backend.literature_index import LiteratureIndex
+from backend.output_schemas import LiteratureResultItem
+
+
+def _item(statement, url):
+    return LiteratureResultItem(statement=statement, url=url)
+
+
+def test_index_dedupes_tracks_provenance_and_searches(tmp_path):
+    index = LiteratureIndex(tmp_path / "lit.sqlite")
+    seed = r"Every $n \ge 1$ satisfies $P(n)$."
+    added = index.add(
+        [
+            _item(seed, "seed://input"),
+            _item("Goldbach holds for all even numbers below 4e18.", "https://example.org/goldbach"),
+            _item("Vinogradov: every sufficiently large odd number is a sum of three primes.", "https://example.org/vino"),
+        ],
+        seed=seed,
+        source="literature_review",
+        annotations="$P$ is a property.",
+    )
+    assert added == 3
+    # Same statement spelled differently is not stored twice
+    assert index.add([_item(r"Every $n \geq 1$ satisfies $P(n)$.", "seed://input")], seed="other", source="novelty") == 0
+
+    assert index.coverage(seed) == 2
+    assert [x.url for x in index.for_seed(seed)][0] == "seed://input"
+    assert index.annotations_for(seed) == "$P$ is a property."
+    assert index.lookup("Goldbach holds for all even numbers below 4e18").url == "https://example.org/goldbach"
+    hits = index.search("sum of three primes", 5)
+    assert hits and hits[0].url == "https://example.org/vino"
+    index.close()
+
+    reopened = LiteratureIndex(tmp_path / "lit.sqlite")
+    assert reopened.stats() == {"items": 3, "seeds": 2}
+
+
+def test_novelty_check_does_not_match_flipped_relation(tmp_path, monkeypatch):
+    import backend.research
+    from backend.output_schemas import LiteratureReviewResult, NoveltyCheck
+    from backend.research import ResearchConfig, ResearchPipeline
+
+    known = r"For every integer $n > 4$ we have $2^n > n^2$."
+    pipeline = ResearchPipeline(ResearchConfig(literature_index_path=str(tmp_path / "lit.sqlite")))
+    pipeline.index.add([_item(known, "https://example.org/known")], seed=known, source="literature_review")
+
+    class _Resp:
+        output_parsed = NoveltyCheck(is_novel=True)
+
+    monkeypatch.setattr(backend.research, "generate_structured_with_tools", lambda **kw: _Resp())
+    lit = LiteratureReviewResult(annotations="", results=[])
+    assert pipeline.check_novelty(lit, known)[1:] == (False, known, "https://example.org/known")
+    flipped = known.replace("2^n > n^2", "2^n < n^2")
+    assert pipeline.check_novelty(lit, flipped) == (flipped, True, None, None)
+
+
+def test_incremental_review_merges_overlapping_seeds(monkeypatch, caplog):
+    from backend.output_schemas import LiteratureReviewResult
+    from backend.research import ResearchPipeline
+
+    monkeypatch.delenv("DEEPRESEARCH_LIT_INDEX", raising=False)
+    shared = {"statement": r"Every $n \ge 1$ satisfies $P(n)$.", "url": "https://example.org/p"}
+    reviews = {
+        "A": LiteratureReviewResult(annotations="$P$ is a property.\n\nA is classical.", results=[shared]),
+        "B": LiteratureReviewResult(
+            annotations="$P$ is a property.\n\nB is new.",
+            results=[(r"Every $n \geq 1$ satisfies $P(n)$.", "https://example.org/p2"), ("B holds.", "u")],
+        ),
+    }
+    pipeline = ResearchPipeline()
+    monkeypatch.setattr(pipeline, "literature_review", lambda seed: reviews[seed])
+    # The earlier context already lists the shared result twice
+    prev = LiteratureReviewResult(annotations="$P$ is a property.", results=[shared, shared])
+
+    with caplog.at_level("INFO"):
+        lit = pipeline.incremental_literature_review(prev, ["A", "B"])
+    assert [(x.statement, x.url) for x in lit.results] == [
+        (shared["statement"], "https://example.org/p"),
+        ("B holds.", "u"),
+    ]
+    assert lit.annotations == "$P$ is a property.\n\nA is classical.\n\nB is new."
+    assert "+1 new" in caplog.text
+
+
+def test_joint_review_is_reused_for_its_seed_set_but_covers_no_single_seed(tmp_path, monkeypatch):
+    from backend.output_schemas import LiteratureReviewResult
+    from backend.research import ResearchConfig, ResearchPipeline
+
+    pipeline = ResearchPipeline(ResearchConfig(literature_index_path=str(tmp_path / "lit.sqlite"), min_local_results=2))
+    web_calls = []
+
+    def _web(seeds):
+        web_calls.append(seeds)
+        return LiteratureReviewResult(
+            annotations="Joint notation.",
+            results=[{"statement": f"Result {i} on {seeds}", "url": f"https://example.org/{i}"} for i in range(3)],
+        )
+
+    monkeypatch.setattr(pipeline, "_literature_review_web", _web)
+    first = pipeline.literature_review(["Seed A", "Seed B"])
+    assert len(first.results) == 3
+    assert pipeline.index.coverage("Seed A") == pipeline.index.coverage("Seed B") == 0
+
+    # The same seed set, in any order, is served from the index
+    again = pipeline.literature_review(["Seed B", "Seed A"])
+    assert [x.statement for x in again.results] == [x.statement for x in first.results]
+    assert again.annotations == "Joint notation."
+    assert len(web_calls) == 1
+
+    # A single seed of the set still gets its own review
+    pipeline.literature_review("Seed A")
+    assert web_calls[-1] == "Seed A"
+    assert pipeline.index.coverage("Seed A") == 3
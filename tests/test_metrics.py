@@ -0,0 +1,45 @@
+import pytest
+
+from backend.metrics import Registry, llm_call, observe_solver_event, JUDGE_VERDICTS, LLM_CALLS, SOLVER_RUNS
+
+
+def test_registry_renders_prometheus_text():
+    registry = Registry()
+    calls = registry.counter("demo_calls_total", "Calls.", ("stage",))
+    busy = registry.gauge("demo_busy", "Busy.", collect=lambda: {(): 3})
+    latency = registry.histogram("demo_seconds", "Latency.", ("stage",), buckets=(0.1, 1))
+    calls.inc(stage='a"b')
+    calls.inc(2, stage='a"b')
+    latency.observe(0.05, stage="x")
+    latency.observe(0.5, stage="x")
+    latency.observe(5, stage="x")
+    assert registry.counter("demo_calls_total", "Calls.", ("stage",)) is calls
+    assert busy.value() == 0
+
+    text = registry.render()
+    assert "# TYPE demo_calls_total counter" in text
+    assert 'demo_calls_total{stage="a\\"b"} 3' in text
+    assert "demo_busy 3" in text
+    assert 'demo_seconds_bucket{stage="x",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{stage="x",le="1"} 2' in text
+    assert 'demo_seconds_bucket{stage="x",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{stage="x"} 3' in text
+
+
+def test_llm_call_and_solver_events_update_metrics():
+    ok_before = LLM_CALLS.value(stage="Demo", model="m", outcome="ok")
+    err_before = LLM_CALLS.value(stage="Demo", model="m", outcome="error")
+    with llm_call("Demo", "m"):
+        pass
+    with pytest.raises(ValueError):
+        with llm_call("Demo", "m"):
+            raise ValueError("boom")
+    assert LLM_CALLS.value(stage="Demo", model="m", outcome="ok") == ok_before + 1
+    assert LLM_CALLS.value(stage="Demo", model="m", outcome="error") == err_before + 1
+
+    rejects = JUDGE_VERDICTS.value(judge="1", verdict="reject")
+    solved = SOLVER_RUNS.value(outcome="solved")
+    observe_solver_event("judge", {"judge": 1, "accepted": False})
+    observe_solver_event("finished", {"solved": True, "iterations": 3})
+    assert JUDGE_VERDICTS.value(judge="1", verdict="reject") == rejects + 1
+    assert SOLVER_RUNS.value(outcome="solved") == solved + 1
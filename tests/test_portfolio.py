@@ -0,0 +1,32 @@
+def test_iteration_pool_moves_surplus_to_improving_arms():
+    from backend.portfolio import IterationPool
+
+    pool = IterationPool(8, min_progress=0.25)
+    pool.register("stuck", 2)
+    pool.register("improving", 2)
+
+    assert pool.acquire("stuck") and pool.acquire("stuck")
+    pool.report("stuck", 0.0)
+    assert not pool.acquire("stuck")
+
+    pool.report("improving", 1.0)
+    granted = 0
+    while pool.acquire("improving"):
+        granted += 1
+    assert granted == 6
+    assert pool.remaining == 0
+
+
+def test_literature_subset_keeps_problem_entry():
+    from backend.output_schemas import LiteratureReviewResult
+    from backend.portfolio import literature_subset
+
+    lit = LiteratureReviewResult(
+        annotations="A",
+        results=[{"statement": "P", "url": "problem://input"}]
+        + [{"statement": f"R{i}", "url": f"https://x/{i}"} for i in range(6)],
+    )
+    sub = literature_subset(lit, 0.5, offset=1)
+    assert sub.results[0].url == "problem://input"
+    assert len(sub.results) == 4
+    assert [x.statement for x in sub.results[1:]] == ["R3", "R4", "R5"]
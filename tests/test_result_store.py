@@ -0,0 +1,38 @@
+import json
+
+from backend.result_store import ResultStore, load_results
+
+
+def test_appends_survive_torn_lines_and_compact_to_legacy_array(tmp_path):
+    legacy = tmp_path / "correct.json"
+    legacy.write_text(json.dumps([{"statement": "Old", "proof_markdown": "p0"}]), encoding="utf-8")
+
+    store = ResultStore(legacy, compact_every=0)
+    store.append("A", "p1")
+    store.append(r"$x \le 1$", "p2")
+    with open(store.log_path, "a", encoding="utf-8") as f:
+        f.write('{"statement": "torn')  # simulated crash mid-write
+    store.append(r"$x \leq 1$", "p3")  # same statement, newer proof
+
+    assert store.get("A")["proof_markdown"] == "p1"
+    assert load_results(store.log_path) == [
+        {"statement": "Old", "proof_markdown": "p0"},
+        {"statement": "A", "proof_markdown": "p1"},
+        {"statement": r"$x \leq 1$", "proof_markdown": "p3"},
+    ]
+
+    assert store.compact() == 3
+    assert [r["statement"] for r in json.loads(legacy.read_text(encoding="utf-8"))] == ["Old", "A", r"$x \leq 1$"]
+
+
+def test_relation_variants_are_not_superseded(tmp_path):
+    store = ResultStore(tmp_path / "correct.jsonl", compact_every=0)
+    store.append(r"For all $n > 4$, $2^n > n^2$.", "p1")
+    store.append(r"For all $n > 4$, $2^n < n^2$.", "p2")
+    # A record from an older log carrying a colliding fingerprint
+    with open(store.log_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"statement": r"For all $n > 4$, $2^n = n^2$.", "proof_markdown": "p3", "fp": "stale"}) + "\n")
+        f.write(json.dumps({"statement": r"For all $n > 4$, $2^n \geq n^2$.", "proof_markdown": "p4", "fp": "stale"}) + "\n")
+
+    assert store.compact() == 4
+    assert [r["proof_markdown"] for r in load_results(store.log_path)] == ["p1", "p2", "p3", "p4"]
@@ -0,0 +1,33 @@
+from backend.similarity import cluster_near_duplicates, fingerprint
+
+
+SUM_OF_CUBES = r"For every integer $n\ge 1$ the sum $\sum_{k=1}^n k^3$ equals the square of $\sum_{k=1}^n k$."
+
+
+def test_fingerprint_ignores_latex_spelling():
+    respelled = r"For every integer $n \geq 1$, the sum $\sum_{k=1}^{n} k^3$ equals the square of $\sum_{k=1}^{n} k$."
+    assert fingerprint(SUM_OF_CUBES) == fingerprint(respelled)
+
+
+def test_clusters_paraphrases_but_not_changed_constants():
+    texts = [
+        SUM_OF_CUBES,
+        "Every planar graph is four colorable.",
+        r"For every integer $n \geq 1$, the sum $\sum_{k=1}^{n} k^3$ is equal to the square of $\sum_{k=1}^{n} k$.",
+        SUM_OF_CUBES.replace("k^3", "k^4"),
+    ]
+    assert cluster_near_duplicates(texts) == [[0, 2], [1], [3]]
+
+
+def test_fingerprint_keeps_relations_and_grouping():
+    variants = [
+        r"For all $n > 4$ we have $2^n > n^2$.",
+        r"For all $n > 4$ we have $2^n < n^2$.",
+        r"For all $n > 4$ we have $2^n = n^2$.",
+        r"The sum equals $\frac{1}{n+1}$ for every $n$.",
+        r"The sum equals $\frac{1}{n}+1$ for every $n$.",
+        r"If $x_2 \le x^2$ then the claim holds.",
+        r"If $x^2 \le x_2$ then the claim holds.",
+    ]
+    assert len({fingerprint(v) for v in variants}) == len(variants)
+    assert cluster_near_duplicates(variants) == [[i] for i in range(len(variants))]
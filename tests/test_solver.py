@@ -0,0 +1,208 @@
+import threading
+import time
+import types
+
+
+def _fake_solver(delay: float, ok: bool, payload: str, calls: list):
+    def solve(problem, max_tries_per_prover=10, literature=None, cancel_event=None):
+        calls.append(payload)
+        end = time.monotonic() + delay
+        while time.monotonic() < end:
+            if cancel_event is not None and cancel_event.is_set():
+                return False, "Cancelled by parallel success"
+            time.sleep(0.01)
+        return ok, payload
+
+    return types.SimpleNamespace(solve=solve, _pair_index=None)
+
+
+def test_race_solvers_returns_first_success_without_waiting():
+    from backend.solver import race_solvers
+
+    calls: list = []
+    specs = [(5.0, False, "slow"), (0.05, True, "fast-proof"), (5.0, False, "slower")]
+
+    start = time.monotonic()
+    first, results, solvers = race_solvers(
+        lambda idx: _fake_solver(*specs[idx], calls), "P", 3
+    )
+    assert first == (True, "fast-proof")
+    assert len(solvers) == 3
+    assert time.monotonic() - start < 2.0
+
+
+def test_race_solvers_staggered_launches_extra_pairs_only_after_threshold():
+    from backend.solver import race_solvers
+
+    calls: list = []
+    first, _results, solvers = race_solvers(
+        lambda idx: _fake_solver(0.01, True, f"proof-{idx}", calls),
+        "P",
+        3,
+        stagger_seconds=1.0,
+    )
+    assert first == (True, "proof-0")
+    assert len(solvers) == 1
+
+    calls.clear()
+    specs = [(0.3, False, "a"), (0.3, False, "b"), (0.01, True, "c")]
+    first, results, solvers = race_solvers(
+        lambda idx: _fake_solver(*specs[idx], calls), "P", 3, stagger_seconds=0.05
+    )
+    assert first == (True, "c")
+    assert len(solvers) == 3
+
+
+def test_race_solvers_stops_when_caller_cancels():
+    from backend.solver import race_solvers
+
+    calls: list = []
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+    start = time.monotonic()
+    first, _results, solvers = race_solvers(
+        lambda idx: _fake_solver(5.0, True, f"proof-{idx}", calls), "P", 2, cancel_event=cancel
+    )
+    assert first is None
+    assert len(solvers) == 2
+    assert time.monotonic() - start < 2.0
+
+
+def test_final_judge_tournament_runs_log_rounds(monkeypatch):
+    from backend.judge import FinalJudge
+
+    calls = []
+
+    def fake_select(self, problem, proofs, **kwargs):
+        calls.append(tuple(proofs))
+        return 0 if len(proofs[0]) >= len(proofs[1]) else 1
+
+    monkeypatch.setattr(FinalJudge, "select", fake_select)
+    proofs = ["a" * n for n in (3, 9, 1, 4, 7)]
+    idx = FinalJudge(model="m").tournament("P", proofs)
+    assert idx == 1
+    # 5 proofs -> 2 + 1 + 1 pairwise matches over 3 rounds
+    assert len(calls) == 4
+    assert all(len(c) == 2 for c in calls)
+
+
+def test_select_best_failure_returns_attempt_and_first_flaw(monkeypatch):
+    from backend.judge import FinalJudge
+    from backend.solver import select_best_failure
+
+    monkeypatch.setattr(FinalJudge, "select", lambda self, problem, proofs, **k: 1)
+    solvers = [
+        types.SimpleNamespace(last_proof="proof A", last_feedback="flaw A", judge_model="m"),
+        types.SimpleNamespace(last_proof="proof B", last_feedback="flaw B", judge_model="m"),
+    ]
+    ok, payload = select_best_failure("P", solvers, [(False, "flaw A"), (False, "flaw B")])
+    assert not ok
+    assert "proof B" in payload and "flaw B" in payload
+    assert "proof A" not in payload
+
+
+def test_solver_stagnation_restarts_escalates_then_abandons(monkeypatch):
+    import backend.solver as solver_mod
+
+    calls = []
+
+    class FakeProver(solver_mod.Prover):
+        def prove(self, problem, **kwargs):
+            calls.append(("prove", self.reasoning_effort))
+            return types.SimpleNamespace(proof_markdown="Assume x. Then x is even, hence done.")
+
+        def reprove(self, problem, proof, feedback, **kwargs):
+            calls.append(("reprove", self.reasoning_effort))
+            return types.SimpleNamespace(proof_markdown="Assume x. Then x is even, hence done.")
+
+    class FakeJudge(solver_mod.Judge):
+        def assess(self, problem, proof, **kwargs):
+            return types.SimpleNamespace(
+                correctness=False, feedback="The step claiming x is even is unjustified."
+            )
+
+    monkeypatch.setattr(solver_mod, "Prover", FakeProver)
+    monkeypatch.setattr(solver_mod, "Judge", FakeJudge)
+
+    events = []
+    s = solver_mod.Solver(model="m", reasoning_effort="medium")
+    ok, payload = s.solve("P", 20, on_event=events.append)
+
+    assert not ok
+    assert "unjustified" in payload
+    actions = [e["action"] for e in events if e["event"] == "stagnation"]
+    assert actions == ["restart", "escalate", "abandon"]
+    assert ("prove", "medium") in calls[1:]
+    assert calls[-1][1] == "high"
+    assert len(calls) < 20
+
+    # Reusing the solver for another problem does not report this attempt
+    assert s.solve("Q", 5, iteration_gate=lambda i: False) == (False, "No correct proof found within allotted attempts.")
+    assert s.last_proof == "" and s.last_feedback == ""
+
+
+def test_solver_escalates_prover_effort_on_rejection_and_records_it(monkeypatch):
+    import backend.solver as solver_mod
+    from backend.effort import EffortPolicy
+
+    seen = []
+
+    class FakeProver(solver_mod.Prover):
+        def prove(self, problem, **kwargs):
+            seen.append(self.reasoning_effort)
+            return types.SimpleNamespace(proof_markdown="first draft")
+
+        def reprove(self, problem, proof, feedback, **kwargs):
+            seen.append(self.reasoning_effort)
+            return types.SimpleNamespace(proof_markdown="a completely rewritten argument")
+
+    verdicts = iter([False, True, True])
+
+    class FakeJudge(solver_mod.Judge):
+        def assess(self, problem, proof, **kwargs):
+            return types.SimpleNamespace(correctness=next(verdicts), feedback="gap in step 2")
+
+    monkeypatch.setattr(solver_mod, "Prover", FakeProver)
+    monkeypatch.setattr(solver_mod, "Judge", FakeJudge)
+
+    s = solver_mod.Solver(
+        model="m",
+        prover_effort=EffortPolicy(start="low"),
+        judge_effort=EffortPolicy(start="medium"),
+    )
+    ok, _ = s.solve("P", 5)
+    assert ok
+    assert seen == ["low", "medium"]
+    assert s.accepted_effort == {"prover": "medium", "judge1": "medium", "judge2": "high"}
+
+
+def test_solver_prover_ignores_rejection_unless_configured(monkeypatch):
+    import backend.solver as solver_mod
+    from backend.effort import EffortPolicy
+    from backend.research import ResearchConfig
+
+    seen = []
+
+    class FakeProver(solver_mod.Prover):
+        def prove(self, problem, **kwargs):
+            seen.append(self.reasoning_effort)
+            return types.SimpleNamespace(proof_markdown="draft")
+
+        def reprove(self, problem, proof, feedback, **kwargs):
+            seen.append(self.reasoning_effort)
+            return types.SimpleNamespace(proof_markdown=f"rewrite number {len(seen)} with a new idea")
+
+    verdicts = iter([False, True, True])
+
+    class FakeJudge(solver_mod.Judge):
+        def assess(self, problem, proof, **kwargs):
+            return types.SimpleNamespace(correctness=next(verdicts), feedback="gap in step 2")
+
+    monkeypatch.setattr(solver_mod, "Prover", FakeProver)
+    monkeypatch.setattr(solver_mod, "Judge", FakeJudge)
+
+    policy = ResearchConfig().prover_effort
+    assert "rejection" not in policy.escalate_on
+    s = solver_mod.Solver(model="m", prover_effort=policy, judge_effort=EffortPolicy(start="medium"))
+    assert s.solve("P", 5)[0]
+    assert seen == ["medium", "medium"]
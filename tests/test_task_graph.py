@@ -0,0 +1,45 @@
+import time
+
+
+def test_items_flow_downstream_without_stage_barrier():
+    from backend.task_graph import Stage, TaskGraph
+
+    order = []
+
+    def check(x):
+        time.sleep(0.5 if x == "slow" else 0.01)
+        return x
+
+    def prove(x):
+        order.append(("prove", x, time.monotonic()))
+        return x.upper()
+
+    done = []
+    graph = TaskGraph(
+        [
+            Stage("check", check, workers=4, then=lambda item, res: [("prove", res)] if res != "drop" else []),
+            Stage("prove", prove, workers=2, then=lambda item, res: done.append(res) or []),
+        ]
+    )
+    start = time.monotonic()
+    graph.run([("check", x) for x in ["slow", "a", "drop", "b"]])
+
+    assert sorted(done) == ["A", "B", "SLOW"]
+    # Fast items reached the prove stage long before the slow check finished
+    fast_starts = [t - start for stage, x, t in order if x in {"a", "b"}]
+    assert max(fast_starts) < 0.3
+    assert graph.completed == {"check": 4, "prove": 3}
+
+
+def test_failed_tasks_are_routed_to_on_error():
+    from backend.task_graph import Stage, TaskGraph
+
+    errors = []
+
+    def boom(x):
+        raise RuntimeError(x)
+
+    graph = TaskGraph([Stage("s", boom, on_error=lambda item, exc: errors.append(str(exc)) or [])])
+    graph.run([("s", "x")])
+    assert errors == ["x"]
+    assert graph.failed == {"s": 1}
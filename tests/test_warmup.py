@@ -0,0 +1,28 @@
+import backend.warmup as warmup
+
+
+def test_run_warmup_records_steps_and_flips_ready(monkeypatch):
+    calls = []
+
+    def _boom():
+        raise RuntimeError("no katex")
+
+    monkeypatch.setattr(warmup, "STEPS", [("modules", lambda: calls.append("modules")), ("katex", _boom)])
+    monkeypatch.setattr(warmup, "_probe_provider", lambda: calls.append("provider"))
+    state = warmup.WarmupState()
+    assert not state.snapshot()["ready"]
+
+    warmup.run_warmup(probe=True, state=state)
+
+    snapshot = state.snapshot()
+    assert snapshot["ready"]
+    assert calls == ["modules", "provider"]
+    assert set(snapshot["steps"]) == {"modules", "katex", "provider"}
+    assert snapshot["errors"] == {"katex": "RuntimeError: no katex"}
+
+
+def test_start_warmup_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("DEEPRESEARCH_WARMUP", "0")
+    state = warmup.WarmupState()
+    assert warmup.start_warmup(state) is None
+    assert state.ready
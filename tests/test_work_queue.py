@@ -0,0 +1,82 @@
+import time
+
+from backend.work_queue import DONE, FAILED, QUEUED, WorkQueue
+from backend.worker import HANDLERS, Worker, remote_solve
+
+
+def test_lease_expiry_reassigns_and_first_result_wins(tmp_path):
+    q = WorkQueue(tmp_path / "queue.db", max_attempts=3)
+    job_id = q.submit("solve", {"statement": "x"})
+    assert q.submit("solve", {"statement": "x"}) == job_id  # duplicate submission reuses the job
+
+    first = q.claim("w1", lease_seconds=0.05)
+    assert first is not None and first.attempts == 1
+    assert q.claim("w2", lease_seconds=60) is None  # still leased to w1
+    time.sleep(0.1)
+    second = q.claim("w2", lease_seconds=60)
+    assert second is not None and second.id == job_id and second.attempts == 2
+    assert not q.heartbeat(job_id, "w1")  # w1 lost its lease
+
+    assert not q.complete(job_id, "w1", {"ok": False})  # w1 no longer holds the lease
+    assert q.complete(job_id, "w2", {"ok": True})
+    assert not q.complete(job_id, "w2", {"ok": False})  # late duplicate is ignored
+    job = q.get(job_id)
+    assert job.status == DONE and job.result == {"ok": True}
+
+    # A finished job is rerun, not returned from cache, when submitted again
+    assert q.submit("solve", {"statement": "x"}) == job_id
+    job = q.get(job_id)
+    assert job.status == QUEUED and job.attempts == 0 and job.result is None
+
+
+def test_lease_expiring_on_last_attempt_fails_the_job(tmp_path):
+    q = WorkQueue(tmp_path / "queue.db", max_attempts=1)
+    job_id = q.submit("solve", {"statement": "z"})
+    assert q.claim("w1", lease_seconds=0.05) is not None
+    time.sleep(0.1)
+    assert q.claim("w2") is None
+    job = q.get(job_id)
+    assert job.status == FAILED and "Lease expired" in job.error
+
+    # Producers stop waiting when no worker picks a job up
+    assert remote_solve(q, "S", None, model="m", max_tries_per_prover=1, timeout=0)[:2] == (
+        False,
+        "Timed out waiting for a worker",
+    )
+
+
+def test_failed_attempts_retry_then_give_up(tmp_path):
+    q = WorkQueue(tmp_path / "queue.db", max_attempts=2)
+    job_id = q.submit("solve", {"statement": "y"})
+    q.claim("w1")
+    q.fail(job_id, "w1", "boom")
+    assert q.get(job_id).status == QUEUED
+    q.claim("w1")
+    q.fail(job_id, "w1", "boom again")
+    job = q.get(job_id)
+    assert job.status == FAILED and job.error == "boom again"
+    assert q.claim("w1") is None
+
+
+def test_worker_runs_jobs(tmp_path, monkeypatch):
+    monkeypatch.setitem(HANDLERS, "echo", lambda payload, _cancel: {"echo": payload["v"]})
+    q = WorkQueue(tmp_path / "queue.db")
+    ids = [q.submit("echo", {"v": i}) for i in range(3)]
+    Worker(q, concurrency=2, poll_seconds=0.01, kinds=["echo"]).run(idle_exit_seconds=0.1)
+    assert [q.get(i).result for i in ids] == [{"echo": 0}, {"echo": 1}, {"echo": 2}]
+
+
+def test_worker_that_lost_its_lease_does_not_complete(tmp_path, monkeypatch):
+    q = WorkQueue(tmp_path / "queue.db")
+
+    def _slow(payload, cancel):
+        assert cancel.wait(5)  # heartbeat notices the reassignment
+        return {"stale": True}
+
+    monkeypatch.setitem(HANDLERS, "slow", _slow)
+    job_id = q.submit("slow", {})
+    worker = Worker(q, lease_seconds=0.15, kinds=["slow"])
+    job = q.claim(worker.worker_id, kinds=["slow"], lease_seconds=0.15)
+    monkeypatch.setattr(q, "heartbeat", lambda *a, **k: False)
+    worker._execute(job)
+    assert q.get(job_id).status != DONE